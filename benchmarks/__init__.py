@@ -0,0 +1,114 @@
+"""Benchmarks over the captured pages of the pages/ directory."""
+
+import timeit
+import tracemalloc
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+from py_netgear_plus.fetcher import DEFAULT_PAGE, BaseResponse, status_code_ok
+from py_netgear_plus.models import MODELS, AutodetectedSwitchModel
+from py_netgear_plus.parsers import PageParser
+
+PAGES_PATH = Path(__file__).parent.parent / "pages"
+
+
+def iter_pages() -> Iterator[Path]:
+    """Return the paths of all captured pages."""
+    for path in sorted(PAGES_PATH.rglob("*")):
+        if path.is_file() and path.suffix != ".json":
+            yield path
+
+
+def best_time(
+    func: Callable[[], object], number: int | None = None, repeat: int = 5
+) -> float:
+    """Return the best time of a single call of func in seconds."""
+    timer = timeit.Timer(func)
+    if number is None:
+        number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def time_samples(
+    func: Callable[[], object], repeat: int = 15, sample_time: float = 0.02
+) -> list[float]:
+    """Return repeat samples of the time of a single call of func in seconds."""
+    timer = timeit.Timer(func)
+    number = max(1, int(sample_time / timer.timeit(number=1)))
+    return [time / number for time in timer.repeat(repeat=repeat, number=number)]
+
+
+def measure_peak(func: Callable[[], object]) -> int:
+    """Return the peak of the bytes allocated by a call of func."""
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - start
+
+
+def get_page_path(
+    switch_model: type[AutodetectedSwitchModel], sequence: int, templates: list
+) -> Path | None:
+    """Return the captured page of the first template that has one."""
+    for template in templates:
+        page_name = template["url"].split("/")[-1] or DEFAULT_PAGE
+        path = PAGES_PATH / switch_model.MODEL_NAME / str(sequence) / page_name
+        if path.exists():
+            return path
+    return None
+
+
+def load_page(path: Path) -> BaseResponse:
+    """Return a captured page as a response of the switch."""
+    response = BaseResponse()
+    response.status_code = status_code_ok
+    response.content = path.read_bytes()
+    return response
+
+
+def iter_models() -> Iterator[type[AutodetectedSwitchModel]]:
+    """Return the models with captured pages."""
+    for switch_model in MODELS:
+        if (PAGES_PATH / switch_model.MODEL_NAME / "0").is_dir():
+            yield switch_model
+
+
+def load_poll_pages(
+    switch_model: type[AutodetectedSwitchModel], sequence: int
+) -> dict[str, BaseResponse]:
+    """Return the captured pages of a poll, keyed by page kind."""
+    templates_by_kind = {
+        "switch_info": switch_model.SWITCH_INFO_TEMPLATES,
+        "port_status": switch_model.PORT_STATUS_TEMPLATES,
+        "port_statistics": switch_model.PORT_STATISTICS_TEMPLATES,
+        "poe_port_config": switch_model.POE_PORT_CONFIG_TEMPLATES,
+        "poe_port_status": switch_model.POE_PORT_STATUS_TEMPLATES,
+    }
+    pages = {}
+    for kind, templates in templates_by_kind.items():
+        path = get_page_path(switch_model, sequence, templates)
+        if path is not None:
+            pages[kind] = load_page(path)
+    return pages
+
+
+def parse_poll_pages(
+    switch_model: type[AutodetectedSwitchModel],
+    parser: PageParser,
+    pages: dict[str, BaseResponse],
+) -> None:
+    """Parse the pages of a poll like NetgearSwitchConnector.get_switch_infos()."""
+    ports = switch_model.PORTS
+    parser.parse_client_hash(pages["switch_info"])
+    if switch_model.SWITCH_LED_TEMPLATES:
+        parser.parse_led_status(pages["switch_info"])
+    parser.parse_switch_metadata(pages["switch_info"])
+    parser.parse_port_status(pages["port_status"], ports)
+    parser.parse_port_statistics(pages["port_statistics"], ports)
+    if switch_model.SUPPORTED and switch_model.POE_PORTS:
+        parser.parse_poe_port_config(pages["poe_port_config"])
+        parser.parse_poe_port_status(pages["poe_port_status"])
@@ -0,0 +1,105 @@
+"""
+Benchmark the batch decoding of port statistics counters.
+
+Run with: python -m benchmarks.bench_counters
+
+Extracts the counter strings of the captured port statistics pages of the
+GS105Ev2 (int32 turnover and current value), GS308EP (two int32 halves) and
+GS316EPP (plain counters), then times converting them to ints port by port,
+as the parsers did before, against the batch decoder. The x64 rows repeat
+the counters of a page 64 times.
+"""
+
+import sys
+from collections.abc import Callable
+
+from py_netgear_plus import counters, parsers
+from py_netgear_plus.extraction import compile_spec
+from py_netgear_plus.models import GS308EP, GS316EPP, GS105Ev2
+
+from . import best_time, load_poll_pages
+
+PAIRED_COUNTERS = {
+    "GS105Ev2": [
+        (f"{name}_turnover", f"{name}_current") for name in ("rx", "tx", "crc")
+    ],
+    "GS308EP": [(f"input_{index}", f"input_{index + 1}") for index in (0, 2, 4)],
+}
+
+
+def convert_per_port(value: str | None) -> int:
+    """Convert one counter like the parsers did before the batch decoder."""
+    try:
+        return int(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return 0
+
+
+def get_decoders(
+    model_name: str, columns: dict[str, list]
+) -> dict[str, Callable[[], list]]:
+    """Return the per-port and batch decoders of the counter columns of a page."""
+    if model_name in PAIRED_COUNTERS:
+        pairs = [
+            (columns[high], columns[low]) for high, low in PAIRED_COUNTERS[model_name]
+        ]
+        return {
+            "per port": lambda: [
+                [
+                    parsers.convert_gs105_to_int(
+                        convert_per_port(high_value), convert_per_port(low_value)
+                    )
+                    for high_value, low_value in zip(high, low, strict=True)
+                ]
+                for high, low in pairs
+            ],
+            "batch": lambda: [
+                counters.combine_counters(
+                    counters.decode_counters(high),
+                    counters.decode_counters(low),
+                )
+                for high, low in pairs
+            ],
+        }
+
+    plain = [columns[name] for name in ("rx", "tx", "crc")]
+    return {
+        "per port": lambda: [
+            [convert_per_port(value) for value in column] for column in plain
+        ],
+        "batch": lambda: [counters.decode_counters(column) for column in plain],
+    }
+
+
+def main() -> int:
+    """Run the benchmark for the models with the three kinds of counters."""
+    backends = ["per port", "batch"]
+    header = f"{'page':<14} {'counters':>8}" + "".join(f" {b:>10}" for b in backends)
+    print(header)  # noqa: T201
+    for switch_model in (GS105Ev2, GS308EP, GS316EPP):
+        parser = parsers.create_page_parser(switch_model.MODEL_NAME)
+        page = load_poll_pages(switch_model, 0)["port_statistics"]
+        columns = compile_spec(parser.PORT_STATISTICS_SPEC).extract(page)
+        columns = {
+            name: [value for value in values if value is not None] or values
+            for name, values in columns.items()
+        }
+        for repeat in (1, 64):
+            repeated = {name: values * repeat for name, values in columns.items()}
+            decoders = get_decoders(switch_model.MODEL_NAME, repeated)
+            results = [decoder() for decoder in decoders.values()]
+            if any(result != results[0] for result in results):
+                print(f"{switch_model.MODEL_NAME}: decoders disagree")  # noqa: T201
+                return 1
+            times = [best_time(decoder) for decoder in decoders.values()]
+            count = sum(len(column) for column in results[0])
+            label = f"{switch_model.MODEL_NAME} x{repeat}"
+            print(  # noqa: T201
+                f"{label:<14} {count:>8}"
+                + "".join(f" {time * 1e6:8.1f}us" for time in times)
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Benchmark the import time of the library and the CLI.
+
+Run with: python -m benchmarks.bench_import [--repeat N]
+
+Imports every module in a new interpreter with python -X importtime and
+reports the min and median of its cumulative import time, then times
+`ngp-cli version` end to end, less the startup of a bare interpreter.
+Fails if a median exceeds its budget, or if importing the package or the
+CLI loads a module that is only imported on first use of a connector.
+
+The budgets leave room for slower machines. A lazy module showing up in
+an import is a regression on any machine.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from typing import NamedTuple
+
+# modules loaded on first use of a connector
+LAZY_MODULES = (
+    "requests",
+    "lxml",
+    "py_netgear_plus.connector",
+    "py_netgear_plus.fetcher",
+    "py_netgear_plus.models",
+    "py_netgear_plus.parsers",
+)
+
+
+class ImportBudget(NamedTuple):
+    """Import of a module, its budget and whether it must stay lazy."""
+
+    module: str
+    budget_ms: float
+    lazy: bool
+
+
+IMPORT_BUDGETS = (
+    ImportBudget("py_netgear_plus", budget_ms=5, lazy=True),
+    ImportBudget("py_netgear_plus.ngp_cli", budget_ms=40, lazy=True),
+    ImportBudget("py_netgear_plus.connector", budget_ms=400, lazy=False),
+)
+CLI_VERSION_BUDGET_MS = 50
+
+
+def import_module(module: str) -> tuple[float, list[str]]:
+    """Return the import time of module in ms and the lazy modules it loaded."""
+    code = (
+        f"import {module}; import json, sys; print(json.dumps(sorted("
+        f"name for name in sys.modules if name.startswith({LAZY_MODULES!r}))))"
+    )
+    process = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    # import time: self [us] | cumulative | imported package
+    for line in process.stderr.splitlines():
+        columns = line.split("|")
+        if columns[-1].strip() == module:
+            return int(columns[1]) / 1000, json.loads(process.stdout)
+    message = f"No import time of {module}"
+    raise ValueError(message)
+
+
+def run_time(*args: str) -> float:
+    """Return the wall time of running the interpreter with args in ms."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, *args], capture_output=True, check=True)  # noqa: S603
+    return (time.perf_counter() - start) * 1000
+
+
+def get_arguments() -> argparse.Namespace:
+    """Return the command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.bench_import",
+        description="Benchmark the import time of the library and the CLI.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=9,
+        help="new interpreters per measurement (default: %(default)s)",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run the benchmark, return 1 if an import is over budget or not lazy."""
+    args = get_arguments()
+    print(  # noqa: T201
+        f"{'import':<28} {'min':>9} {'median':>9} {'budget':>9}"
+    )
+    failures = []
+    for module, budget_ms, lazy in IMPORT_BUDGETS:
+        results = [import_module(module) for _ in range(args.repeat)]
+        times = [import_time for import_time, _ in results]
+        median = statistics.median(times)
+        print(  # noqa: T201
+            f"{module:<28} {min(times):7.1f}ms {median:7.1f}ms {budget_ms:7.1f}ms"
+        )
+        if median > budget_ms:
+            failures.append(f"{module}: median {median:.1f}ms over budget")
+        loaded = results[0][1]
+        if lazy and loaded:
+            failures.append(f"{module}: imports {', '.join(loaded)}")
+
+    overheads = [
+        run_time("-m", "py_netgear_plus.ngp_cli", "version") - run_time("-c", "pass")
+        for _ in range(args.repeat)
+    ]
+    median = statistics.median(overheads)
+    print(  # noqa: T201
+        f"{'ngp-cli version':<28} {min(overheads):7.1f}ms {median:7.1f}ms"
+        f" {CLI_VERSION_BUDGET_MS:7.1f}ms"
+    )
+    if median > CLI_VERSION_BUDGET_MS:
+        failures.append(f"ngp-cli version: median {median:.1f}ms over budget")
+
+    for failure in failures:
+        print(f"FAILED {failure}")  # noqa: T201
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+"""
+Benchmark the session-expiry check of PageFetcher.
+
+Run with: python -m benchmarks.bench_is_authenticated
+
+Compares the byte-level pre-check of _is_authenticated() with the html tree
+check for every captured page and fails if their verdicts differ.
+"""
+
+import sys
+
+from py_netgear_plus.fetcher import BaseResponse, PageFetcher, status_code_ok
+
+from . import best_time, iter_pages
+
+
+def main() -> int:
+    """Run the benchmark, return 1 if a verdict differs from the tree check."""
+    fetcher = PageFetcher("192.168.0.1")
+    responses = []
+    for path in iter_pages():
+        response = BaseResponse()
+        response.status_code = status_code_ok
+        response.content = path.read_bytes()
+        responses.append((path, response))
+
+    mismatches = 0
+    for path, response in responses:
+        if fetcher._is_authenticated(response) != fetcher._is_authenticated_tree(  # noqa: SLF001
+            response
+        ):
+            print(f"verdict differs for {path}")  # noqa: T201
+            mismatches += 1
+
+    def run_precheck() -> None:
+        for _, response in responses:
+            fetcher._is_authenticated(response)  # noqa: SLF001
+
+    def run_tree_check() -> None:
+        for _, response in responses:
+            # drop the cached tree, every response is parsed once per poll
+            response.content = response.content
+            fetcher._is_authenticated_tree(response)  # noqa: SLF001
+
+    precheck_time = best_time(run_precheck, number=20)
+    tree_time = best_time(run_tree_check, number=20)
+    print(f"pages: {len(responses)}, verdict mismatches: {mismatches}")  # noqa: T201
+    print(f"byte pre-check: {precheck_time * 1e3:8.3f} ms")  # noqa: T201
+    print(f"html tree check: {tree_time * 1e3:8.3f} ms")  # noqa: T201
+    print(f"speedup: {tree_time / precheck_time:.1f}x")  # noqa: T201
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
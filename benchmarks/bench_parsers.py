@@ -0,0 +1,269 @@
+"""
+Benchmark the page parsers over all captured pages.
+
+Run with: python -m benchmarks.bench_parsers [--save FILE] [--compare FILE]
+
+Times every PageParser method of a poll, the session-expiry check of every
+page and the autodetect checks of the login page, for every model with
+captured pages. A method runs on both captured page sets with the html
+trees parsed up front; parsing the html of the pages is timed as "html".
+Reports the min, median and 90th percentile of the time per page set and
+the peak of the memory allocated by one run over both page sets.
+
+--save writes the results to a baseline file. --compare reads a baseline
+and fails if the median time of a method grew by more than --tolerance or
+its peak allocation by more than --alloc-tolerance. Baselines are only
+comparable on the machine and python version they were saved with.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from py_netgear_plus import NetgearSwitchConnector
+from py_netgear_plus.fetcher import BaseResponse, PageFetcher
+from py_netgear_plus.models import AutodetectedSwitchModel, get_model
+from py_netgear_plus.parsers import NetgearPlusPageParserError, create_page_parser
+
+from . import (
+    PAGES_PATH,
+    get_page_path,
+    load_page,
+    load_poll_pages,
+    measure_peak,
+    time_samples,
+)
+
+SEQUENCES = (0, 1)
+# parser methods of a poll and the kind of page they parse
+PARSER_METHODS = (
+    ("parse_client_hash", "switch_info"),
+    ("parse_led_status", "switch_info"),
+    ("parse_switch_metadata", "switch_info"),
+    ("parse_port_status", "port_status"),
+    ("parse_port_statistics", "port_statistics"),
+    ("parse_poe_port_config", "poe_port_config"),
+    ("parse_poe_port_status", "poe_port_status"),
+)
+PORTS_METHODS = ("parse_port_status", "parse_port_statistics")
+# errors of incomplete page sets, the method is skipped
+SKIPPED_ERRORS = (
+    AttributeError,
+    IndexError,
+    KeyError,
+    ValueError,
+    NetgearPlusPageParserError,
+)
+
+
+class Result(NamedTuple):
+    """Time of a method per page set and its peak allocation."""
+
+    min_us: float
+    median_us: float
+    p90_us: float
+    peak_bytes: int
+
+
+def measure(func: Callable[[], object], runs: int, repeat: int) -> Result:
+    """Return the result of func running the method on runs page sets."""
+    samples = sorted(sample / runs * 1e6 for sample in time_samples(func, repeat))
+    return Result(
+        min_us=samples[0],
+        median_us=statistics.median(samples),
+        p90_us=statistics.quantiles(samples, n=10)[-1],
+        peak_bytes=measure_peak(func),
+    )
+
+
+def get_page_sets(model_path: Path) -> list[list[BaseResponse]]:
+    """Return all captured pages of a model, one list per page set."""
+    return [
+        [load_page(path) for path in sorted(sequence_path.iterdir())]
+        for sequence_path in sorted(model_path.iterdir())
+        if sequence_path.is_dir()
+    ]
+
+
+def iter_parser_cases(
+    switch_model: type[AutodetectedSwitchModel],
+) -> Iterator[tuple[str, Callable[[], object], int]]:
+    """Return the name, run function and page sets of the methods of a model."""
+    parser = create_page_parser(switch_model.MODEL_NAME)
+    polls = [load_poll_pages(switch_model, sequence) for sequence in SEQUENCES]
+    polls = [pages for pages in polls if pages]
+    for pages in polls:
+        for page in pages.values():
+            page.tree  # noqa: B018
+    for method_name, kind in PARSER_METHODS:
+        if method_name == "parse_led_status" and not switch_model.SWITCH_LED_TEMPLATES:
+            continue
+        if kind.startswith("poe") and not (
+            switch_model.SUPPORTED and switch_model.POE_PORTS
+        ):
+            continue
+        if not all(kind in pages for pages in polls):
+            continue
+        method = getattr(parser, method_name)
+        args = (switch_model.PORTS,) if method_name in PORTS_METHODS else ()
+        page_list = [pages[kind] for pages in polls]
+
+        def run(method: Callable = method, page_list: list = page_list) -> None:
+            for page in page_list:
+                method(page, *args)  # noqa: B023
+
+        yield method_name.removeprefix("parse_"), run, len(page_list)
+
+    login_pages = [
+        load_page(path)
+        for sequence in SEQUENCES
+        if (
+            path := get_page_path(
+                switch_model, sequence, switch_model.AUTODETECT_TEMPLATES
+            )
+        )
+    ]
+    if login_pages:
+        connector = NetgearSwitchConnector(host="192.168.0.1", password="password")  # noqa: S106
+
+        def autodetect() -> None:
+            for page in login_pages:
+                connector._detect_model(page)  # noqa: SLF001
+
+        yield "autodetect", autodetect, len(login_pages)
+
+
+def iter_cases() -> Iterator[tuple[str, Callable[[], object], int]]:
+    """Return the name, run function and page sets of all benchmarked methods."""
+    fetcher = PageFetcher("192.168.0.1")
+    for model_path in sorted(PAGES_PATH.iterdir()):
+        if not model_path.is_dir():
+            continue
+        model_name = model_path.name
+        page_sets = get_page_sets(model_path)
+        contents = [[page.content for page in pages] for pages in page_sets]
+
+        def parse_html(contents: list = contents) -> None:
+            for page_contents in contents:
+                for content in page_contents:
+                    page = BaseResponse()
+                    page.content = content
+                    page.tree  # noqa: B018
+
+        def is_authenticated(page_sets: list = page_sets) -> None:
+            for pages in page_sets:
+                for page in pages:
+                    fetcher._is_authenticated(page)  # noqa: SLF001
+
+        yield f"{model_name}/html", parse_html, len(page_sets)
+        yield f"{model_name}/is_authenticated", is_authenticated, len(page_sets)
+
+        switch_model = get_model(model_name)
+        if switch_model is not None:
+            for name, run, runs in iter_parser_cases(switch_model):
+                yield f"{model_name}/{name}", run, runs
+
+
+def compare(
+    results: dict[str, Result],
+    baseline: dict[str, Any],
+    tolerance: float,
+    alloc_tolerance: float,
+) -> list[str]:
+    """Return the regressions of results compared to a baseline."""
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline["results"]:
+            continue
+        base = Result(**baseline["results"][name])
+        if result.median_us > base.median_us * tolerance:
+            regressions.append(
+                f"{name}: median {result.median_us:.1f}us,"
+                f" baseline {base.median_us:.1f}us"
+            )
+        if result.peak_bytes > base.peak_bytes * alloc_tolerance:
+            regressions.append(
+                f"{name}: peak {result.peak_bytes}B, baseline {base.peak_bytes}B"
+            )
+    return regressions
+
+
+def get_arguments() -> argparse.Namespace:
+    """Return the command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.bench_parsers",
+        description="Benchmark the page parsers over all captured pages.",
+    )
+    parser.add_argument("--save", type=Path, help="save results as baseline")
+    parser.add_argument("--compare", type=Path, help="compare with baseline")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=1.25,
+        help="max ratio of median time to baseline (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--alloc-tolerance",
+        type=float,
+        default=1.1,
+        help="max ratio of peak allocation to baseline (default: %(default)s)",
+    )
+    parser.add_argument("--filter", default="", help="only methods containing text")
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=15,
+        help="timed samples per method (default: %(default)s)",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run the benchmark, return 1 if a method regressed against the baseline."""
+    args = get_arguments()
+    print(  # noqa: T201
+        f"{'method':<34} {'min':>9} {'median':>9} {'p90':>9} {'peak':>9}"
+    )
+    results = {}
+    for name, run, runs in iter_cases():
+        if args.filter not in name:
+            continue
+        try:
+            run()
+        except SKIPPED_ERRORS as error:
+            print(f"{name:<34} skipped, {type(error).__name__}")  # noqa: T201
+            continue
+        result = measure(run, runs, args.repeat)
+        results[name] = result
+        print(  # noqa: T201
+            f"{name:<34} {result.min_us:7.1f}us {result.median_us:7.1f}us"
+            f" {result.p90_us:7.1f}us {result.peak_bytes / 1024:6.1f}KiB"
+        )
+
+    if args.save:
+        baseline = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": {name: result._asdict() for name, result in results.items()},
+        }
+        args.save.write_text(json.dumps(baseline, indent=2) + "\n")
+        print(f"Saved baseline of {len(results)} methods to {args.save}")  # noqa: T201
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare(results, baseline, args.tolerance, args.alloc_tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")  # noqa: T201
+        if regressions:
+            return 1
+        print(f"No regressions against {args.compare}")  # noqa: T201
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""
+Benchmark the poll results of SwitchSnapshot against the flat dict.
+
+Run with: python -m benchmarks.bench_snapshot
+
+Polls the captured pages of a model through NetgearSwitchConnector, once
+with get_switch_snapshot() and once with get_switch_infos(), which converts
+the snapshot to the flat dict. Pages are loaded up front and parsed pages
+are cached as in a real poll, so the time is spent on the port statistics
+and the result. Memory is the size of the result, its containers and values,
+and the peak allocated during the poll, measured with tracemalloc.
+"""
+
+import sys
+from unittest.mock import patch
+
+from py_netgear_plus import NetgearSwitchConnector
+from py_netgear_plus.models import GS308EP, GS316EPP, JGS524Ev2
+from py_netgear_plus.parsers import create_page_parser
+from py_netgear_plus.snapshot import SwitchSnapshot
+
+from . import best_time, load_poll_pages, measure_peak
+
+
+def get_dict_size(values: dict, skip_keys: dict | None = None) -> int:
+    """Return the bytes of a dict with its keys and values."""
+    return sys.getsizeof(values) + sum(
+        sys.getsizeof(key) + sys.getsizeof(value)
+        for key, value in values.items()
+        if skip_keys is None or key not in skip_keys
+    )
+
+
+def get_result_size(result: SwitchSnapshot | dict, metadata: dict) -> int:
+    """Return the bytes of a poll result, not counting the shared metadata."""
+    if isinstance(result, dict):
+        return get_dict_size(result, skip_keys=metadata)
+    return (
+        sys.getsizeof(result)
+        + get_dict_size(result.poe)
+        + sum(
+            sys.getsizeof(getattr(result, name))
+            for name in SwitchSnapshot.__slots__
+            if name not in ("metadata", "poe")
+        )
+    )
+
+
+def main() -> int:
+    """Run the benchmark for a small, a PoE and a 24-port switch."""
+    print(  # noqa: T201
+        f"{'model':<10} {'result':<9} {'time':>10} {'size':>9} {'peak':>9}"
+    )
+    for switch_model in (GS308EP, GS316EPP, JGS524Ev2):
+        pages = load_poll_pages(switch_model, 0)
+        pages_by_templates = {
+            id(switch_model.SWITCH_INFO_TEMPLATES): pages["switch_info"],
+            id(switch_model.PORT_STATUS_TEMPLATES): pages["port_status"],
+            id(switch_model.PORT_STATISTICS_TEMPLATES): pages["port_statistics"],
+            id(switch_model.POE_PORT_CONFIG_TEMPLATES): pages.get("poe_port_config"),
+            id(switch_model.POE_PORT_STATUS_TEMPLATES): pages.get("poe_port_status"),
+        }
+        connector = NetgearSwitchConnector(host="192.168.0.1", password="password")  # noqa: S106
+        connector._set_instance_attributes_by_model(switch_model)  # noqa: SLF001
+        connector._page_parser = create_page_parser(switch_model.MODEL_NAME)  # noqa: SLF001
+        with patch.object(
+            connector,
+            "fetch_page_from_templates",
+            side_effect=lambda templates: pages_by_templates[id(templates)],  # noqa: B023
+        ):
+            for name, poll in (
+                ("snapshot", connector.get_switch_snapshot),
+                ("dict", connector.get_switch_infos),
+            ):
+                result = poll()
+                size = get_result_size(
+                    result,
+                    connector._loaded_switch_metadata,  # noqa: SLF001
+                )
+                print(  # noqa: T201
+                    f"{switch_model.MODEL_NAME:<10} {name:<9}"
+                    f" {best_time(poll) * 1e6:8.1f}us {size:8d}B"
+                    f" {measure_peak(poll):8d}B"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""
+Benchmark the precompiled xpaths of the page parsers.
+
+Run with: python -m benchmarks.bench_xpath
+
+Parses the captured pages of a poll for every model, once with the xpaths
+compiled on first use and once compiling every xpath on each evaluation,
+as the parsers did before. The html trees are parsed up front, so only the
+extraction is timed.
+"""
+
+import sys
+from typing import Any
+
+from lxml import html
+
+from py_netgear_plus import parsers
+
+from . import best_time, iter_models, load_poll_pages, parse_poll_pages
+
+
+def get_all_uncompiled(element: html.HtmlElement, xpath: str, **variables: str) -> Any:
+    """Evaluate an xpath without reusing a compiled expression."""
+    return element.xpath(xpath, **variables)
+
+
+def main() -> int:
+    """Run the benchmark for all models with captured pages."""
+    print(f"{'model':<10} {'uncompiled':>12} {'compiled':>12} {'speedup':>8}")  # noqa: T201
+    total_uncompiled = total_compiled = 0.0
+    for switch_model in iter_models():
+        parser = parsers.create_page_parser(switch_model.MODEL_NAME)
+        polls = [load_poll_pages(switch_model, sequence) for sequence in (0, 1)]
+        for pages in polls:
+            for page in pages.values():
+                page.tree  # noqa: B018
+
+        def run(parser: parsers.PageParser = parser, polls: list = polls) -> None:
+            for pages in polls:
+                parse_poll_pages(switch_model, parser, pages)  # noqa: B023
+
+        try:
+            run()
+        except (KeyError, IndexError, parsers.NetgearPlusPageParserError):
+            print(f"{switch_model.MODEL_NAME:<10} skipped, incomplete pages")  # noqa: T201
+            continue
+        compiled_time = best_time(run)
+        get_all = parsers.get_all
+        parsers.get_all = get_all_uncompiled
+        try:
+            uncompiled_time = best_time(run)
+        finally:
+            parsers.get_all = get_all
+        total_uncompiled += uncompiled_time
+        total_compiled += compiled_time
+        print(  # noqa: T201
+            f"{switch_model.MODEL_NAME:<10} {uncompiled_time / 2 * 1e6:10.1f}us"
+            f" {compiled_time / 2 * 1e6:10.1f}us"
+            f" {uncompiled_time / compiled_time:7.2f}x"
+        )
+    print(  # noqa: T201
+        f"{'per poll':<10} {total_uncompiled / 2 * 1e6:10.1f}us"
+        f" {total_compiled / 2 * 1e6:10.1f}us"
+        f" {total_uncompiled / total_compiled:7.2f}x"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,447 @@
+"""Netgear API for asyncio."""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Iterable
+from contextlib import aclosing, suppress
+from pathlib import Path
+from typing import Any
+
+from .async_fetcher import AsyncPageFetcher
+from .connector import (
+    SWITCH_STATES,
+    BaseSwitchConnector,
+    InvalidPoEPortError,
+    InvalidSwitchStateError,
+)
+from .fetcher import (
+    BaseResponse,
+    LoginFailedError,
+    NotLoggedInError,
+    PageFetcherConnectionError,
+    PageNotLoadedError,
+    Response,
+    status_code_no_response,
+    status_code_not_found,
+    status_code_unauthorized,
+)
+from .models import AutodetectedSwitchModel, SwitchModelNotDetectedError
+from .snapshot import PORT_STATISTICS, SwitchSnapshot, get_poll_kinds
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AsyncNetgearSwitchConnector(BaseSwitchConnector):
+    """Representation of a Netgear Switch for asyncio applications."""
+
+    _page_fetcher: AsyncPageFetcher
+
+    def _create_page_fetcher(
+        self, pool_maxsize: int, pool_idle_timeout: float
+    ) -> AsyncPageFetcher:
+        """Return the page fetcher of the connector."""
+        return AsyncPageFetcher(
+            self.host, pool_maxsize=pool_maxsize, pool_idle_timeout=pool_idle_timeout
+        )
+
+    def _create_login_lock(self) -> asyncio.Lock:
+        """Return the lock serializing logins of concurrent requests."""
+        return asyncio.Lock()
+
+    async def close(self) -> None:
+        """Close pooled connections to the switch."""
+        await self._page_fetcher.close()
+
+    async def autodetect_model(self) -> type[AutodetectedSwitchModel]:
+        """Detect switch model from login page contents."""
+        _LOGGER.debug(
+            "[AsyncNetgearSwitchConnector.autodetect_model] called for IP=%s",
+            self.host,
+        )
+        if self._load_cached_model():
+            return self.switch_model
+        templates = AutodetectedSwitchModel.AUTODETECT_TEMPLATES
+        async with aclosing(self._probe_autodetect_templates(templates)) as responses:
+            async for response in responses:
+                switch_model = self._detect_model(response)
+                if switch_model:
+                    self._save_cached_model()
+                    return switch_model
+        raise SwitchModelNotDetectedError
+
+    async def _probe_autodetect_template(
+        self, template: dict[str, str]
+    ) -> BaseResponse | None:
+        """Return the login page of an autodetect template, None if not loaded."""
+        response = None
+        url = template["url"].format(ip=self.host)
+        with suppress(PageFetcherConnectionError):
+            response = await self._page_fetcher.request(template["method"], url)
+        if response and self._page_fetcher.has_ok_status(response):
+            return response
+        return None
+
+    async def _probe_autodetect_templates(
+        self, templates: list[dict[str, str]]
+    ) -> AsyncIterator[BaseResponse]:
+        """
+        Yield the loaded login pages of templates.
+
+        With concurrent_autodetect all templates are requested at once and the
+        pages yielded as they arrive. Closing the iterator cancels the requests
+        still running.
+        """
+        if not self.concurrent_autodetect:
+            for template in templates:
+                response = await self._probe_autodetect_template(template)
+                if response is not None:
+                    yield response
+            return
+        tasks = [
+            asyncio.ensure_future(self._probe_autodetect_template(template))
+            for template in templates
+        ]
+        try:
+            for next_response in asyncio.as_completed(tasks):
+                response = await next_response
+                if response is not None:
+                    yield response
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def get_unique_id(self) -> str:
+        """Return unique identifier from switch model and ip address."""
+        if self.switch_model.MODEL_NAME == "":
+            await self.autodetect_model()
+        model_lower = self.switch_model.MODEL_NAME.lower()
+        return model_lower + "_" + self.host.replace(".", "_")
+
+    async def get_login_cookie(self) -> bool:
+        """Login and save returned cookie."""
+        if not self.switch_model or self.switch_model.MODEL_NAME == "":
+            await self.autodetect_model()
+        if await self._restore_session():
+            return True
+        if not self._page_fetcher.get_login_page_response():
+            await self._page_fetcher.check_login_url(self.switch_model)
+            if not self._confirm_cached_model():
+                await self.autodetect_model()
+                await self._page_fetcher.check_login_url(self.switch_model)
+        rand = self._page_parser.parse_login_form_rand(
+            self._page_fetcher.get_login_page_response()
+        )
+
+        response = await self._page_fetcher.get_login_response(
+            self.switch_model, self._password, rand
+        )
+        if not self._process_login_response(response):
+            return False
+        self._save_session()
+        return True
+
+    async def _restore_session(self) -> bool:
+        """Reuse a saved session of this host if the switch still accepts it."""
+        if not self._load_session():
+            return False
+        templates = self.switch_model.SWITCH_INFO_TEMPLATES
+        for template in self._get_ordered_templates(templates):
+            method, url, data = self._get_template_request(template)
+            try:
+                response = await self._page_fetcher.request(method, url, data)
+            except (NotLoggedInError, PageFetcherConnectionError):
+                break
+            self._record_template_response(templates, template, response)
+            if self._page_fetcher.has_ok_status(response):
+                return True
+        self._discard_session()
+        return False
+
+    async def delete_login_cookie(self) -> bool:
+        """Logout and delete cookie."""
+        if not self.switch_model or self.switch_model.MODEL_NAME == "":
+            await self.autodetect_model()
+        response = BaseResponse()
+        for template in self.switch_model.LOGOUT_TEMPLATES:
+            method, url, data = self._get_template_request(template)
+            try:
+                response = await self._page_fetcher.request(method, url, data)
+            except NotLoggedInError:
+                response.status_code = status_code_unauthorized
+                response.content = b""
+                break
+            except PageFetcherConnectionError:
+                response.status_code = status_code_no_response
+                response.content = b""
+                break
+            if response.status_code != status_code_not_found:
+                break
+
+        _LOGGER.debug(
+            "[AsyncNetgearSwitchConnector.delete_login_cookie] "
+            "logout response status code=%s",
+            response.status_code,
+        )
+        self._page_fetcher.clear_cookie()
+        self._forget_session()
+        return response.status_code != status_code_not_found
+
+    async def reboot(self) -> bool:
+        """Reboot the switch."""
+        if not self.switch_model.has_reboot_button():
+            _LOGGER.info(
+                "[AsyncNetgearSwitchConnector.reboot] Reboot button not available."
+            )
+            return False
+
+        for template in self.switch_model.SWITCH_REBOOT_TEMPLATES:
+            method, url, data = self._get_template_request(template)
+            response = await self.fetch_page(method, url, data)
+            if self._page_parser.parse_reboot_success(response):
+                # The firmware may have been updated before the reboot
+                self._reset_template_memo()
+                return True
+        return False
+
+    async def fetch_page(
+        self, method: str, url: str, data: dict
+    ) -> Response | BaseResponse:
+        """Fetch url and retry when first response is a redirect to the login page."""
+        response = BaseResponse()
+        for attempt in range(2):
+            cookie = self.get_cookie()
+            try:
+                response = await self._page_fetcher.request(method, url, data)
+                break  # Exit the loop if the request is successful
+            except NotLoggedInError as error:
+                if attempt == 0 and await self._login_again(cookie):
+                    continue  # Retry the request if login cookie is available
+                message = "Not logged in and unable to login."
+                raise LoginFailedError(message) from error
+            except PageFetcherConnectionError:
+                _LOGGER.debug(
+                    "AsyncNetgearSwitchConnector.fetch_page: "
+                    "caught PageFetcherConnectionError"
+                )
+                response.status_code = status_code_no_response
+                response.content = b""
+                break  # Stop retrying after a connection error
+        return response
+
+    async def _login_again(self, expired_cookie: tuple[str | None, str | None]) -> bool:
+        """Login after a session expired, unless a concurrent request already did."""
+        async with self._login_lock:
+            if self.get_cookie() != expired_cookie:
+                return True
+            # An expired session hints at a reboot of the switch
+            self._reset_template_memo()
+            self._forget_session()
+            return await self.get_login_cookie()
+
+    async def fetch_page_from_templates(
+        self, templates: list
+    ) -> Response | BaseResponse:
+        """Return response for 1st successful request from templates."""
+        for template in self._get_ordered_templates(templates):
+            method, url, data = self._get_template_request(template)
+            key = self._get_poll_cache_key(method, url, data)
+            cached_response = self._get_cached_page(key)
+            if cached_response is not None:
+                return cached_response
+            response = await self.fetch_page(method, url, data)
+            self._record_template_response(templates, template, response)
+            if self._page_fetcher.has_ok_status(response):
+                self._cache_page(key, response)
+                return response
+        message = f"Failed to load any page of templates: {templates}"
+        raise PageNotLoadedError(message)
+
+    async def fetch_pages_from_templates(
+        self, templates_list: list[list]
+    ) -> list[Response | BaseResponse]:
+        """Fetch one page per list of templates in parallel."""
+        semaphore = asyncio.Semaphore(max(self.switch_model.MAX_CONCURRENT_REQUESTS, 1))
+
+        async def fetch(templates: list) -> Response | BaseResponse:
+            async with semaphore:
+                return await self.fetch_page_from_templates(templates)
+
+        return list(await asyncio.gather(*(fetch(t) for t in templates_list)))
+
+    async def get_switch_infos(
+        self, fields: Iterable[str] | None = None
+    ) -> dict[str, Any]:
+        """Return dict with all available statistics, see get_switch_snapshot()."""
+        return (await self.get_switch_snapshot(fields)).to_dict()
+
+    async def get_switch_snapshot(
+        self, fields: Iterable[str] | None = None
+    ) -> SwitchSnapshot:
+        """
+        Return all available statistics as per-port columns.
+
+        fields limits the poll like NetgearSwitchConnector.get_switch_snapshot.
+        """
+        kinds = get_poll_kinds(fields)
+        self._poll_cache = {}
+        try:
+            return await self._get_switch_snapshot(kinds)
+        finally:
+            self._poll_cache = None
+
+    async def _get_switch_snapshot(self, kinds: tuple[str, ...]) -> SwitchSnapshot:
+        if not self.switch_model.MODEL_NAME:
+            await self.autodetect_model()
+
+        if not self._loaded_switch_metadata:
+            await self._get_switch_metadata()
+        kinds = self._get_model_poll_kinds(kinds)
+        snapshot = SwitchSnapshot(self.ports, self._loaded_switch_metadata, kinds)
+
+        if self.concurrent_fetching:
+            _start_time = time.perf_counter()
+            pages = await self.fetch_pages_from_templates(
+                self._get_poll_templates(kinds)
+            )
+            return self._process_poll_pages(
+                snapshot, dict(zip(kinds, pages, strict=True)), _start_time
+            )
+
+        _start_time = 0.0
+        pages = {}
+        for kind in kinds:
+            if kind == PORT_STATISTICS:
+                _start_time = time.perf_counter()
+            pages[kind] = await self.fetch_page_from_templates(
+                self._get_kind_templates(kind)
+            )
+        return self._process_poll_pages(snapshot, pages, _start_time)
+
+    async def _get_switch_metadata(self) -> None:
+        page = await self.fetch_page_from_templates(
+            self.switch_model.SWITCH_INFO_TEMPLATES
+        )
+        self._process_switch_metadata(page)
+
+    async def _request_or_login(self, method: str, url: str, data: dict) -> Any:
+        """Send a configuration request, login once when the session expired."""
+        cookie = self.get_cookie()
+        try:
+            return await self._page_fetcher.request(method, url, data)
+        except NotLoggedInError as error:
+            if await self._login_again(cookie):
+                return await self._page_fetcher.request(method, url, data)
+            message = "Not logged in and unable to login."
+            raise LoginFailedError(message) from error
+
+    async def switch_leds(self, state: str) -> bool:
+        """Switch front panel LEDs on or off."""
+        if not self.switch_model.SWITCH_LED_TEMPLATES:
+            message = "No LED templates found."
+            raise NotImplementedError(message)
+        if state not in SWITCH_STATES:
+            message = f'State "{state}" not in {SWITCH_STATES}.'
+            raise InvalidSwitchStateError(message)
+        for template in self.switch_model.SWITCH_LED_TEMPLATES:
+            url = template["url"].format(ip=self.host)
+            data = self.switch_model.get_switch_led_data(state)  # type: ignore[report-call-issue]
+            self._page_fetcher.set_data_from_template(template, self, data)
+            response = await self._request_or_login(template["method"], url, data)
+            if self._is_success_response(response):
+                # Clear cached metadata to refetch led status on next poll
+                self.clear_switch_metadata()
+                return True
+            _LOGGER.warning(
+                "AsyncNetgearSwitchConnector.switch_leds response was %s",
+                response.content.strip(),
+            )
+        return False
+
+    async def turn_on_leds(self) -> bool:
+        """Turn on front panel LEDs."""
+        return await self.switch_leds("on")
+
+    async def turn_off_leds(self) -> bool:
+        """Turn off front panel LEDs."""
+        return await self.switch_leds("off")
+
+    async def switch_poe_port(self, poe_port: int, state: str) -> bool:
+        """Switch poe port on or off."""
+        if state not in SWITCH_STATES:
+            message = f'State "{state}" not in {SWITCH_STATES}.'
+            raise InvalidSwitchStateError(message)
+        if poe_port not in self.poe_ports:
+            message = f"Port {poe_port} not in {self.poe_ports}"
+            raise InvalidPoEPortError(message)
+        for template in self.switch_model.SWITCH_POE_PORT_TEMPLATES:
+            url = template["url"].format(ip=self.host)
+            data = self.switch_model.get_switch_poe_port_data(poe_port, state)  # type: ignore[report-call-issue]
+            self._page_fetcher.set_data_from_template(template, self, data)
+            response = await self._request_or_login("post", url, data)
+            if self._is_success_response(response):
+                return True
+            _LOGGER.warning(
+                "AsyncNetgearSwitchConnector.switch_poe_port response was %s",
+                response.content.strip(),
+            )
+        return False
+
+    async def turn_on_poe_port(self, poe_port: int) -> bool:
+        """Turn on power of a PoE port."""
+        return await self.switch_poe_port(poe_port, "on")
+
+    async def turn_off_poe_port(self, poe_port: int) -> bool:
+        """Turn off power of a PoE port."""
+        return await self.switch_poe_port(poe_port, "off")
+
+    async def power_cycle_poe_port(self, poe_port: int) -> bool:
+        """Cycle the power of a PoE port."""
+        if poe_port not in self.poe_ports:
+            return False
+        for template in self.switch_model.CYCLE_POE_PORT_TEMPLATES:
+            url = template["url"].format(ip=self.host)
+            data = self.switch_model.get_power_cycle_poe_port_data(poe_port)  # type: ignore[report-call-issue]
+            self._page_fetcher.set_data_from_template(template, self, data)
+            response = await self._request_or_login(template["method"], url, data)
+            if self._is_success_response(response):
+                return True
+            _LOGGER.warning(
+                "AsyncNetgearSwitchConnector.power_cycle_poe_port response was %s",
+                response.content.strip(),
+            )
+        return False
+
+    async def save_pages(self, path_prefix: str = "") -> None:
+        """Save all pages to files for debugging."""
+        if not self.switch_model or not self.switch_model.MODEL_NAME:
+            await self.autodetect_model()
+        if not Path(path_prefix).exists():
+            Path(path_prefix).mkdir(parents=True)
+        for template in self._get_saved_page_templates():
+            try:
+                response = await self.fetch_page_from_templates([template])
+            except PageNotLoadedError:
+                _LOGGER.warning(
+                    "AsyncNetgearSwitchConnector.save_pages could not download %s",
+                    template["url"].format(ip=self.host),
+                )
+                continue
+            self._save_page(path_prefix, template, response)
+
+    async def save_autodetect_templates(self, path_prefix: str = "") -> None:
+        """Save all pages used to detect the switch model to files for debugging."""
+        # These pages should be called unauthenticated, so logout first
+        if self.get_cookie() != (None, None):
+            _LOGGER.debug(
+                "AsyncNetgearSwitchConnector.save_autodetect_templates logout"
+            )
+            await self.delete_login_cookie()
+        for template in self.switch_model.AUTODETECT_TEMPLATES:
+            url = template["url"].format(ip=self.host)
+            response = BaseResponse()
+            with suppress(NotLoggedInError):
+                response = await self._page_fetcher.request("get", url)
+            if self._page_fetcher.has_ok_status(response):
+                self._write_page(path_prefix, url, response)
@@ -0,0 +1,226 @@
+"""HTML page retrieval classes for asyncio."""
+
+import asyncio
+import logging
+import time
+from contextlib import suppress
+from typing import Any
+
+from py_netgear_plus.fetcher import (
+    DEFAULT_POOL_IDLE_TIMEOUT,
+    DEFAULT_POOL_MAXSIZE,
+    URL_REQUEST_TIMEOUT,
+    BasePageFetcher,
+    BaseResponse,
+    LoginFailedError,
+    NotLoggedInError,
+    PageFetcherCircuitOpenError,
+    PageFetcherConnectionError,
+    PageNotLoadedError,
+    Response,
+    status_code_ok,
+)
+from py_netgear_plus.models import AutodetectedSwitchModel
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AsyncPageFetcher(BasePageFetcher):
+    """Class to fetch html pages from switch (or file) with aiohttp."""
+
+    def __init__(
+        self,
+        host: str,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_idle_timeout: float = DEFAULT_POOL_IDLE_TIMEOUT,
+    ) -> None:
+        """Initialize AsyncPageFetcher Object, aiohttp is required from here on."""
+        if aiohttp is None:
+            message = (
+                "aiohttp is required for the asyncio connector. "
+                "Install it with: pip install py-netgear-plus[async]"
+            )
+            raise ImportError(message)
+        super().__init__(host, pool_maxsize, pool_idle_timeout)
+
+    def _create_session(self) -> Any:
+        """Create an aiohttp session with a keep-alive connection pool for the host."""
+        connector = aiohttp.TCPConnector(
+            limit_per_host=self.pool_maxsize,
+            keepalive_timeout=self.pool_idle_timeout,
+        )
+        # The login cookie is passed explicitly with every request,
+        # so do not let the session collect cookies set by the switch.
+        return aiohttp.ClientSession(
+            connector=connector, cookie_jar=aiohttp.DummyCookieJar()
+        )
+
+    def _get_session(self) -> Any:
+        """Return the aiohttp session, its connector evicts idle connections."""
+        if self._session is None:
+            self._session = self._create_session()
+            self._session_used = False
+        return self._session
+
+    async def close(self) -> None:
+        """Close the aiohttp session and its pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _send_once(
+        self, session: Any, method: str, url: str, **kwargs: Any
+    ) -> BaseResponse:
+        """Send request and read the complete response into a BaseResponse."""
+        timeout = aiohttp.ClientTimeout(total=kwargs.pop("timeout"))
+        async with session.request(method, url, timeout=timeout, **kwargs) as raw:
+            response = BaseResponse()
+            response.status_code = raw.status
+            response.content = await raw.read()
+            for name, morsel in raw.cookies.items():
+                response.cookies.set(name, morsel.value)
+            return response
+
+    async def _send(self, method: str, url: str, **kwargs: Any) -> BaseResponse:
+        """Send paced request and feed its outcome back to pacer and breaker."""
+        probe = self._check_circuit(kwargs)
+        try:
+            delay = self.pacer.get_delay()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            start_time = time.monotonic()
+            response = await self._send_on_session(method, url, **kwargs)
+        except (TimeoutError, aiohttp.ClientError):
+            self.pacer.record_error()
+            self.circuit_breaker.record_failure()
+            raise
+        else:
+            self.pacer.record_response(time.monotonic() - start_time)
+            self.circuit_breaker.record_success()
+            return response
+        finally:
+            # a cancelled or crashed probe must not block the next one
+            if probe:
+                self.circuit_breaker.release_probe()
+
+    async def _send_on_session(
+        self, method: str, url: str, **kwargs: Any
+    ) -> BaseResponse:
+        """Send request on the keep-alive session, reconnect once if it was dropped."""
+        session = self._get_session()
+        reused = self._session_used
+        self._session_used = True
+        try:
+            return await self._send_once(session, method, url, **kwargs)
+        except aiohttp.ServerDisconnectedError as error:
+            # The embedded web servers close idle sockets without notice.
+            if not reused:
+                raise
+            _LOGGER.debug(
+                "[AsyncPageFetcher._send_on_session] connection dropped by switch, "
+                "reconnecting: %s",
+                error,
+            )
+            return await self._send_once(session, method, url, **kwargs)
+
+    async def check_login_url(
+        self, switch_model: type[AutodetectedSwitchModel]
+    ) -> bool:
+        """Check and cache login page."""
+        templates = switch_model.AUTODETECT_TEMPLATES
+        for template in templates:
+            url = template["url"].format(ip=self.host)
+            if self.offline_mode:
+                _LOGGER.debug(
+                    "[AsyncPageFetcher.check_login_url] reading %s from file.", url
+                )
+                self._login_page_response = self.get_page_from_file(url)
+            else:
+                method = template["method"]
+                _LOGGER.debug(
+                    "[AsyncPageFetcher.check_login_url] calling request for %s %s",
+                    method.upper(),
+                    url,
+                )
+                with suppress(
+                    TimeoutError, aiohttp.ClientError, PageFetcherCircuitOpenError
+                ):
+                    self._login_page_response = await self._send(
+                        method,
+                        url,
+                        allow_redirects=False,
+                        timeout=URL_REQUEST_TIMEOUT,
+                    )
+
+            if self.has_ok_status(self._login_page_response):
+                return True
+        message = f"Failed to load any page of templates: {templates}"
+        raise PageNotLoadedError(message)
+
+    async def get_login_response(
+        self,
+        switch_model: type[AutodetectedSwitchModel],
+        login_password: str,
+        rand: str | None,
+    ) -> Response | BaseResponse:
+        """Login and save returned cookie."""
+        method, url, data = self._prepare_login_request(
+            switch_model, login_password, rand
+        )
+        response = await self.request(method, url, data=data, allow_redirects=True)
+        if not response or response.status_code != status_code_ok:
+            raise LoginFailedError
+
+        return response
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        data: Any = None,
+        timeout: int = 0,  # noqa: ASYNC109
+        allow_redirects: bool = False,  # noqa: FBT001, FBT002
+    ) -> Response | BaseResponse:
+        """Make authenticated requests on the aiohttp session."""
+        if self.offline_mode:
+            return self.get_page_from_file(url)
+        if timeout == 0:
+            timeout = URL_REQUEST_TIMEOUT
+        data_key = "data" if method == "post" else "params"
+        kwargs = {
+            data_key: data,
+            "allow_redirects": allow_redirects,
+            "timeout": timeout,
+        }
+        if self._cookie_name and self._cookie_content:
+            kwargs["cookies"] = {self._cookie_name: self._cookie_content}
+        _LOGGER.debug(
+            "[AsyncPageFetcher.request] calling %s %s with %s cookie"
+            " with %s=%s, allow_redirects=%s, timeout=%d",
+            method.upper(),
+            url,
+            self._cookie_name,
+            data_key,
+            data,
+            allow_redirects,
+            timeout,
+        )
+        try:
+            response = await self._send(method, url, **kwargs)
+        except TimeoutError:
+            # the same empty response as PageFetcher.request
+            return Response()
+        except aiohttp.ClientError as error:
+            raise PageFetcherConnectionError from error
+
+        # Session expired: refresh login cookie and try again
+        if response.status_code == status_code_ok and not self._is_authenticated(
+            response
+        ):
+            raise NotLoggedInError
+        return response
@@ -0,0 +1,121 @@
+"""Circuit breaker for the requests sent to a switch."""
+
+import logging
+import random
+import threading
+import time
+
+# consecutive failed requests before the circuit opens
+DEFAULT_FAILURE_THRESHOLD = 3
+# time the circuit stays open after the first and after repeated failures
+DEFAULT_BASE_BACKOFF = 5.0
+DEFAULT_MAX_BACKOFF = 300.0
+# relative random deviation of the backoff
+DEFAULT_JITTER = 0.2
+# timeout of the request probing a switch after the circuit was open
+PROBE_TIMEOUT = 3
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half-open"
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """
+    Fail fast while a switch does not respond.
+
+    After failure_threshold consecutive failed requests the circuit opens and
+    requests are rejected without touching the network. The backoff doubles
+    with every opening, up to max_backoff, and is randomized by jitter. When
+    it has passed, the circuit is half-open: a single probe request is let
+    through. Its success closes the circuit, its failure opens it again, and
+    a probe that ends otherwise is released for the next request.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        base_backoff: float = DEFAULT_BASE_BACKOFF,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        jitter: float = DEFAULT_JITTER,
+    ) -> None:
+        """Initialize CircuitBreaker Object."""
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self._state = STATE_CLOSED
+        self._failure_count = 0
+        self._open_count = 0
+        self._open_until = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Return the state of the circuit, moving from open to half-open."""
+        with self._lock:
+            if self._state == STATE_OPEN and time.monotonic() >= self._open_until:
+                self._state = STATE_HALF_OPEN
+                self._probe_in_flight = False
+            return self._state
+
+    @property
+    def retry_after(self) -> float:
+        """Return the seconds until the open circuit lets a probe through."""
+        if self.state != STATE_OPEN:
+            return 0.0
+        return max(self._open_until - time.monotonic(), 0.0)
+
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent to the switch."""
+        state = self.state
+        if state == STATE_CLOSED:
+            return True
+        if state == STATE_OPEN:
+            return False
+        with self._lock:
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def release_probe(self) -> None:
+        """Let the next request probe after a probe ended without an outcome."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        with self._lock:
+            if self._state != STATE_CLOSED:
+                _LOGGER.info("[CircuitBreaker.record_success] switch is back.")
+            self._state = STATE_CLOSED
+            self._failure_count = 0
+            self._open_count = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failed request and open the circuit if needed."""
+        with self._lock:
+            self._failure_count += 1
+            if (
+                self._state == STATE_HALF_OPEN
+                or self._failure_count >= self.failure_threshold
+            ):
+                self._open()
+
+    def _open(self) -> None:
+        backoff = min(self.base_backoff * 2**self._open_count, self.max_backoff)
+        backoff *= random.uniform(1 - self.jitter, 1 + self.jitter)  # noqa: S311
+        self._state = STATE_OPEN
+        self._open_count += 1
+        self._open_until = time.monotonic() + backoff
+        self._probe_in_flight = False
+        _LOGGER.info(
+            "[CircuitBreaker._open] %d failed requests, failing fast for %.1fs.",
+            self._failure_count,
+            backoff,
+        )
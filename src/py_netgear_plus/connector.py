@@ -0,0 +1,1144 @@
+"""Connector to the web interface of a Netgear Plus switch."""
+
+import logging
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing, suppress
+from pathlib import Path
+from typing import Any
+
+from . import __version__
+from .fetcher import (
+    DEFAULT_POOL_IDLE_TIMEOUT,
+    DEFAULT_POOL_MAXSIZE,
+    BasePageFetcher,
+    BaseResponse,
+    LoginFailedError,
+    NotLoggedInError,
+    PageFetcher,
+    PageFetcherConnectionError,
+    PageNotLoadedError,
+    Response,
+    status_code_no_response,
+    status_code_not_found,
+    status_code_unauthorized,
+)
+from .models import (
+    AutodetectedSwitchModel,
+    MultipleModelsDetectedError,
+    SwitchModelNotDetectedError,
+    get_autodetect_index,
+    get_model,
+    get_models,
+)
+from .pacer import AdaptivePacer
+from .parse_cache import ParseCache
+from .parsers import NetgearPlusPageParserError, create_page_parser
+from .rates import update_port_rates
+from .snapshot import (
+    POE_KINDS,
+    POE_PORT_CONFIG,
+    POE_PORT_STATUS,
+    POLL_KINDS,
+    PORT_STATISTICS,
+    PORT_STATUS,
+    SwitchSnapshot,
+    get_poll_kinds,
+)
+from .storage import ModelCache, SessionStore
+
+DEFAULT_PAGE = "index.htm"
+MAX_AUTHENTICATION_FAILURES = 3
+PORT_STATUS_CONNECTED = ["Aktiv", "Up", "UP", "CONNECTED"]
+PORT_MODUS_SPEED = ["Auto"]
+PORT_CONNECTION_SPEEDS = {
+    "10G": 10000,
+    "5G": 5000,
+    "2.5G": 2500,
+    "1G": 1000,
+    "1000M": 1000,
+    "100M": 100,
+    "10M": 10,
+}
+SWITCH_STATES = ["on", "off"]
+# switch model attribute with the templates of every kind of page polled
+POLL_TEMPLATES = {
+    PORT_STATUS: "PORT_STATUS_TEMPLATES",
+    PORT_STATISTICS: "PORT_STATISTICS_TEMPLATES",
+    POE_PORT_CONFIG: "POE_PORT_CONFIG_TEMPLATES",
+    POE_PORT_STATUS: "POE_PORT_STATUS_TEMPLATES",
+}
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class InvalidPortStatusError(Exception):
+    """Number of statusses do not match number of ports."""
+
+
+class InvalidSwitchStateError(Exception):
+    """State should be one of the options in SWITCH_STATES."""
+
+
+class InvalidPoEPortError(Exception):
+    """Port is not a PoE port."""
+
+
+class BaseSwitchConnector:
+    """
+    State, parsing and template logic shared by the sync and asyncio connectors.
+
+    Nothing in here sends a request. NetgearSwitchConnector and
+    AsyncNetgearSwitchConnector fetch the pages with their page fetcher and
+    process them with these methods.
+    """
+
+    _page_fetcher: BasePageFetcher
+
+    def __init__(
+        self,
+        host: str,
+        password: str,
+        *,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_idle_timeout: float = DEFAULT_POOL_IDLE_TIMEOUT,
+        session_store: SessionStore | None = None,
+    ) -> None:
+        """Initialize Connector Object."""
+        self.host = host
+        # reuses login sessions across instances and processes
+        self.session_store = session_store
+        # skips autodetection of hosts whose model was detected before
+        self.model_cache: ModelCache | None = None
+        # model taken from model_cache, confirmed on the first login page
+        self._unconfirmed_cached_model = False
+
+        # initial values
+        self.switch_model = AutodetectedSwitchModel
+        self._page_fetcher = self._create_page_fetcher(pool_maxsize, pool_idle_timeout)
+        self._page_parser = create_page_parser()
+        # skips parsing pages that did not change since the previous poll
+        self.parse_cache = ParseCache()
+        self.ports = 0
+        self.poe_ports = []
+        self._switch_bootloader = "unknown"
+        self._switch_firmware = None
+
+        # fetch the pages of a poll in parallel,
+        # limited by switch_model.MAX_CONCURRENT_REQUESTS
+        self.concurrent_fetching = False
+        # probe all autodetect templates at once, detect on the first page loaded
+        self.concurrent_autodetect = False
+
+        # Login related instance variables
+        # plain login password
+        self._password = password
+        # Model page template param variables
+        self._client_hash = None
+        self._gambit = None
+
+        self._authentication_failure_count = 0
+        # serializes logins of concurrent requests
+        self._login_lock = self._create_login_lock()
+
+        # previous data calculation
+        self._previous_timestamp = time.perf_counter()
+        self._previous_data = {}
+
+        # current data
+        self._loaded_switch_metadata = {}
+        # template that succeeded per list of templates
+        self._successful_templates: dict[tuple, dict] = {}
+        # templates of pages the switch does not have (404)
+        self._missing_templates: set[tuple] = set()
+        # responses fetched during the current get_switch_infos() call
+        self._poll_cache: dict[tuple, Response | BaseResponse] | None = None
+
+        _LOGGER.debug(
+            "[NetgearSwitchConnector] instance (v%s) created for IP=%s",
+            __version__,
+            self.host,
+        )
+        _LOGGER.debug(
+            "[NetgearSwitchConnector] DEBUG logging enabled. "
+            "Your logs may contain sensitve information like "
+            "passwords or session cookies. Do not use in production."
+        )
+
+    @property
+    def pacer(self) -> AdaptivePacer:
+        """Return the pacer adapting the pause between requests to the switch."""
+        return self._page_fetcher.pacer
+
+    @property
+    def sleep_time(self) -> float:
+        """Return the current pause between requests in seconds."""
+        return self.pacer.interval
+
+    @sleep_time.setter
+    def sleep_time(self, value: float) -> None:
+        """Set the pause between requests in seconds, the pacer never goes below."""
+        pacer = self.pacer
+        pacer.min_interval = value
+        pacer.max_interval = max(pacer.max_interval, value)
+        pacer.interval = value
+
+    def turn_on_offline_mode(self, path_prefix: str) -> None:
+        """Turn on offline mode."""
+        self._page_fetcher.turn_on_offline_mode(path_prefix)
+
+    def turn_on_online_mode(self) -> None:
+        """Turn on online mode."""
+        self._page_fetcher.turn_on_online_mode()
+
+    def get_offline_mode(self) -> bool:
+        """Get offline mode status."""
+        return self._page_fetcher.offline_mode
+
+    def _load_cached_model(self) -> bool:
+        """Take the model of this host from model_cache without any request."""
+        if self.model_cache is None:
+            return False
+        model_name = self.model_cache.load(self.host)
+        mdl_cls = get_model(model_name) if model_name else None
+        if mdl_cls is None:
+            return False
+        self._set_instance_attributes_by_model(mdl_cls())
+        self._page_parser = create_page_parser(model_name)
+        self._unconfirmed_cached_model = True
+        _LOGGER.debug(
+            "[NetgearSwitchConnector._load_cached_model] using cached %s.",
+            model_name,
+        )
+        return True
+
+    def _save_cached_model(self) -> None:
+        """Save the detected model for later instances of the connector."""
+        if self.model_cache is not None:
+            self.model_cache.save(self.host, self.switch_model.MODEL_NAME)
+
+    def _confirm_cached_model(self) -> bool:
+        """
+        Run the autodetect checks on the first login page of a cached model.
+
+        The login page is fetched for the login anyway. If it does not detect
+        the cached model, the cache entry is deleted and False returned.
+        """
+        if not self._unconfirmed_cached_model:
+            return True
+        self._unconfirmed_cached_model = False
+        model_name = self.switch_model.MODEL_NAME
+        login_page = self._page_fetcher.get_login_page_response()
+        detected_model = None
+        with suppress(MultipleModelsDetectedError):
+            if login_page is not None:
+                detected_model = self._detect_model(login_page)
+        if detected_model and model_name == detected_model.MODEL_NAME:
+            return True
+        _LOGGER.info(
+            "[NetgearSwitchConnector._confirm_cached_model]"
+            " login page of %s does not match cached %s, detecting model.",
+            self.host,
+            model_name,
+        )
+        if self.model_cache is not None:
+            self.model_cache.delete(self.host)
+        self.switch_model = AutodetectedSwitchModel
+        self._page_fetcher.clear_login_page_response()
+        return False
+
+    def _detect_model(
+        self, response: Response | BaseResponse
+    ) -> type[AutodetectedSwitchModel] | None:
+        """Run the autodetect checks of all models on a login page response."""
+        models = get_models()
+        autodetect_index = get_autodetect_index(models)
+        # every distinct check runs once, the models failing it are dropped
+        candidates = set(range(len(models)))
+        forced_matches = set()
+        func_results = {}
+        for func_name, check in autodetect_index.items():
+            func_result = getattr(self._page_parser, func_name)(response)
+            func_results[func_name] = func_result
+            passed = check.models_by_result.get(func_result, frozenset())
+            candidates -= check.models - passed
+
+            # check_login_switchinfo_tag beats them all
+            if func_name == "check_login_switchinfo_tag":
+                forced_matches |= passed
+
+        matched_models = [
+            models[model_index]() for model_index in sorted(candidates | forced_matches)
+        ]
+        if len(matched_models) == 1:
+            # set local settings
+            self._set_instance_attributes_by_model(matched_models[0])
+            _LOGGER.info(
+                "[NetgearSwitchConnector.autodetect_model] found %s switch.",
+                matched_models[0].MODEL_NAME,
+            )
+            if self.switch_model:
+                self._page_parser = create_page_parser(self.switch_model.MODEL_NAME)
+                return self.switch_model
+        if len(matched_models) > 1:
+            raise MultipleModelsDetectedError(str(matched_models))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            passed_checks_by_model = {
+                mdl_cls.MODEL_NAME: {
+                    func_name: func_results[func_name] in expected_results
+                    for func_name, expected_results in mdl_cls().get_autodetect_funcs()
+                }
+                for mdl_cls in models
+            }
+            _LOGGER.debug(
+                "[NetgearSwitchConnector.autodetect_model] "
+                "passed_checks_by_model=%s matched_models=%s",
+                passed_checks_by_model,
+                matched_models,
+            )
+        return None
+
+    def _set_instance_attributes_by_model(
+        self, switch_model: type[AutodetectedSwitchModel]
+    ) -> None:
+        self.switch_model = switch_model
+        self._reset_template_memo()
+        self.parse_cache.clear()
+        self.ports = switch_model.PORTS
+        self.poe_ports = switch_model.POE_PORTS
+        self._previous_data = {
+            "traffic_tx": [0] * self.ports,
+            "traffic_rx": [0] * self.ports,
+            "crc_errors": [0] * self.ports,
+            "speed_io": [0] * self.ports,
+            "sum_rx": [0] * self.ports,
+            "sum_tx": [0] * self.ports,
+        }
+
+    def _handle_soft_authentication_failure(
+        self, response: Response | BaseResponse
+    ) -> None:
+        """Handle soft authentication failure."""
+        # Clear cached login data
+        self._page_fetcher.clear_login_page_response()
+
+        if "content" not in dir(response):
+            message = "No content in login form response."
+            raise LoginFailedError(message)
+
+        # Handling Error Messages
+        error_msg = self._page_parser.parse_error(response)
+        if error_msg:
+            _LOGGER.warning(
+                "[NetgearSwitchConnector.handle_soft_authentication_failure]"
+                ' [IP: %s] Response from switch: "%s"',
+                self.host,
+                error_msg,
+            )
+        else:
+            _LOGGER.debug(
+                "[NetgearSwitchConnector.handle_soft_authentication_failure]"
+                " No error message found in response:\n\n%s",
+                response.content.decode("utf-8"),
+            )
+
+        self._authentication_failure_count += 1
+        if self._authentication_failure_count >= MAX_AUTHENTICATION_FAILURES:
+            count = self._authentication_failure_count
+            message = f"Too many authentication failures ({count})."
+            raise LoginFailedError(message)
+
+    def _load_session(self) -> bool:
+        """Set the login cookie of a saved session for this host and model."""
+        if self.session_store is None:
+            return False
+        session = self.session_store.load(self.host)
+        if session is None or session["model"] != self.switch_model.MODEL_NAME:
+            return False
+        _LOGGER.debug(
+            "[NetgearSwitchConnector._load_session] checking saved %s cookie.",
+            session["cookie_name"],
+        )
+        self.set_cookie(session["cookie_name"], session["cookie_content"])
+        return True
+
+    def _discard_session(self) -> None:
+        """Drop the cookie of a saved session that the switch did not accept."""
+        _LOGGER.debug(
+            "[NetgearSwitchConnector._discard_session] saved session of %s rejected.",
+            self.host,
+        )
+        self._page_fetcher.clear_cookie()
+        self._gambit = None
+        self._forget_session()
+
+    def _save_session(self) -> None:
+        """Save the login cookie for later instances of the connector."""
+        cookie_name, cookie_content = self.get_cookie()
+        if self.session_store is None or not cookie_name:
+            return
+        self.session_store.save(
+            self.host,
+            {
+                "model": self.switch_model.MODEL_NAME,
+                "cookie_name": cookie_name,
+                "cookie_content": cookie_content,
+            },
+        )
+
+    def _forget_session(self) -> None:
+        """Delete the saved session, its cookie is not accepted anymore."""
+        if self.session_store is not None:
+            self.session_store.delete(self.host)
+
+    def _process_login_response(self, response: Response | BaseResponse) -> bool:
+        """Take the login cookie from a login response."""
+        _LOGGER.debug(
+            "[NetgearSwitchConnector.get_login_cookie] looking for cookies: %s",
+            ", ".join(self.switch_model.ALLOWED_COOKIE_TYPES),
+        )
+        # GS31xEP(P) series switches return the cookie value in a hidden form element
+        self._gambit = self._page_parser.parse_gambit_tag(response)
+        if self._gambit:
+            self._page_fetcher.set_cookie(
+                self.switch_model.ALLOWED_COOKIE_TYPES[0], self._gambit
+            )
+            _LOGGER.debug("[NetgearSwitchConnector.get_login_cookie] Found Gambit tag:")
+            _LOGGER.debug(
+                "[NetgearSwitchConnector.get_login_cookie] Setting cookie %s=%s",
+                self.switch_model.ALLOWED_COOKIE_TYPES[0],
+                str(self._gambit),
+            )
+            self._authentication_failure_count = 0
+            return True
+        # Other switches return a cookie on successful login
+        for ct in self.switch_model.ALLOWED_COOKIE_TYPES:
+            cookie = response.cookies.get(ct, None)
+            if cookie:
+                _LOGGER.debug(
+                    "[NetgearSwitchConnector.get_login_cookie] Found cookie %s", ct
+                )
+                self._page_fetcher.set_cookie(ct, cookie)
+                self._authentication_failure_count = 0
+                return True
+        _LOGGER.debug(
+            "[NetgearSwitchConnector.get_login_cookie] "
+            "No Gambit tag or valid cookie found."
+        )
+        self._handle_soft_authentication_failure(response)
+        return False
+
+    def get_cookie(self) -> tuple[str | None, str | None]:
+        """Return cookie."""
+        return self._page_fetcher.get_cookie()
+
+    def set_cookie(self, name: str, content: str) -> None:
+        """Return cookie."""
+        if name == "gambitCookie":
+            self._gambit = content
+        return self._page_fetcher.set_cookie(name, content)
+
+    def _parse_page(self, kind: str, page: Response | BaseResponse, *args: Any) -> Any:
+        """Return the result of parse_<kind> of the page parser for page."""
+        parse = getattr(self._page_parser, f"parse_{kind}")
+        return self.parse_cache.parse(kind, self._page_parser, parse, page, *args)
+
+    def _get_template_request(self, template: dict) -> tuple[str, str, dict]:
+        """Return method, url and data for a request template."""
+        url = template["url"].format(ip=self.host)
+        method = template["method"]
+        data = {}
+        if not self.get_offline_mode():
+            self._page_fetcher.set_data_from_template(template, self, data)
+        return (method, url, data)
+
+    def _get_poll_cache_key(self, method: str, url: str, data: dict) -> tuple:
+        """Return the key of a request in the poll cache."""
+        return (method, url, tuple(sorted(data.items())))
+
+    def _get_cached_page(self, key: tuple) -> Response | BaseResponse | None:
+        """Return the response already fetched for key during the current poll."""
+        if self._poll_cache is None:
+            return None
+        return self._poll_cache.get(key)
+
+    def _cache_page(self, key: tuple, response: Response | BaseResponse) -> None:
+        """Keep a successful response for the rest of the current poll."""
+        if self._poll_cache is not None:
+            self._poll_cache[key] = response
+
+    def _get_template_key(self, template: dict) -> tuple[str, str]:
+        return (template["method"], template["url"])
+
+    def _get_templates_key(self, templates: list) -> tuple:
+        return tuple(self._get_template_key(template) for template in templates)
+
+    def _get_ordered_templates(self, templates: list) -> list:
+        """Return templates to try, last successful first and known 404s skipped."""
+        ordered_templates = [
+            template
+            for template in templates
+            if self._get_template_key(template) not in self._missing_templates
+        ]
+        successful_template = self._successful_templates.get(
+            self._get_templates_key(templates)
+        )
+        if successful_template in ordered_templates:
+            ordered_templates.remove(successful_template)
+            ordered_templates.insert(0, successful_template)
+        return ordered_templates or templates
+
+    def _record_template_response(
+        self, templates: list, template: dict, response: Response | BaseResponse
+    ) -> None:
+        """Remember the template that succeeded or that the page does not exist."""
+        if self._page_fetcher.has_ok_status(response):
+            self._successful_templates[self._get_templates_key(templates)] = template
+        elif response.status_code == status_code_not_found:
+            self._missing_templates.add(self._get_template_key(template))
+
+    def _reset_template_memo(self) -> None:
+        """Forget successful and missing templates, e.g. after a firmware change."""
+        self._successful_templates = {}
+        self._missing_templates = set()
+
+    def _get_model_poll_kinds(self, kinds: tuple[str, ...]) -> tuple[str, ...]:
+        """Return the kinds of pages of the switch model out of kinds."""
+        # Partially supported models fail parsing the PoE pages
+        if self.switch_model.SUPPORTED and len(self.switch_model.POE_PORTS):
+            return kinds
+        return tuple(kind for kind in kinds if kind not in POE_KINDS)
+
+    def _get_kind_templates(self, kind: str) -> list:
+        """Return the templates of a kind of page polled."""
+        return getattr(self.switch_model, POLL_TEMPLATES[kind])
+
+    def _get_poll_templates(self, kinds: tuple[str, ...] = POLL_KINDS) -> list[list]:
+        """Return the templates of the pages fetched on a poll."""
+        return [
+            self._get_kind_templates(kind) for kind in self._get_model_poll_kinds(kinds)
+        ]
+
+    def _process_poll_pages(
+        self,
+        snapshot: SwitchSnapshot,
+        pages: dict[str, Response | BaseResponse],
+        start_time: float,
+    ) -> SwitchSnapshot:
+        """Process the pages of a poll, keyed by kind of page."""
+        if PORT_STATUS in pages:
+            self._process_port_status(snapshot, pages[PORT_STATUS])
+        elif PORT_STATISTICS in pages:
+            self._set_last_connected_ports(snapshot)
+        current_data = None
+        if PORT_STATISTICS in pages:
+            current_data = self._process_port_statistics(
+                snapshot,
+                self._page_parser.parse_port_statistics(
+                    pages[PORT_STATISTICS], self.ports
+                ),
+                start_time,
+            )
+
+        # Partially supported models fail parsing below this line
+        if not self.switch_model.SUPPORTED:
+            return snapshot
+
+        for kind in POE_KINDS:
+            if kind in pages:
+                snapshot.poe.update(self._parse_page(kind, pages[kind]))
+
+        if current_data is not None:
+            self._set_previous_data(current_data)
+        return snapshot
+
+    def _process_port_statistics(
+        self, snapshot: SwitchSnapshot, port_statistics: dict, start_time: float
+    ) -> dict:
+        """Calculate rates from port statistics and add them to snapshot."""
+        if not self.get_offline_mode():
+            sample_time = start_time - self._previous_timestamp
+        else:
+            sample_time = 0
+        snapshot.response_time_s = round(sample_time, 1)
+
+        update_port_rates(
+            snapshot,
+            self._previous_data,
+            port_statistics,
+            sample_time,
+            self.switch_model.COUNTER_BITS,
+        )
+        return port_statistics
+
+    def _set_previous_data(self, current_data: dict) -> None:
+        """Keep port statistics for the rate calculation of the next poll."""
+        self._previous_timestamp = time.perf_counter()
+        self._previous_data = current_data
+
+    def clear_switch_metadata(self) -> None:
+        """Refetch the switch metadata, parsed once, on the next poll."""
+        self._loaded_switch_metadata = {}
+
+    def _process_switch_metadata(self, page: Response | BaseResponse) -> None:
+        if not page.content:
+            return
+        switch_metadata = {"switch_ip": self.host}
+        self._client_hash = self._parse_page("client_hash", page)
+
+        if self.switch_model.SWITCH_LED_TEMPLATES:
+            switch_metadata.update(self._parse_page("led_status", page))
+
+        switch_metadata.update(self._parse_page("switch_metadata", page))
+        if self._switch_firmware != switch_metadata["switch_firmware"]:
+            if self._switch_firmware is not None:
+                self._reset_template_memo()
+            self._switch_firmware = switch_metadata["switch_firmware"]
+
+        # Avoid a second call on next get_switch_infos() call
+        self._loaded_switch_metadata = switch_metadata
+
+    def _set_last_connected_ports(self, snapshot: SwitchSnapshot) -> None:
+        """Set the ports connected at the last parse of the port status."""
+        # the rates fall back to the previous sums of connected ports only
+        port_status = self._page_parser.port_status
+        for port_number0 in range(self.ports):
+            status = port_status.get(port_number0 + 1, {})
+            snapshot.connected[port_number0] = (
+                status.get("status") in PORT_STATUS_CONNECTED
+            )
+
+    def _process_port_status(
+        self, snapshot: SwitchSnapshot, response_portstatus: Response | BaseResponse
+    ) -> None:
+        port_status = self._parse_page("port_status", response_portstatus, self.ports)
+        if self.ports and len(port_status) != self.ports:
+            message = (
+                f"Number of statusses ({len(port_status)})"
+                f" not equal to number of ports({self.ports})"
+            )
+            raise InvalidPortStatusError(message)
+
+        for port_number0 in range(self.ports):
+            status = port_status[port_number0 + 1]
+            snapshot.connected[port_number0] = (
+                status.get("status") in PORT_STATUS_CONNECTED
+            )
+            snapshot.modus_speed[port_number0] = (
+                status.get("modus_speed") in PORT_MODUS_SPEED
+            )
+            snapshot.connection_speed[port_number0] = PORT_CONNECTION_SPEEDS.get(
+                status.get("connection_speed").upper(), 0
+            )
+
+    def _is_success_response(self, response: Response | BaseResponse) -> bool:
+        """Check if a configuration change was acknowledged by the switch."""
+        return (
+            self._page_fetcher.has_ok_status(response)
+            and str(response.content.strip()) == "b'SUCCESS'"
+        )
+
+    def _get_saved_page_templates(self) -> list[dict]:
+        """Return the templates of the pages saved by save_pages()."""
+        return [
+            *self.switch_model.SWITCH_INFO_TEMPLATES,
+            *self.switch_model.PORT_STATUS_TEMPLATES,
+            *self.switch_model.PORT_STATISTICS_TEMPLATES,
+            *self.switch_model.POE_PORT_CONFIG_TEMPLATES,
+            *self.switch_model.POE_PORT_STATUS_TEMPLATES,
+        ]
+
+    def _save_page(
+        self, path_prefix: str, template: dict, response: Response | BaseResponse
+    ) -> None:
+        """Save a page of save_pages(), take the client hash of the switch info."""
+        url = template["url"].format(ip=self.host)
+        if not self._page_fetcher.has_ok_status(response):
+            _LOGGER.warning(
+                "NetgearSwitchConnector.save_pages failed with status %s for %s",
+                response.status_code,
+                url,
+            )
+            return
+        self._write_page(path_prefix, url, response)
+        if (
+            template in self.switch_model.SWITCH_INFO_TEMPLATES
+            and not self._client_hash
+        ):
+            with suppress(NetgearPlusPageParserError):
+                self._client_hash = self._page_parser.parse_client_hash(response)
+
+    def _write_page(
+        self, path_prefix: str, url: str, response: Response | BaseResponse
+    ) -> None:
+        """Write the content of a page to a file named like the page of url."""
+        page_name = url.split("/")[-1] or DEFAULT_PAGE
+        with Path(f"{path_prefix}/{page_name}").open("wb") as file:
+            file.write(response.content)
+
+    def _create_page_fetcher(
+        self, pool_maxsize: int, pool_idle_timeout: float
+    ) -> BasePageFetcher:
+        """Return the page fetcher of the connector."""
+        raise NotImplementedError
+
+    def _create_login_lock(self) -> Any:
+        """Return the lock serializing logins of concurrent requests."""
+        raise NotImplementedError
+
+
+class NetgearSwitchConnector(BaseSwitchConnector):
+    """Representation of a Netgear Switch."""
+
+    _page_fetcher: PageFetcher
+
+    def _create_page_fetcher(
+        self, pool_maxsize: int, pool_idle_timeout: float
+    ) -> PageFetcher:
+        """Return the page fetcher of the connector."""
+        return PageFetcher(
+            self.host, pool_maxsize=pool_maxsize, pool_idle_timeout=pool_idle_timeout
+        )
+
+    def _create_login_lock(self) -> threading.Lock:
+        """Return the lock serializing logins of concurrent requests."""
+        return threading.Lock()
+
+    def close(self) -> None:
+        """Close pooled connections to the switch."""
+        self._page_fetcher.close()
+
+    def autodetect_model(self) -> type[AutodetectedSwitchModel]:
+        """Detect switch model from login page contents."""
+        _LOGGER.debug(
+            "[NetgearSwitchConnector.autodetect_model] called for IP=%s", self.host
+        )
+        if self._load_cached_model():
+            return self.switch_model
+        templates = AutodetectedSwitchModel.AUTODETECT_TEMPLATES
+        with closing(self._probe_autodetect_templates(templates)) as responses:
+            for response in responses:
+                switch_model = self._detect_model(response)
+                if switch_model:
+                    self._save_cached_model()
+                    return switch_model
+        raise SwitchModelNotDetectedError
+
+    def _probe_autodetect_template(
+        self, template: dict[str, str]
+    ) -> Response | BaseResponse | None:
+        """Return the login page of an autodetect template, None if not loaded."""
+        response = None
+        url = template["url"].format(ip=self.host)
+        with suppress(PageFetcherConnectionError):
+            response = self._page_fetcher.request(template["method"], url)
+        if response and self._page_fetcher.has_ok_status(response):
+            return response
+        return None
+
+    def _probe_autodetect_templates(
+        self, templates: list[dict[str, str]]
+    ) -> Iterator[Response | BaseResponse]:
+        """
+        Yield the loaded login pages of templates.
+
+        With concurrent_autodetect all templates are requested at once and the
+        pages yielded as they arrive. Closing the iterator cancels the requests
+        not started yet, running ones finish in the background.
+        """
+        if not self.concurrent_autodetect:
+            for template in templates:
+                response = self._probe_autodetect_template(template)
+                if response is not None:
+                    yield response
+            return
+        executor = ThreadPoolExecutor(
+            max_workers=max(len(templates), 1),
+            thread_name_prefix=f"NetgearSwitchConnector-{self.host}-autodetect",
+        )
+        try:
+            futures = [
+                executor.submit(self._probe_autodetect_template, template)
+                for template in templates
+            ]
+            for future in as_completed(futures):
+                response = future.result()
+                if response is not None:
+                    yield response
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_unique_id(self) -> str:
+        """Return unique identifier from switch model and ip address."""
+        if self.switch_model.MODEL_NAME == "":
+            _LOGGER.debug(
+                "[NetgearSwitchConnector.get_unique_id] switch_model is None, "
+                "try NetgearSwitchConnector.autodetect_model"
+            )
+            self.autodetect_model()
+            _LOGGER.debug(
+                "[NetgearSwitchConnector.get_unique_id] now switch_model is %s",
+                str(self.switch_model),
+            )
+        model_lower = self.switch_model.MODEL_NAME.lower()
+        return model_lower + "_" + self.host.replace(".", "_")
+
+    def get_login_cookie(self) -> bool:
+        """Login and save returned cookie."""
+        if not self.switch_model or self.switch_model.MODEL_NAME == "":
+            self.autodetect_model()
+        if self._restore_session():
+            return True
+        if not self._page_fetcher.get_login_page_response():
+            self._page_fetcher.check_login_url(self.switch_model)
+            if not self._confirm_cached_model():
+                self.autodetect_model()
+                self._page_fetcher.check_login_url(self.switch_model)
+        rand = self._page_parser.parse_login_form_rand(
+            self._page_fetcher.get_login_page_response()
+        )
+
+        response = self._page_fetcher.get_login_response(
+            self.switch_model, self._password, rand
+        )
+        if not self._process_login_response(response):
+            return False
+        self._save_session()
+        return True
+
+    def _restore_session(self) -> bool:
+        """
+        Reuse a saved session of this host if the switch still accepts it.
+
+        The switch info page is requested with the saved cookie. If the switch
+        redirects to the login page or does not return the page, the session
+        is deleted and False returned to login again.
+        """
+        if not self._load_session():
+            return False
+        templates = self.switch_model.SWITCH_INFO_TEMPLATES
+        for template in self._get_ordered_templates(templates):
+            method, url, data = self._get_template_request(template)
+            try:
+                response = self._page_fetcher.request(method, url, data)
+            except (NotLoggedInError, PageFetcherConnectionError):
+                break
+            self._record_template_response(templates, template, response)
+            if self._page_fetcher.has_ok_status(response):
+                return True
+        self._discard_session()
+        return False
+
+    def delete_login_cookie(self) -> bool:
+        """Logout and delete cookie."""
+        """Only used while testing. Prevents "Maximum number of sessions" error."""
+        if not self.switch_model or self.switch_model.MODEL_NAME == "":
+            self.autodetect_model()
+        response = BaseResponse()
+        for template in self.switch_model.LOGOUT_TEMPLATES:
+            url = template["url"].format(ip=self.host)
+            method = template["method"]
+            data = {}
+            self._page_fetcher.set_data_from_template(template, self, data)
+
+            if not self.get_offline_mode():
+                try:
+                    response = self._page_fetcher.request(method, url, data)
+                    break  # Exit the loop if the request is successful
+                except NotLoggedInError:
+                    response.status_code = status_code_unauthorized
+                    response.content = b""
+                    break
+                except PageFetcherConnectionError:
+                    _LOGGER.debug(
+                        "NetgearSwitchConnector.fetch_page: "
+                        "caught PageFetcherConnectionError"
+                    )
+                    response.status_code = status_code_no_response
+                    response.content = b""
+                    break  # Stop retrying after a connection error
+            else:
+                response = self._page_fetcher.get_page_from_file(url)
+
+            if response.status_code != status_code_not_found:
+                break
+
+        _LOGGER.debug(
+            "[NetgearSwitchConnector.delete_login_cookie] "
+            "logout response status code=%s",
+            response.status_code,
+        )
+        self._page_fetcher.clear_cookie()
+        self._forget_session()
+        return response.status_code != status_code_not_found
+
+    def reboot(self) -> bool:
+        """Reboot the switch."""
+        if not self.switch_model.has_reboot_button():
+            _LOGGER.info("[NetgearSwitchConnector.reboot] Reboot button not available.")
+            return False
+
+        response = BaseResponse()
+        for template in self.switch_model.SWITCH_REBOOT_TEMPLATES:
+            method, url, data = self._get_template_request(template)
+            response = self.fetch_page(method, url, data)
+            if self._page_parser.parse_reboot_success(response):
+                # The firmware may have been updated before the reboot
+                self._reset_template_memo()
+                return True
+
+        _LOGGER.debug(
+            "[NetgearSwitchConnector.reboot] failed to load any page of templates: %s",
+            self.switch_model.SWITCH_REBOOT_TEMPLATES,
+        )
+        return False
+
+    def fetch_page(self, method: str, url: str, data: dict) -> Response | BaseResponse:
+        """Fetch url and retry when first response is a redirect to the login page."""
+        response = BaseResponse()
+        if not self.get_offline_mode():
+            for attempt in range(2):
+                cookie = self.get_cookie()
+                try:
+                    response = self._page_fetcher.request(method, url, data)
+                    break  # Exit the loop if the request is successful
+                except NotLoggedInError as error:
+                    if attempt == 0 and self._login_again(cookie):
+                        continue  # Retry the request if login cookie is available
+                    message = "Not logged in and unable to login."
+                    raise LoginFailedError(message) from error
+                except PageFetcherConnectionError:
+                    _LOGGER.debug(
+                        "NetgearSwitchConnector.fetch_page: "
+                        "caught PageFetcherConnectionError"
+                    )
+                    response.status_code = status_code_no_response
+                    response.content = b""
+                    break  # Stop retrying after a connection error
+        else:
+            response = self._page_fetcher.get_page_from_file(url)
+        return response
+
+    def _login_again(self, expired_cookie: tuple[str | None, str | None]) -> bool:
+        """Login after a session expired, unless a concurrent request already did."""
+        with self._login_lock:
+            if self.get_cookie() != expired_cookie:
+                return True
+            # An expired session hints at a reboot of the switch
+            self._reset_template_memo()
+            self._forget_session()
+            return self.get_login_cookie()
+
+    def fetch_page_from_templates(self, templates: list) -> Response | BaseResponse:
+        """Return response for 1st successful request from templates."""
+        response = BaseResponse()
+        for template in self._get_ordered_templates(templates):
+            method, url, data = self._get_template_request(template)
+            key = self._get_poll_cache_key(method, url, data)
+            cached_response = self._get_cached_page(key)
+            if cached_response is not None:
+                return cached_response
+            response = self.fetch_page(method, url, data)
+            self._record_template_response(templates, template, response)
+            if self._page_fetcher.has_ok_status(response):
+                self._cache_page(key, response)
+                return response
+        message = f"Failed to load any page of templates: {templates}"
+        raise PageNotLoadedError(message)
+
+    def fetch_pages_from_templates(
+        self, templates_list: list[list]
+    ) -> list[Response | BaseResponse]:
+        """Fetch one page per list of templates in parallel."""
+        max_workers = min(
+            len(templates_list), self.switch_model.MAX_CONCURRENT_REQUESTS
+        )
+        with ThreadPoolExecutor(
+            max_workers=max(max_workers, 1),
+            thread_name_prefix=f"NetgearSwitchConnector-{self.host}",
+        ) as executor:
+            return list(executor.map(self.fetch_page_from_templates, templates_list))
+
+    def get_switch_infos(self, fields: Iterable[str] | None = None) -> dict[str, Any]:
+        """Return dict with all available statistics, see get_switch_snapshot()."""
+        return self.get_switch_snapshot(fields).to_dict()
+
+    def get_switch_snapshot(
+        self, fields: Iterable[str] | None = None
+    ) -> SwitchSnapshot:
+        """
+        Return all available statistics as per-port columns.
+
+        fields limits the poll to the pages with these keys of get_switch_infos()
+        or kinds of pages: ["port_statistics"] or ["port_1_speed_rx_mbytes"]
+        fetch only the port statistics page. All values of a page are returned.
+
+        snapshot.kinds are the kinds of pages fetched. Without the port status,
+        connected holds the port status last parsed, which may be stale or all
+        off before the first poll of it; the rates use it to fall back to the
+        previous sums of connected ports.
+        """
+        kinds = get_poll_kinds(fields)
+        # Pages shared by several templates are fetched once per poll
+        self._poll_cache = {}
+        try:
+            return self._get_switch_snapshot(kinds)
+        finally:
+            self._poll_cache = None
+
+    def _get_switch_snapshot(self, kinds: tuple[str, ...]) -> SwitchSnapshot:
+        if not self.switch_model.MODEL_NAME:
+            self.autodetect_model()
+
+        if not self._loaded_switch_metadata:
+            self._get_switch_metadata()
+        kinds = self._get_model_poll_kinds(kinds)
+        snapshot = SwitchSnapshot(self.ports, self._loaded_switch_metadata, kinds)
+
+        if self.concurrent_fetching:
+            # Fetch the pages of a poll in parallel and process them in order
+            _start_time = time.perf_counter()
+            pages = self.fetch_pages_from_templates(self._get_poll_templates(kinds))
+            return self._process_poll_pages(
+                snapshot, dict(zip(kinds, pages, strict=True)), _start_time
+            )
+
+        _start_time = 0.0
+        pages = {}
+        for kind in kinds:
+            if kind == PORT_STATISTICS:
+                _start_time = time.perf_counter()
+            pages[kind] = self.fetch_page_from_templates(self._get_kind_templates(kind))
+        return self._process_poll_pages(snapshot, pages, _start_time)
+
+    def _get_switch_metadata(self) -> None:
+        if not self.switch_model:
+            self.autodetect_model()
+        page = self.fetch_page_from_templates(self.switch_model.SWITCH_INFO_TEMPLATES)
+        self._process_switch_metadata(page)
+
+    def _request_or_login(
+        self, method: str, url: str, data: dict
+    ) -> Response | BaseResponse:
+        """Send a configuration request, login once when the session expired."""
+        cookie = self.get_cookie()
+        try:
+            return self._page_fetcher.request(method, url, data)
+        except NotLoggedInError as error:
+            if self._login_again(cookie):
+                return self._page_fetcher.request(method, url, data)
+            message = "Not logged in and unable to login."
+            raise LoginFailedError(message) from error
+
+    def switch_leds(self, state: str) -> bool:
+        """Switch poe port on or off."""
+        if not self.switch_model.SWITCH_LED_TEMPLATES:
+            message = "No LED templates found."
+            raise NotImplementedError(message)
+        if state not in SWITCH_STATES:
+            message = f'State "{state}" not in {SWITCH_STATES}.'
+            raise InvalidSwitchStateError(message)
+        for template in self.switch_model.SWITCH_LED_TEMPLATES:
+            url = template["url"].format(ip=self.host)
+            method = template["method"]
+            data = self.switch_model.get_switch_led_data(state)  # type: ignore[report-call-issue]
+            self._page_fetcher.set_data_from_template(template, self, data)
+            _LOGGER.debug("switch_leds data=%s", data)
+            response = self._request_or_login(method, url, data)
+            if self._is_success_response(response):
+                # Clear cached metadata to refetch led status on next poll
+                self.clear_switch_metadata()
+                return True
+            _LOGGER.warning(
+                "NetgearSwitchConnector.switch_leds response was %s",
+                response.content.strip(),
+            )
+        return False
+
+    def turn_on_leds(self) -> bool:
+        """Turn on front panel LEDs."""
+        return self.switch_leds("on")
+
+    def turn_off_leds(self) -> bool:
+        """Turn off front panel LEDs."""
+        return self.switch_leds("off")
+
+    def switch_poe_port(self, poe_port: int, state: str) -> bool:
+        """Switch poe port on or off."""
+        if state not in SWITCH_STATES:
+            message = f'State "{state}" not in {SWITCH_STATES}.'
+            raise InvalidSwitchStateError(message)
+        if poe_port in self.poe_ports:
+            for template in self.switch_model.SWITCH_POE_PORT_TEMPLATES:
+                url = template["url"].format(ip=self.host)
+                data = self.switch_model.get_switch_poe_port_data(poe_port, state)  # type: ignore[report-call-issue]
+                self._page_fetcher.set_data_from_template(template, self, data)
+                _LOGGER.debug("switch_poe_port data=%s", data)
+                response = self._request_or_login("post", url, data)
+                if self._is_success_response(response):
+                    return True
+                _LOGGER.warning(
+                    "NetgearSwitchConnector.switch_poe_port response was %s",
+                    response.content.strip(),
+                )
+        else:
+            message = f"Port {poe_port} not in {self.poe_ports}"
+            raise InvalidPoEPortError(message)
+        return False
+
+    def turn_on_poe_port(self, poe_port: int) -> bool:
+        """Turn on power of a PoE port."""
+        return self.switch_poe_port(poe_port, "on")
+
+    def turn_off_poe_port(self, poe_port: int) -> bool:
+        """Turn off power of a PoE port."""
+        return self.switch_poe_port(poe_port, "off")
+
+    def power_cycle_poe_port(self, poe_port: int) -> bool:
+        """Cycle the power of a PoE port."""
+        if poe_port in self.poe_ports:
+            for template in self.switch_model.CYCLE_POE_PORT_TEMPLATES:
+                url = template["url"].format(ip=self.host)
+                data = self.switch_model.get_power_cycle_poe_port_data(poe_port)  # type: ignore[report-call-issue]
+                self._page_fetcher.set_data_from_template(template, self, data)
+                response = self._request_or_login(template["method"], url, data)
+                if self._is_success_response(response):
+                    return True
+                _LOGGER.warning(
+                    "NetgearSwitchConnector.power_cycle_poe_port response was %s",
+                    response.content.strip(),
+                )
+        return False
+
+    def save_pages(self, path_prefix: str = "") -> None:
+        """Save all pages to files for debugging."""
+        if not self.switch_model or not self.switch_model.MODEL_NAME:
+            self.autodetect_model()
+        if not Path(path_prefix).exists():
+            Path(path_prefix).mkdir(parents=True)
+        for template in self._get_saved_page_templates():
+            try:
+                response = self.fetch_page_from_templates([template])
+            except PageNotLoadedError:
+                _LOGGER.warning(
+                    "NetgearSwitchConnector.save_pages could not download %s",
+                    template["url"].format(ip=self.host),
+                )
+                continue
+            self._save_page(path_prefix, template, response)
+
+    def save_autodetect_templates(self, path_prefix: str = "") -> None:
+        """Save all pages used to detect the switch model to files for debugging."""
+        # These pages should be called unauthenticated, so logout first
+        if self.get_cookie() != (None, None):
+            _LOGGER.debug("NetgearSwitchConnector.save_autodetect_templates logout")
+            self.delete_login_cookie()
+        for template in self.switch_model.AUTODETECT_TEMPLATES:
+            url = template["url"].format(ip=self.host)
+            response = BaseResponse()
+            with suppress(NotLoggedInError):
+                response = self._page_fetcher.request("get", url)
+            if self._page_fetcher.has_ok_status(response):
+                self._write_page(path_prefix, url, response)
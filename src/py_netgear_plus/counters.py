@@ -0,0 +1,38 @@
+"""Batch decoding of the traffic counters on port statistics pages."""
+
+from collections.abc import Sequence
+from itertools import repeat
+
+INT32 = 2**32
+DECIMAL = 10
+
+
+def decode_counter(value: str | None, base: int = DECIMAL, default: int = 0) -> int:
+    """Convert one counter, default if it is missing or invalid."""
+    try:
+        return int(value, base)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return default
+
+
+def decode_counters(
+    values: Sequence[str | None], base: int = DECIMAL, default: int = 0
+) -> list[int]:
+    """
+    Convert the counters of a page from strings to ints.
+
+    The counters are converted in one C-level pass, one by one only if some
+    are invalid. Missing or invalid counters are converted to default.
+    """
+    try:
+        return list(map(int, values, repeat(base)))  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return [decode_counter(value, base, default) for value in values]
+
+
+def combine_counters(turnovers: Sequence[int], values: Sequence[int]) -> list[int]:
+    """Return turnover * 2**32 + value of int32 counters and their turnovers."""
+    return [
+        turnover * INT32 + value
+        for turnover, value in zip(turnovers, values, strict=True)
+    ]
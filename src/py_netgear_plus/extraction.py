@@ -0,0 +1,238 @@
+"""Declarative extraction of per-port values from switch pages."""
+
+import re
+from collections.abc import Callable
+from functools import cache
+from typing import Any, NamedTuple
+
+from lxml import etree
+from requests import Response
+
+from .fetcher import BaseResponse, get_page_tree
+
+# cells of a table row: its child elements
+CELLS_CHILDREN = "children"
+# cells of a table row: its child elements and its following siblings up to
+# the next row, for lists without an element per port
+CELLS_FOLLOWING = "following"
+
+# marks fields without a default, their conversion errors are raised
+REQUIRED = object()
+
+CONVERSION_ERRORS = (AttributeError, TypeError, ValueError)
+
+
+class MissingFieldError(ValueError):
+    """The cell of a field without a default is missing."""
+
+
+class Field(NamedTuple):
+    """
+    A value read from the record of every port.
+
+    index is the 0-based position of the cell in the record. In tables it
+    counts only the cells with tag, in patterns all parts of a match. The
+    text of the cell, or its attribute, is passed to convert. A missing cell
+    or a failed conversion results in default, fields without a default raise
+    MissingFieldError or the error of convert instead.
+    """
+
+    name: str
+    index: int
+    tag: str | None = None
+    attribute: str | None = None
+    convert: Callable[[Any], Any] = str
+    default: Any = REQUIRED
+
+
+class TableSpec(NamedTuple):
+    """Ports are the html elements selected by rows, values are their cells."""
+
+    rows: str
+    fields: tuple[Field, ...]
+    cells: str = CELLS_CHILDREN
+
+
+class PatternSpec(NamedTuple):
+    """
+    Ports are the matches of a regex in the page, values are their parts.
+
+    The parts of a match are its groups, with the last group split at the
+    separator: "Entry[0] = '1?Up?Auto'" matched with the groups 0 and
+    1?Up?Auto has the parts "0", "1", "Up" and "Auto".
+    """
+
+    pattern: str
+    fields: tuple[Field, ...]
+    separator: str = "?"
+
+
+class ColumnSpec(NamedTuple):
+    """
+    Values are the html elements selected by an xpath per column.
+
+    The index of a field is the position of its xpath in columns, the n-th
+    element selected by it belongs to the n-th port.
+    """
+
+    columns: tuple[str, ...]
+    fields: tuple[Field, ...]
+
+
+def get_converter(field: Field) -> Callable[[Any], Any]:
+    """Return the function converting the values of field, None if missing."""
+    convert = field.convert
+    default = field.default
+    if default is REQUIRED:
+
+        def convert_required(value: Any) -> Any:
+            if value is None:
+                message = f"Field {field.name} not found."
+                raise MissingFieldError(message)
+            return convert(value)
+
+        return convert_required
+
+    def convert_or_default(value: Any) -> Any:
+        if value is None:
+            return default
+        try:
+            return convert(value)
+        except CONVERSION_ERRORS:
+            return default
+
+    return convert_or_default
+
+
+def pad_values(
+    fields: tuple[Field, ...], values: dict[str, list], ports: int | None
+) -> dict[str, list]:
+    """
+    Fit the values of fields to the number of ports.
+
+    Values of rows beyond the number of ports are dropped, fields with a
+    default are extended with it.
+    """
+    if ports is None:
+        return values
+    for field in fields:
+        column = values[field.name]
+        del column[ports:]
+        if field.default is not REQUIRED:
+            column.extend([field.default] * (ports - len(column)))
+    return values
+
+
+class TableExtractor:
+    """Extract the fields of a TableSpec, walking the cells of every row once."""
+
+    def __init__(self, spec: TableSpec) -> None:
+        """Initialize TableExtractor Object."""
+        self.spec = spec
+        self._rows = etree.XPath(spec.rows)
+        self._converters = [(field, get_converter(field)) for field in spec.fields]
+        # only cells with these tags are visited
+        self._tags = tuple(dict.fromkeys(field.tag for field in spec.fields))
+
+    def _get_cells_by_tag(self, row: etree._Element) -> dict[str, list]:
+        cells_by_tag = {tag: list(row.iterchildren(tag)) for tag in self._tags}
+        if self.spec.cells == CELLS_FOLLOWING:
+            for sibling in row.itersiblings(row.tag, *self._tags):
+                if sibling.tag == row.tag:
+                    break
+                cells_by_tag[sibling.tag].append(sibling)
+        return cells_by_tag
+
+    def _get_record(self, row: etree._Element) -> list:
+        """Return the value of every field in row, None for missing cells."""
+        cells_by_tag = self._get_cells_by_tag(row)
+        record = []
+        for field in self.spec.fields:
+            cells = cells_by_tag[field.tag]
+            if field.index >= len(cells):
+                record.append(None)
+            elif field.attribute is None:
+                record.append(cells[field.index].text)
+            else:
+                record.append(cells[field.index].get(field.attribute))
+        return record
+
+    def extract(
+        self, page: Response | BaseResponse, ports: int | None = None
+    ) -> dict[str, list]:
+        """Return the values of every field, one per row, in document order."""
+        records = [self._get_record(row) for row in self._rows(get_page_tree(page))]
+        values = {
+            field.name: [convert(record[column]) for record in records]
+            for column, (field, convert) in enumerate(self._converters)
+        }
+        return pad_values(self.spec.fields, values, ports)
+
+
+class PatternExtractor:
+    """Extract the fields of a PatternSpec in one pass of the regex."""
+
+    def __init__(self, spec: PatternSpec) -> None:
+        """Initialize PatternExtractor Object."""
+        self.spec = spec
+        self._pattern = re.compile(spec.pattern)
+        self._converters = [(field, get_converter(field)) for field in spec.fields]
+
+    def extract(
+        self, page: Response | BaseResponse, ports: int | None = None
+    ) -> dict[str, list]:
+        """Return the values of every field, one per match, in page order."""
+        separator = self.spec.separator
+        records = [
+            (*groups[:-1], *groups[-1].split(separator))
+            for groups in map(
+                re.Match.groups, self._pattern.finditer(page.content.decode("utf8"))
+            )
+        ]
+        values = {
+            field.name: [
+                convert(record[field.index] if field.index < len(record) else None)
+                for record in records
+            ]
+            for field, convert in self._converters
+        }
+        return pad_values(self.spec.fields, values, ports)
+
+
+class ColumnExtractor:
+    """Extract the fields of a ColumnSpec with one xpath query per column."""
+
+    def __init__(self, spec: ColumnSpec) -> None:
+        """Initialize ColumnExtractor Object."""
+        self.spec = spec
+        self._columns = [etree.XPath(column) for column in spec.columns]
+        self._converters = [(field, get_converter(field)) for field in spec.fields]
+
+    def extract(
+        self, page: Response | BaseResponse, ports: int | None = None
+    ) -> dict[str, list]:
+        """Return the values of every field, one per element, in document order."""
+        tree = get_page_tree(page)
+        columns = [column(tree) for column in self._columns]
+        values = {
+            field.name: [
+                convert(
+                    cell.text if field.attribute is None else cell.get(field.attribute)
+                )
+                for cell in columns[field.index]
+            ]
+            for field, convert in self._converters
+        }
+        return pad_values(self.spec.fields, values, ports)
+
+
+@cache
+def compile_spec(
+    spec: TableSpec | PatternSpec | ColumnSpec,
+) -> TableExtractor | PatternExtractor | ColumnExtractor:
+    """Compile a spec into its extractor once, on its first use."""
+    if isinstance(spec, PatternSpec):
+        return PatternExtractor(spec)
+    if isinstance(spec, ColumnSpec):
+        return ColumnExtractor(spec)
+    return TableExtractor(spec)
@@ -1,7 +1,10 @@
 """HTML page retrieval classes."""
 
 import logging
+import threading
+import time
 from contextlib import suppress
+from http.cookiejar import DefaultCookiePolicy
 from pathlib import Path
 from typing import Any
 
@@ -9,20 +12,32 @@ import requests
 import requests.cookies
 from lxml import html
 from requests import Response
+from requests.adapters import HTTPAdapter
 
+from py_netgear_plus.circuit_breaker import (
+    PROBE_TIMEOUT,
+    STATE_HALF_OPEN,
+    CircuitBreaker,
+)
 from py_netgear_plus.models import (
     AutodetectedSwitchModel,
     InvalidCryptFunctionError,
     SwitchModelNotDetectedError,
 )
 from py_netgear_plus.netgear_crypt import hex_hmac_md5, merge_hash
+from py_netgear_plus.pacer import AdaptivePacer
 
 DEFAULT_PAGE = "index.htm"
 URL_REQUEST_TIMEOUT = 15
+# keep-alive connection pool settings
+DEFAULT_POOL_MAXSIZE = 4
+DEFAULT_POOL_IDLE_TIMEOUT = 30
 status_code_ok = requests.codes.ok
 status_code_not_found = requests.codes.not_found
 status_code_no_response = requests.codes.no_response
 status_code_unauthorized = requests.codes.unauthorized
+# lower case byte signatures of the pages returned for an expired session
+LOGIN_REDIRECT_SIGNATURES = (b"redirect to login", b"/wmi/login")
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,6 +46,10 @@ class PageFetcherConnectionError(Exception):
     """Connection reset while requesting page."""
 
 
+class PageFetcherCircuitOpenError(PageFetcherConnectionError):
+    """Request not sent, the switch did not respond to recent requests."""
+
+
 class LoginFailedError(Exception):
     """Invalid credentials."""
 
@@ -56,17 +75,78 @@ class BaseResponse:
         self.content = b""
         self.cookies = requests.cookies.RequestsCookieJar()
 
+    @classmethod
+    def from_response(cls, response: Response) -> "BaseResponse":
+        """Create BaseResponse Object from a requests response."""
+        base_response = cls()
+        base_response.status_code = response.status_code
+        base_response.content = response.content
+        base_response.cookies = response.cookies
+        return base_response
+
+    @property
+    def content(self) -> bytes | str:
+        """Return the body of the response."""
+        return self._content
+
+    @content.setter
+    def content(self, content: bytes | str) -> None:
+        """Set the body of the response and drop its parsed html tree."""
+        self._content = content
+        self._tree = None
+
+    @property
+    def tree(self) -> html.HtmlElement:
+        """Return the html tree of the body, parsed on first access."""
+        if self._tree is None:
+            self._tree = html.fromstring(self._content)
+        return self._tree
+
     def __bool__(self) -> bool:
         """Return True if status code is 200."""
         return self.status_code == status_code_ok
 
 
-class PageFetcher:
-    """Class to fetch html pages from switch (or file)."""
+def get_page_tree(page: Response | BaseResponse) -> html.HtmlElement:
+    """Return the html tree of a page, parsed only once for a BaseResponse."""
+    if isinstance(page, BaseResponse):
+        return page.tree
+    return html.fromstring(page.content)
 
-    def __init__(self, host: str) -> None:
-        """Initialize PageFetcher Object."""
+
+def may_be_login_redirect(content: bytes | str) -> bool:
+    """Return False if content can not be a redirect to the login page."""
+    if isinstance(content, str):
+        content = content.encode(errors="ignore")
+    content = content.lower()
+    return any(signature in content for signature in LOGIN_REDIRECT_SIGNATURES)
+
+
+class BasePageFetcher:
+    """
+    State and request handling shared by PageFetcher and AsyncPageFetcher.
+
+    Holds the login cookie, the cached login page and the offline mode, and
+    prepares and checks requests. Sending them is up to the subclasses.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_idle_timeout: float = DEFAULT_POOL_IDLE_TIMEOUT,
+    ) -> None:
+        """Initialize BasePageFetcher Object."""
         self.host = host
+        # keep-alive session, created on first request
+        self.pool_maxsize = pool_maxsize
+        self.pool_idle_timeout = pool_idle_timeout
+        self._session = None
+        self._session_used = False
+        # adapts the pause between requests to the switch
+        self.pacer = AdaptivePacer()
+        # fails fast while the switch does not respond
+        self.circuit_breaker = CircuitBreaker()
         # cached login page response
         self._login_page_response = None
         self._password_hash = None
@@ -88,41 +168,25 @@ class PageFetcher:
         """Turn on online mode."""
         self.offline_mode = False
 
-    def check_login_url(self, switch_model: type[AutodetectedSwitchModel]) -> bool:
-        """Check and cache login page."""
-        templates = switch_model.AUTODETECT_TEMPLATES
-        for template in templates:
-            url = template["url"].format(ip=self.host)
-            if self.offline_mode:
-                _LOGGER.debug(
-                    "[PageFetcher.check_login_url] reading %s from file.", url
-                )
-                self._login_page_response = self.get_page_from_file(url)
-            else:
-                method = template["method"]
-                allow_redirects = False
-                timeout = URL_REQUEST_TIMEOUT
-                _LOGGER.debug(
-                    "[PageFetcher.check_login_url] calling request for %s %s"
-                    " with allow_directs=%s, timeout=%d",
-                    method.upper(),
-                    url,
-                    allow_redirects,
-                    timeout,
-                )
-                with suppress(
-                    requests.exceptions.Timeout,
-                    requests.exceptions.ConnectionError,
-                    requests.exceptions.ChunkedEncodingError,
-                ):
-                    self._login_page_response = requests.request(
-                        method, url, allow_redirects=allow_redirects, timeout=timeout
-                    )
-
-            if self.has_ok_status(self._login_page_response):
-                return True
-        message = f"Failed to load any page of templates: {templates}"
-        raise PageNotLoadedError(message)
+    def _check_circuit(self, kwargs: dict[str, Any]) -> bool:
+        """
+        Fail fast while the circuit is open, shorten the timeout of a probe.
+
+        Return True if the request is the probe of a half-open circuit, the
+        sender releases it when done.
+        """
+        if not self.circuit_breaker.allow_request():
+            message = (
+                f"Switch {self.host} did not respond, "
+                f"retrying in {self.circuit_breaker.retry_after:.0f}s."
+            )
+            raise PageFetcherCircuitOpenError(message)
+        if self.circuit_breaker.state == STATE_HALF_OPEN:
+            kwargs["timeout"] = min(
+                kwargs.get("timeout", URL_REQUEST_TIMEOUT), PROBE_TIMEOUT
+            )
+            return True
+        return False
 
     def get_login_page_response(self) -> Response | BaseResponse | None:
         """Return cached login page."""
@@ -195,13 +259,13 @@ class PageFetcher:
                     )
                     raise EmptyTemplateParameterError(message)
 
-    def get_login_response(
+    def _prepare_login_request(
         self,
         switch_model: type[AutodetectedSwitchModel],
         login_password: str,
         rand: str | None,
-    ) -> Response | BaseResponse:
-        """Login and save returned cookie."""
+    ) -> tuple[str, str, dict]:
+        """Hash the password and return method, url and data for the login."""
         if not switch_model or switch_model.MODEL_NAME == "":
             raise SwitchModelNotDetectedError
         if switch_model.CRYPT_FUNCTION == "merge_hash" and not rand:
@@ -222,32 +286,34 @@ class PageFetcher:
             )
         else:
             raise InvalidCryptFunctionError(switch_model.CRYPT_FUNCTION)
-        response = None
         template = switch_model.LOGIN_TEMPLATE
         url = template["url"].format(ip=self.host)
         method = template["method"]
         data = {}
         self.set_data_from_template(template, self, data)
-        allow_redirects = True
-        response = self.request(method, url, data=data, allow_redirects=allow_redirects)
-        if not response or response.status_code != status_code_ok:
-            raise LoginFailedError
-
-        return response
+        return (method, url, data)
 
     def _is_authenticated(self, response: Response | BaseResponse) -> bool:
         """Check for redirect to login when not authenticated (anymore)."""
         if "content" in dir(response) and response.content:
-            title = html.fromstring(response.content).xpath("//title")
+            # Only build the html tree if a login redirect is possible at all
+            if not may_be_login_redirect(response.content):
+                return True
+            return self._is_authenticated_tree(response)
+        return True
+
+    def _is_authenticated_tree(self, response: Response | BaseResponse) -> bool:
+        """Check the html tree for a redirect to login."""
+        if "content" in dir(response) and response.content:
+            tree = get_page_tree(response)
+            title = tree.xpath("//title")
             if len(title) and title[0].text.lower() == "redirect to login":
                 _LOGGER.info(
                     "[PageFetcher._is_authenticated] Returning false: title=%s",
                     title[0].text.lower(),
                 )
                 return False
-            script = html.fromstring(response.content).xpath(
-                '//script[contains(text(),"/wmi/login")]'
-            )
+            script = tree.xpath('//script[contains(text(),"/wmi/login")]')
             if len(script) > 0 and 'top.location.href = "/wmi/login"' in script[0].text:
                 _LOGGER.info(
                     "[PageFetcher._is_authenticated] Returning false: script=%s",
@@ -256,6 +322,177 @@ class PageFetcher:
                 return False
         return True
 
+    def has_ok_status(self, response: Response | BaseResponse | None) -> bool:
+        """Check if response has status code 200."""
+        return response is not None and response.status_code == status_code_ok
+
+
+class PageFetcher(BasePageFetcher):
+    """Class to fetch html pages from switch (or file)."""
+
+    def __init__(
+        self,
+        host: str,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_idle_timeout: float = DEFAULT_POOL_IDLE_TIMEOUT,
+    ) -> None:
+        """Initialize PageFetcher Object."""
+        super().__init__(
+            host, pool_maxsize=pool_maxsize, pool_idle_timeout=pool_idle_timeout
+        )
+        self._session_last_used = 0.0
+        self._session_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the keep-alive session and its pooled connections."""
+        with self._session_lock:
+            self._close_session()
+
+    def _close_session(self) -> None:
+        """Close the keep-alive session, the caller holds _session_lock."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _create_session(self) -> requests.Session:
+        """Create a session with a keep-alive connection pool for the host."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        # The login cookie is passed explicitly with every request,
+        # so do not let the session collect cookies set by the switch.
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        return session
+
+    def _get_session(self) -> tuple[requests.Session, bool]:
+        """
+        Return the keep-alive session and if it was used before.
+
+        A session idle for longer than pool_idle_timeout is replaced first.
+        """
+        with self._session_lock:
+            now = time.monotonic()
+            if (
+                self._session is not None
+                and now - self._session_last_used > self.pool_idle_timeout
+            ):
+                _LOGGER.debug(
+                    "[PageFetcher._get_session] session idle for more than %ss, "
+                    "closing.",
+                    self.pool_idle_timeout,
+                )
+                self._close_session()
+            if self._session is None:
+                self._session = self._create_session()
+                self._session_used = False
+            reused = self._session_used
+            self._session_used = True
+            self._session_last_used = now
+            return self._session, reused
+
+    def _replace_session(self, session: requests.Session) -> requests.Session:
+        """Return a new session in place of session, which lost its connection."""
+        with self._session_lock:
+            # a concurrent request may have replaced it already
+            if self._session is session:
+                self._close_session()
+                self._session = self._create_session()
+                self._session_used = True
+                self._session_last_used = time.monotonic()
+            return self._session
+
+    def _send(self, method: str, url: str, **kwargs: Any) -> Response:
+        """Send paced request and feed its outcome back to pacer and breaker."""
+        probe = self._check_circuit(kwargs)
+        try:
+            self.pacer.wait()
+            start_time = time.monotonic()
+            response = self._send_on_session(method, url, **kwargs)
+        except requests.exceptions.RequestException:
+            self.pacer.record_error()
+            self.circuit_breaker.record_failure()
+            raise
+        else:
+            self.pacer.record_response(time.monotonic() - start_time)
+            self.circuit_breaker.record_success()
+            return response
+        finally:
+            # a crashed probe must not block the next one
+            if probe:
+                self.circuit_breaker.release_probe()
+
+    def _send_on_session(self, method: str, url: str, **kwargs: Any) -> Response:
+        """Send request on the keep-alive session, reconnect once if it was dropped."""
+        session, reused = self._get_session()
+        try:
+            return session.request(method, url, **kwargs)
+        except requests.exceptions.ConnectionError as error:
+            # The embedded web servers close idle sockets without notice.
+            # Only a connection that was reused can be stale, timeouts are real.
+            if not reused or isinstance(error, requests.exceptions.Timeout):
+                raise
+            _LOGGER.debug(
+                "[PageFetcher._send_on_session] connection dropped by switch, "
+                "reconnecting: %s",
+                error,
+            )
+            session = self._replace_session(session)
+            return session.request(method, url, **kwargs)
+
+    def check_login_url(self, switch_model: type[AutodetectedSwitchModel]) -> bool:
+        """Check and cache login page."""
+        templates = switch_model.AUTODETECT_TEMPLATES
+        for template in templates:
+            url = template["url"].format(ip=self.host)
+            if self.offline_mode:
+                _LOGGER.debug(
+                    "[PageFetcher.check_login_url] reading %s from file.", url
+                )
+                self._login_page_response = self.get_page_from_file(url)
+            else:
+                method = template["method"]
+                allow_redirects = False
+                timeout = URL_REQUEST_TIMEOUT
+                _LOGGER.debug(
+                    "[PageFetcher.check_login_url] calling request for %s %s"
+                    " with allow_directs=%s, timeout=%d",
+                    method.upper(),
+                    url,
+                    allow_redirects,
+                    timeout,
+                )
+                with suppress(
+                    requests.exceptions.Timeout,
+                    requests.exceptions.ConnectionError,
+                    requests.exceptions.ChunkedEncodingError,
+                    PageFetcherCircuitOpenError,
+                ):
+                    self._login_page_response = self._send(
+                        method, url, allow_redirects=allow_redirects, timeout=timeout
+                    )
+
+            if self.has_ok_status(self._login_page_response):
+                return True
+        message = f"Failed to load any page of templates: {templates}"
+        raise PageNotLoadedError(message)
+
+    def get_login_response(
+        self,
+        switch_model: type[AutodetectedSwitchModel],
+        login_password: str,
+        rand: str | None,
+    ) -> Response | BaseResponse:
+        """Login and save returned cookie."""
+        method, url, data = self._prepare_login_request(
+            switch_model, login_password, rand
+        )
+        response = self.request(method, url, data=data, allow_redirects=True)
+        if not response or response.status_code != status_code_ok:
+            raise LoginFailedError
+
+        return response
+
     def request(
         self,
         method: str,
@@ -264,7 +501,7 @@ class PageFetcher:
         timeout: int = 0,
         allow_redirects: bool = False,  # noqa: FBT001, FBT002
     ) -> Response | BaseResponse:
-        """Make authenticated requests with requests.request."""
+        """Make authenticated requests on the keep-alive session."""
         if self.offline_mode:
             return self.get_page_from_file(url)
         if timeout == 0:
@@ -309,7 +546,8 @@ class PageFetcher:
                 timeout,
             )
         try:
-            response = requests.request(method, url, **kwargs)  # noqa: S113
+            # Parse the body at most once for the login check and the parsers
+            response = BaseResponse.from_response(self._send(method, url, **kwargs))
         except requests.exceptions.Timeout:
             return response
         except requests.exceptions.ConnectionError as error:
@@ -323,7 +561,3 @@ class PageFetcher:
         ):
             raise NotLoggedInError
         return response
-
-    def has_ok_status(self, response: Response | BaseResponse | None) -> bool:
-        """Check if response has status code 200."""
-        return response is not None and response.status_code == status_code_ok
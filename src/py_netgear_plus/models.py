@@ -1,8 +1,14 @@
 """Definitions of auto-detectable Switch models."""
 
-from typing import ClassVar
+import logging
+from functools import cache
+from importlib.metadata import entry_points
+from typing import Any, ClassVar, NamedTuple
 
-from py_netgear_plus.utils import get_all_child_classes_list
+_LOGGER = logging.getLogger(__name__)
+
+# group of the entry points of packages with more switch models
+MODEL_PLUGINS_GROUP = "py_netgear_plus.models"
 
 
 class MultipleModelsDetectedError(Exception):
@@ -21,6 +27,10 @@ class InvalidCryptFunctionError(Exception):
     """No implementation for the defined CRYPT_FUNCTION."""
 
 
+class InvalidModelRegistrationError(Exception):
+    """Model without name or with the name of another registered model."""
+
+
 class AutodetectedSwitchModel:
     """Base class definition for Netgear Plus Switch Models."""
 
@@ -33,6 +43,10 @@ class AutodetectedSwitchModel:
     POE_MAX_POWER_SINGLE_PORT = None
     POE_SCHEDULING = False
     CHECKS_AND_RESULTS: ClassVar = []
+    # Number of requests the web server of the switch handles in parallel
+    MAX_CONCURRENT_REQUESTS = 4
+    # Port statistics counters wrap around at 2**COUNTER_BITS
+    COUNTER_BITS = 64
 
     AUTODETECT_TEMPLATES: ClassVar = [
         {"method": "get", "url": "http://{ip}/login.cgi"},
@@ -109,6 +123,61 @@ class AutodetectedSwitchModel:
         return bool(self.SWITCH_REBOOT_TEMPLATES)
 
 
+# registered switch models in the order of registration, see register_model()
+MODELS: list[type[AutodetectedSwitchModel]] = []
+MODELS_BY_NAME: dict[str, type[AutodetectedSwitchModel]] = {}
+
+
+def register_model(
+    switch_model: type[AutodetectedSwitchModel],
+) -> type[AutodetectedSwitchModel]:
+    """Register a switch model for autodetection, use as class decorator."""
+    model_name = switch_model.MODEL_NAME
+    registered_model = MODELS_BY_NAME.get(model_name)
+    if registered_model is switch_model:
+        return switch_model
+    if not model_name or registered_model is not None:
+        message = f"Cannot register {switch_model.__name__} as {model_name!r}"
+        raise InvalidModelRegistrationError(message)
+    MODELS.append(switch_model)
+    MODELS_BY_NAME[model_name] = switch_model
+    return switch_model
+
+
+@cache
+def load_model_plugins() -> None:
+    """
+    Load the entry points of the MODEL_PLUGINS_GROUP once.
+
+    An entry point names a model class, which is registered, or a module
+    registering its models and their parsers when it is imported. Plugins
+    failing to load are logged and skipped.
+    """
+    for entry_point in entry_points(group=MODEL_PLUGINS_GROUP):
+        try:
+            plugin = entry_point.load()
+            if isinstance(plugin, type) and issubclass(plugin, AutodetectedSwitchModel):
+                register_model(plugin)
+        except Exception:
+            _LOGGER.exception(
+                "[load_model_plugins] failed to load model plugin %s",
+                entry_point.value,
+            )
+
+
+def get_models() -> tuple[type[AutodetectedSwitchModel], ...]:
+    """Return the registered models, with those of plugins, in autodetect order."""
+    load_model_plugins()
+    return tuple(MODELS)
+
+
+def get_model(model_name: str) -> type[AutodetectedSwitchModel] | None:
+    """Return the registered model with a name, None if there is none."""
+    load_model_plugins()
+    return MODELS_BY_NAME.get(model_name)
+
+
+@register_model
 class GS105E(AutodetectedSwitchModel):
     """Definition for Netgear GS105E model."""
 
@@ -120,6 +189,7 @@ class GS105E(AutodetectedSwitchModel):
     ]
 
 
+@register_model
 class GS105Ev2(AutodetectedSwitchModel):
     """Definition for Netgear GS105Ev2 model."""
 
@@ -144,6 +214,7 @@ class GS105Ev2(AutodetectedSwitchModel):
     LOGOUT_TEMPLATES: ClassVar = [{"method": "get", "url": "http://{ip}/logout.cgi"}]
 
 
+@register_model
 class GS105PE(GS105Ev2):
     """Definition for Netgear GS105PE model."""
 
@@ -155,6 +226,7 @@ class GS105PE(GS105Ev2):
     ]
 
 
+@register_model
 class GS108E(AutodetectedSwitchModel):
     """Definition for Netgear GS108E model."""
 
@@ -171,6 +243,7 @@ class GS108E(AutodetectedSwitchModel):
     ALLOWED_COOKIE_TYPES: ClassVar = ["GS108SID", "SID"]
 
 
+@register_model
 class GS108Ev3(AutodetectedSwitchModel):
     """Definition for Netgear GS108Ev3 model."""
 
@@ -197,6 +270,7 @@ class GS108Ev3(AutodetectedSwitchModel):
     ALLOWED_COOKIE_TYPES: ClassVar = ["GS108SID", "SID"]
 
 
+@register_model
 class GS108Ev4(AutodetectedSwitchModel):
     """Definition for Netgear GW108Ev4 model."""
 
@@ -222,6 +296,7 @@ class GS108Ev4(AutodetectedSwitchModel):
     ALLOWED_COOKIE_TYPES: ClassVar = ["GS108SID", "SID"]
 
 
+@register_model
 class GS108PEv3(AutodetectedSwitchModel):
     """Definition for Netgear GS108PEv3 model."""
 
@@ -241,6 +316,7 @@ class GS108PEv3(AutodetectedSwitchModel):
     ALLOWED_COOKIE_TYPES: ClassVar = ["GS108SID", "SID"]
 
 
+@register_model
 class GS305E(AutodetectedSwitchModel):
     """Definition for Netgear GS305E model."""
 
@@ -266,6 +342,7 @@ class GS305E(AutodetectedSwitchModel):
     ]
 
 
+@register_model
 class GS308E(AutodetectedSwitchModel):
     """Definition for Netgear GS308E model."""
 
@@ -285,6 +362,7 @@ class GS308E(AutodetectedSwitchModel):
     ALLOWED_COOKIE_TYPES: ClassVar = ["GS108SID", "SID"]
 
 
+@register_model
 class GS308Ev4(GS108Ev4):
     """Definition for Netgear GS308Ev3 model."""
 
@@ -343,6 +421,7 @@ class EMxSeries(AutodetectedSwitchModel):
     ]
 
 
+@register_model
 class GS110EMX(EMxSeries):
     """Definition for Netgear GS110EMX model."""
 
@@ -354,6 +433,7 @@ class GS110EMX(EMxSeries):
     ]
 
 
+@register_model
 class XS512EM(EMxSeries):
     """Definition for Netgear XS512EM model."""
 
@@ -455,6 +535,7 @@ class GS30xEPxSeries(GS30xSeries):
         }
 
 
+@register_model
 class GS305EP(GS30xEPxSeries):
     """Definition for Netgear GS305EP model."""
 
@@ -468,6 +549,7 @@ class GS305EP(GS30xEPxSeries):
     ]
 
 
+@register_model
 class GS305EPP(GS30xEPxSeries):
     """Definition for Netgear GS305EPP model."""
 
@@ -481,6 +563,7 @@ class GS305EPP(GS30xEPxSeries):
     ]
 
 
+@register_model
 class GS308EP(GS30xSeries):
     """Definition for Netgear GS308EP model."""
 
@@ -494,6 +577,7 @@ class GS308EP(GS30xSeries):
     ]
 
 
+@register_model
 class GS308EPP(GS30xEPxSeries):
     """Definition for Netgear GS308EP model."""
 
@@ -628,6 +712,7 @@ class GS316Series(GS30xSeries):
         }
 
 
+@register_model
 class GS316EP(GS316Series):
     """Definition for Netgear GS316EP model."""
 
@@ -640,6 +725,7 @@ class GS316EP(GS316Series):
     ]
 
 
+@register_model
 class GS316EPP(GS316EP):
     """Definition for Netgear GS316EPP model."""
 
@@ -684,6 +770,7 @@ class JGSxxxSeries(AutodetectedSwitchModel):
     ]
 
 
+@register_model
 class JGS516PE(JGSxxxSeries):
     """Definition for Netgear JGS516PE model."""
 
@@ -695,6 +782,7 @@ class JGS516PE(JGSxxxSeries):
     ]
 
 
+@register_model
 class JGS524Ev2(JGSxxxSeries):
     """Definition for Netgear JGS524Ev2 model."""
 
@@ -706,6 +794,7 @@ class JGS524Ev2(JGSxxxSeries):
     ]
 
 
+@register_model
 class GS116Ev2(JGSxxxSeries):
     """Definition for Netgear GS116Ev2 model."""
 
@@ -718,4 +807,38 @@ class GS116Ev2(JGSxxxSeries):
     ]
 
 
-MODELS = get_all_child_classes_list(AutodetectedSwitchModel, "MODEL_NAME")
+class AutodetectCheck(NamedTuple):
+    """Models running an autodetect check, by the result they expect."""
+
+    # indices of the models that run the check
+    models: frozenset[int]
+    # indices of the models passing the check, by result
+    models_by_result: dict[Any, frozenset[int]]
+
+
+@cache
+def get_autodetect_index(
+    models: tuple[type[AutodetectedSwitchModel], ...],
+) -> dict[str, AutodetectCheck]:
+    """Return the autodetect checks of models, each distinct check once."""
+    models_by_check: dict[str, set[int]] = {}
+    models_by_result: dict[str, dict[Any, set[int]]] = {}
+    for model_index, switch_model in enumerate(models):
+        for func_name, expected_results in switch_model().get_autodetect_funcs():
+            models_by_check.setdefault(func_name, set()).add(model_index)
+            for expected_result in expected_results:
+                models_by_result.setdefault(func_name, {}).setdefault(
+                    expected_result, set()
+                ).add(model_index)
+    return {
+        func_name: AutodetectCheck(
+            models=frozenset(model_indices),
+            models_by_result={
+                result: frozenset(result_model_indices)
+                for result, result_model_indices in models_by_result.get(
+                    func_name, {}
+                ).items()
+            },
+        )
+        for func_name, model_indices in models_by_check.items()
+    }
@@ -10,8 +10,8 @@ Usage:
     ngp-cli [--password <password>] [options] <command>
 
 Commands:
-    login <host>      Log in to the switch and save the cookie for future commands.
-    logout            Log out from the switch and delete the saved cookie.
+    login <host>      Log in to the switch and save the session for future commands.
+    logout            Log out from the switch and delete the saved session.
     identify          Identify the switch model.
     status            Display the current status of the switch.
     collect           Collect a full set of data from the switch for testing.
@@ -34,6 +34,8 @@ Environment Variables:
 
 """
 
+from __future__ import annotations
+
 import argparse
 import json
 import logging
@@ -41,58 +43,127 @@ import os
 import time
 from pathlib import Path
 from sys import stderr
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from py_netgear_plus import (
-    LoginFailedError,
-    NetgearSwitchConnector,
-    SwitchModelNotDetectedError,
-)
 from py_netgear_plus import (
     __version__ as ngp_version,
 )
+from py_netgear_plus.storage import DEFAULT_SESSION_FILE, FileSessionStore
+
+if TYPE_CHECKING:
+    # the connector is imported by the commands that talk to a switch,
+    # `ngp-cli version` and `ngp-cli --help` do not need requests and lxml
+    from py_netgear_plus.connector import NetgearSwitchConnector
+
+# single-host cookie file of ngp-cli before the session store
+LEGACY_COOKIE_FILE = Path.home() / ".netgear_plus_cookie"
 
-COOKIE_FILE = Path.home() / ".netgear_plus_cookie"
+
+def get_session_store(filename: Path = DEFAULT_SESSION_FILE) -> FileSessionStore:
+    """Return the store of the login sessions shared with the library."""
+    return FileSessionStore(filename)
 
 
 def save_cookie(
-    connector: NetgearSwitchConnector, filename: Path = COOKIE_FILE
+    connector: NetgearSwitchConnector, filename: Path = DEFAULT_SESSION_FILE
 ) -> bool:
-    """Save the authentication cookie and host to a file."""
-    with Path(filename).open("w") as f:
-        (cookie_name, cookie_content) = connector.get_cookie()
-        json.dump(
-            {
-                "cookie_name": cookie_name,
-                "cookie_content": cookie_content,
-                "host": connector.host,
-            },
-            f,
-        )
-        return True
-    return False
+    """Save the authentication cookie of the host to the session store."""
+    (cookie_name, cookie_content) = connector.get_cookie()
+    if not cookie_name or not cookie_content:
+        return False
+    get_session_store(filename).save(
+        connector.host,
+        {
+            "model": connector.switch_model.MODEL_NAME,
+            "cookie_name": cookie_name,
+            "cookie_content": cookie_content,
+        },
+    )
+    return True
 
 
 def load_cookie(
-    connector: NetgearSwitchConnector, filename: Path = COOKIE_FILE
+    connector: NetgearSwitchConnector, filename: Path = DEFAULT_SESSION_FILE
 ) -> bool:
-    """Load the authentication cookie and host from a file."""
-    if Path(filename).exists():
-        with Path(filename).open("r") as f:
-            data = json.load(f)
-            connector.set_cookie(data.get("cookie_name"), data.get("cookie_content"))
-            connector.host = data.get("host")
-            return True
-    return False
+    """Load the authentication cookie of the host from the session store."""
+    session = get_session_store(filename).load(connector.host)
+    if session is None:
+        return False
+    connector.set_cookie(session["cookie_name"], session["cookie_content"])
+    return True
+
+
+def delete_cookie(
+    connector: NetgearSwitchConnector, filename: Path = DEFAULT_SESSION_FILE
+) -> None:
+    """Delete the authentication cookie of the host from the session store."""
+    get_session_store(filename).delete(connector.host)
+
+
+def migrate_cookie_file(
+    cookie_file: Path = LEGACY_COOKIE_FILE, filename: Path = DEFAULT_SESSION_FILE
+) -> bool:
+    """
+    Move the session of the old single-host cookie file to the session store.
+
+    The old file does not have the model of the switch, which is detected from
+    the login page of the host. A session of a switch that cannot be detected
+    is dropped, the next login saves a new one. A newer session of the host in
+    the store is kept.
+    """
+    if not cookie_file.exists():
+        return False
+    try:
+        with cookie_file.open("r") as file:
+            data = json.load(file)
+    except (OSError, ValueError):
+        return False
+    if not isinstance(data, dict) or not all(
+        isinstance(data.get(key), str) and data[key]
+        for key in ("host", "cookie_name", "cookie_content")
+    ):
+        return False
+    store = get_session_store(filename)
+    migrated = store.load(data["host"]) is not None
+    if not migrated:
+        model_name = detect_model_name(data["host"])
+        if model_name:
+            store.save(
+                data["host"],
+                {
+                    "model": model_name,
+                    "cookie_name": data["cookie_name"],
+                    "cookie_content": data["cookie_content"],
+                },
+            )
+            migrated = True
+    cookie_file.unlink()
+    return migrated
+
+
+def detect_model_name(host: str) -> str | None:
+    """Return the model name of the switch at host, None if not detected."""
+    from py_netgear_plus.connector import NetgearSwitchConnector  # noqa: PLC0415
+    from py_netgear_plus.models import (  # noqa: PLC0415
+        MultipleModelsDetectedError,
+        SwitchModelNotDetectedError,
+    )
+
+    connector = NetgearSwitchConnector(host, "")
+    try:
+        return connector.autodetect_model().MODEL_NAME
+    except (MultipleModelsDetectedError, SwitchModelNotDetectedError):
+        return None
+    finally:
+        connector.close()
 
 
 def get_saved_host() -> str | None:
-    """Retrieve the saved host from the cookie file."""
-    if Path(COOKIE_FILE).exists():
-        with Path(COOKIE_FILE).open("r") as f:
-            data = json.load(f)
-            return data.get("host")
-    return None
+    """Retrieve the host of the most recently saved session."""
+    sessions = get_session_store().load_all()
+    if not sessions:
+        return None
+    return max(sessions, key=lambda host: sessions[host].get("saved_at", 0))
 
 
 def save_switch_infos(path_prefix: str, switch_infos: dict) -> None:
@@ -208,11 +279,18 @@ def command_chooser(
     args: argparse.Namespace, command_functions: dict[str, Any]
 ) -> None:
     """Choose the appropriate command function based on the command-line arguments."""
+    from py_netgear_plus.connector import (  # noqa: PLC0415
+        LoginFailedError,
+        NetgearSwitchConnector,
+    )
+
+    migrate_cookie_file()
     connector = None
     if args.command == "login":
         if not args.password:
             print("Password is required for login.", file=stderr)  # noqa: T201
             return
+        # An explicit login does not reuse a saved session
         connector = NetgearSwitchConnector(args.host, args.password)
     elif args.command == "identify":
         host = args.host or get_saved_host()
@@ -225,14 +303,15 @@ def command_chooser(
         if not saved_host:
             print("Host not found. Please login first.", file=stderr)  # noqa: T201
             return
-        connector = NetgearSwitchConnector(saved_host, args.password)
+        connector = NetgearSwitchConnector(
+            saved_host, args.password, session_store=get_session_store()
+        )
 
     try:
         command_functions[args.command](connector, args)
     except LoginFailedError:
         print("Invalid credentials. Please login again.", file=stderr)  # noqa: T201
-        if Path.exists(COOKIE_FILE):
-            Path(COOKIE_FILE).unlink()
+        delete_cookie(connector)
 
 
 def collect_command(
@@ -279,6 +358,8 @@ def identify_command(
     args: argparse.Namespace,
 ) -> bool:
     """Identify the switch model and print the model name."""
+    from py_netgear_plus.connector import SwitchModelNotDetectedError  # noqa: PLC0415
+
     del args
     try:
         model = connector.autodetect_model()
@@ -292,6 +373,8 @@ def identify_command(
 
 def login_command(connector: NetgearSwitchConnector, args: argparse.Namespace) -> bool:
     """Attempt to login and save the cookie."""
+    from py_netgear_plus.connector import LoginFailedError  # noqa: PLC0415
+
     try:
         if connector.get_login_cookie() and save_cookie(connector):
             if args.verbose:
@@ -308,10 +391,10 @@ def logout_command(
 ) -> bool:
     """Logout from the switch and delete the cookie."""
     has_cookie = load_cookie(connector)
-    if Path.exists(COOKIE_FILE):
+    if has_cookie:
         if args.verbose:
-            print("Deleting cookie file...", file=stderr)  # noqa: T201
-        Path(COOKIE_FILE).unlink()
+            print("Deleting saved session...", file=stderr)  # noqa: T201
+        delete_cookie(connector)
     if not has_cookie:
         print("Not logged in.", file=stderr)  # noqa: T201
         return False
@@ -376,10 +459,9 @@ def reboot_command(connector: NetgearSwitchConnector, args: argparse.Namespace)
     connector.autodetect_model()
     connector._get_switch_metadata()  # noqa: SLF001
     if connector.reboot():
-        if Path.exists(COOKIE_FILE):
-            if args.verbose:
-                print("Reboot successful. Deleting cookie file...", file=stderr)  # noqa: T201
-            Path(COOKIE_FILE).unlink()
+        if args.verbose:
+            print("Reboot successful. Deleting saved session...", file=stderr)  # noqa: T201
+        delete_cookie(connector)
         return True
     if args.verbose:
         print("Reboot failed.", file=stderr)  # noqa: T201
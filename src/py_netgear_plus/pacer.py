@@ -0,0 +1,109 @@
+"""Adaptive pacing of the requests sent to a switch."""
+
+import logging
+import threading
+import time
+
+# pause between requests before any response was measured
+DEFAULT_INTERVAL = 0.25
+# floor and ceiling of the pause between requests
+DEFAULT_MIN_INTERVAL = 0.0
+DEFAULT_MAX_INTERVAL = 5.0
+# additive decrease of the pause after a fast response
+DEFAULT_DECREASE_STEP = 0.05
+# multiplicative increase of the pause after an error or a slow response
+DEFAULT_BACKOFF_FACTOR = 2.0
+# responses taking longer than this are a sign of an overloaded switch
+DEFAULT_SLOW_RESPONSE_TIME = 2.0
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AdaptivePacer:
+    """
+    Pace the requests to a switch based on its response latency and errors.
+
+    The pause between two requests shrinks by a constant step after every
+    fast response and is multiplied after every error, timeout or slow
+    response (AIMD), always staying between min_interval and max_interval.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        interval: float = DEFAULT_INTERVAL,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        decrease_step: float = DEFAULT_DECREASE_STEP,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        slow_response_time: float = DEFAULT_SLOW_RESPONSE_TIME,
+    ) -> None:
+        """Initialize AdaptivePacer Object."""
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.decrease_step = decrease_step
+        self.backoff_factor = backoff_factor
+        self.slow_response_time = slow_response_time
+        self._interval = self._clamp(interval)
+        self._last_request_end: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def interval(self) -> float:
+        """Return the current pause between requests in seconds."""
+        return self._interval
+
+    @interval.setter
+    def interval(self, value: float) -> None:
+        """Set the current pause between requests in seconds."""
+        self._interval = self._clamp(value)
+
+    @property
+    def rate(self) -> float:
+        """Return the current maximum number of requests per second."""
+        if self._interval <= 0:
+            return float("inf")
+        return 1 / self._interval
+
+    def _clamp(self, interval: float) -> float:
+        return min(max(interval, self.min_interval), self.max_interval)
+
+    def get_delay(self) -> float:
+        """Return the time to wait before the next request may be sent."""
+        with self._lock:
+            if self._last_request_end is None:
+                return 0.0
+            elapsed = time.monotonic() - self._last_request_end
+            return max(self._interval - elapsed, 0.0)
+
+    def wait(self) -> None:
+        """Sleep until the next request may be sent."""
+        delay = self.get_delay()
+        if delay > 0:
+            time.sleep(delay)
+
+    def record_response(self, latency: float) -> None:
+        """Adapt the pause to a response received after latency seconds."""
+        if latency > self.slow_response_time:
+            _LOGGER.debug(
+                "[AdaptivePacer.record_response] slow response after %.2fs.", latency
+            )
+            self._back_off()
+            return
+        with self._lock:
+            self._interval = self._clamp(self._interval - self.decrease_step)
+            self._last_request_end = time.monotonic()
+
+    def record_error(self) -> None:
+        """Adapt the pause to a failed or timed out request."""
+        self._back_off()
+
+    def _back_off(self) -> None:
+        with self._lock:
+            self._interval = self._clamp(
+                max(self._interval, self.decrease_step) * self.backoff_factor
+            )
+            self._last_request_end = time.monotonic()
+        _LOGGER.debug(
+            "[AdaptivePacer._back_off] pause between requests raised to %.2fs.",
+            self._interval,
+        )
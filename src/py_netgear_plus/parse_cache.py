@@ -0,0 +1,107 @@
+"""Memoization of parsed pages by the digest of their content."""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+# parsed pages kept per connector
+DEFAULT_MAXSIZE = 32
+# bytes of the blake2b digest of a page, collisions are not a concern here
+DIGEST_SIZE = 16
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ParseCacheInfo(NamedTuple):
+    """Statistics of a ParseCache, like functools.lru_cache's cache_info()."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ParseCache:
+    """
+    Bounded LRU cache of parser results, keyed by page kind and page content.
+
+    A page whose bytes did not change since it was last parsed costs one hash
+    instead of a parse. Parsers keep state, e.g. the firmware version and the
+    previous port status, so the key also holds the parser state a parse
+    depends on and the parser attributes set by a parse are restored when it
+    is skipped. Cached results are shared and must not be modified by the
+    caller.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        """Initialize ParseCache Object."""
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple, tuple[Any, dict[str, Any]]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(
+        kind: str, content: bytes, args: tuple = (), state: tuple = ()
+    ) -> tuple:
+        """Return the cache key of a page of kind parsed with args in state."""
+        digest = hashlib.blake2b(content, digest_size=DIGEST_SIZE).digest()
+        return (kind, args, state, digest)
+
+    def parse(
+        self,
+        kind: str,
+        parser: Any,
+        parse: Callable[..., Any],
+        page: Any,
+        *args: Any,
+    ) -> Any:
+        """Parse page, reusing the result of a previous parse of identical content."""
+        content = getattr(page, "content", None)
+        if not isinstance(content, bytes) or not self.maxsize:
+            return parse(page, *args)
+        key = self.get_key(kind, content, args, parser.get_parse_state(kind))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+        if entry is not None:
+            result, parser_state = entry
+            for name, value in parser_state.items():
+                setattr(parser, name, value)
+            return result
+
+        previous_state = dict(vars(parser))
+        result = parse(page, *args)
+        parser_state = {
+            name: value
+            for name, value in vars(parser).items()
+            if name not in previous_state or previous_state[name] is not value
+        }
+        with self._lock:
+            self._misses += 1
+            self._entries[key] = (result, parser_state)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+    def cache_info(self) -> ParseCacheInfo:
+        """Return hits, misses, maxsize and current size of the cache."""
+        with self._lock:
+            return ParseCacheInfo(
+                self._hits, self._misses, self.maxsize, len(self._entries)
+            )
+
+    def clear(self) -> None:
+        """Forget all parsed pages and statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+        _LOGGER.debug("[ParseCache.clear] cleared.")
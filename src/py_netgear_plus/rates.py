@@ -0,0 +1,140 @@
+"""Traffic, errors and speeds of the ports between two polls of their counters."""
+
+import logging
+from array import array
+from collections.abc import Sequence
+from typing import Any
+
+from .snapshot import SwitchSnapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+# counter keys of parse_port_statistics() the increase is taken of
+DELTA_KEYS = ("traffic_rx", "traffic_tx", "crc_errors")
+SUM_KEYS = ("sum_rx", "sum_tx")
+# counters of the switches are 64 bits, unless the model says otherwise
+COUNTER_BITS = 64
+# Highpass-Filter (max 1e9 B/s = 1GB/s per port)
+MAX_PORT_SPEED = 1e9
+
+
+def unwrap_counter_delta(delta: int, max_delta: float, modulus: int) -> int:
+    """Return a negative increase across a wraparound, unchanged for a reset."""
+    wrapped_delta = delta % modulus
+    return wrapped_delta if wrapped_delta <= max_delta else delta
+
+
+def get_counter_deltas(
+    previous: Sequence[int],
+    current: Sequence[int],
+    max_delta: float,
+    counter_bits: int = COUNTER_BITS,
+) -> list[int]:
+    """
+    Return the increase of every counter since the previous poll.
+
+    A counter without previous value increased by 0. A counter lower than at
+    the previous poll either wrapped around at 2**counter_bits or was reset by
+    a reboot of the switch: the increase across the wraparound is taken if it
+    is at most max_delta, else it was a reset and the negative difference is
+    returned.
+    """
+    deltas = [
+        current_value - previous_value if previous_value else 0
+        for previous_value, current_value in zip(previous, current, strict=True)
+    ]
+    if min(deltas, default=0) >= 0:
+        return deltas
+    modulus = 2**counter_bits
+    return [
+        delta if delta >= 0 else unwrap_counter_delta(delta, max_delta, modulus)
+        for delta in deltas
+    ]
+
+
+def clip_values(values: list[Any], max_value: float) -> list[Any]:
+    """Lowpass-Filter and Highpass-Filter, limit the values to 0..max_value."""
+    if not values or (min(values) >= 0 and max(values) <= max_value):
+        return values
+    return [min(max(value, 0), max_value) for value in values]
+
+
+def update_port_rates(
+    snapshot: SwitchSnapshot,
+    previous_data: dict[str, Any],
+    current_data: dict[str, Any],
+    sample_time: float,
+    counter_bits: int = COUNTER_BITS,
+) -> None:
+    """
+    Set traffic, errors and speeds of the ports of snapshot since the previous poll.
+
+    previous_data and current_data are port statistics as returned by
+    parse_port_statistics(). Counters that were reset have a traffic and
+    speed of 0, but still reduce speed_io, as the rates always did. Negative
+    sums of connected ports fall back to the previous poll, in current_data,
+    which becomes the previous data of the next poll. Ports without counters
+    keep their values of 0.
+    """
+    sample_factor = 1 if not sample_time else 1 / sample_time
+    max_traffic = MAX_PORT_SPEED / sample_factor
+    ports = min(
+        snapshot.ports,
+        *(
+            len(data[key])
+            for data in (previous_data, current_data)
+            for key in (*DELTA_KEYS, *SUM_KEYS)
+        ),
+    )
+    if ports < snapshot.ports:
+        _LOGGER.debug("Port statistics of %s of %s ports", ports, snapshot.ports)
+
+    traffic_rx, traffic_tx, crc_errors = (
+        get_counter_deltas(
+            previous_data[key][:ports],
+            current_data[key][:ports],
+            max_traffic,
+            counter_bits,
+        )
+        for key in DELTA_KEYS
+    )
+    speed_rx = [int(traffic * sample_factor) for traffic in traffic_rx]
+    speed_tx = [int(traffic * sample_factor) for traffic in traffic_tx]
+    speed_io = [max(rx + tx, 0) for rx, tx in zip(speed_rx, speed_tx, strict=True)]
+
+    # Access old data if value is negative
+    connected = snapshot.connected
+    for key in SUM_KEYS:
+        current_sums = current_data[key]
+        if min(current_sums[:ports], default=0) >= 0:
+            continue
+        for index in range(ports):
+            if connected[index] and current_sums[index] < 0:
+                current_sums[index] = previous_data[key][index]
+                _LOGGER.info(
+                    "Fallback to previous data: port_nr=%s port_%s=%s",
+                    index + 1,
+                    key,
+                    current_sums[index],
+                )
+
+    columns = {
+        "traffic_rx": clip_values(traffic_rx, max_traffic),
+        "traffic_tx": clip_values(traffic_tx, max_traffic),
+        "speed_rx": clip_values(speed_rx, MAX_PORT_SPEED),
+        "speed_tx": clip_values(speed_tx, MAX_PORT_SPEED),
+        "speed_io": speed_io,
+        "sum_rx": current_data["sum_rx"][:ports],
+        "sum_tx": current_data["sum_tx"][:ports],
+    }
+    for name, values in columns.items():
+        getattr(snapshot, name)[:ports] = array("d", values)
+    snapshot.crc_errors[:ports] = array(
+        "q", map(int, clip_values(crc_errors, max_traffic))
+    )
+
+    snapshot.sum_port_traffic_rx = sum(columns["traffic_rx"], 0.0)
+    snapshot.sum_port_traffic_tx = sum(columns["traffic_tx"], 0.0)
+    snapshot.sum_port_speed_rx = sum(columns["speed_rx"], 0.0)
+    snapshot.sum_port_speed_tx = sum(columns["speed_tx"], 0.0)
+    snapshot.sum_port_crc_errors = sum(snapshot.crc_errors[:ports])
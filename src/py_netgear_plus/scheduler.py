@@ -0,0 +1,178 @@
+"""Polling of every kind of page of a switch at its own interval."""
+
+import asyncio
+import logging
+import threading
+import time
+from contextlib import suppress
+from typing import TYPE_CHECKING
+
+from .fetcher import (
+    LoginFailedError,
+    NotLoggedInError,
+    PageFetcherConnectionError,
+    PageNotLoadedError,
+)
+from .snapshot import (
+    POE_PORT_CONFIG,
+    POE_PORT_STATUS,
+    POLL_KINDS,
+    PORT_STATISTICS,
+    PORT_STATUS,
+    SwitchSnapshot,
+    UnknownFieldError,
+)
+
+if TYPE_CHECKING:
+    from .async_connector import AsyncNetgearSwitchConnector
+    from .connector import BaseSwitchConnector, NetgearSwitchConnector
+
+# kind of the switch metadata page, fetched once and cached by the connector
+SWITCH_METADATA = "switch_metadata"
+SCHEDULE_KINDS = (SWITCH_METADATA, *POLL_KINDS)
+# seconds between two polls of a kind of page
+DEFAULT_INTERVALS = {
+    SWITCH_METADATA: 3600.0,
+    PORT_STATUS: 10.0,
+    PORT_STATISTICS: 2.0,
+    POE_PORT_CONFIG: 30.0,
+    POE_PORT_STATUS: 30.0,
+}
+
+# errors of a poll after which run() keeps polling, PageFetcherConnectionError
+# includes the open circuit of an unreachable switch
+POLL_ERRORS = (
+    PageNotLoadedError,
+    PageFetcherConnectionError,
+    LoginFailedError,
+    NotLoggedInError,
+    TimeoutError,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BasePollScheduler:
+    """
+    Intervals and due kinds of pages shared by PollScheduler and AsyncPollScheduler.
+
+    Every poll fetches only the kinds of pages that are due and merges them
+    into the snapshot of the previous polls, so snapshot always has the
+    latest values of every kind. Kinds due at the same time share a poll.
+    A kind is due again one interval after it was last due, not after its
+    poll finished, so that slow responses do not make the polls drift.
+    """
+
+    def __init__(
+        self,
+        connector: "BaseSwitchConnector",
+        intervals: dict[str, float] | None = None,
+    ) -> None:
+        """Initialize BasePollScheduler Object."""
+        self.connector = connector
+        self.intervals = dict(DEFAULT_INTERVALS)
+        for kind, interval in (intervals or {}).items():
+            if kind not in SCHEDULE_KINDS:
+                message = f"Unknown kind of page {kind!r}"
+                raise UnknownFieldError(message)
+            self.intervals[kind] = interval
+        # time.monotonic() at which a kind of page is due again
+        self._due_times: dict[str, float] = {}
+        self._snapshot: SwitchSnapshot | None = None
+
+    @property
+    def snapshot(self) -> SwitchSnapshot | None:
+        """Return the latest values of every kind of page, None before a poll."""
+        return self._snapshot
+
+    def get_due_kinds(self) -> tuple[str, ...]:
+        """Return the kinds of pages due for a poll, all before the first poll."""
+        if not self._due_times:
+            return SCHEDULE_KINDS
+        now = time.monotonic()
+        return tuple(kind for kind in SCHEDULE_KINDS if self._due_times[kind] <= now)
+
+    def get_delay(self) -> float:
+        """Return the time until the next kind of page is due."""
+        if not self._due_times:
+            return 0.0
+        return max(min(self._due_times.values()) - time.monotonic(), 0.0)
+
+    def _get_poll_kinds(self) -> tuple[str, ...] | None:
+        """Return the kinds of pages to poll, None if no kind is due."""
+        kinds = self.get_due_kinds()
+        if not kinds:
+            return None
+        now = time.monotonic()
+        for kind in kinds:
+            interval = self.intervals[kind]
+            due_time = self._due_times.get(kind, now) + interval
+            # skip the polls missed, e.g. after a timeout
+            self._due_times[kind] = due_time if due_time > now else now + interval
+        if SWITCH_METADATA in kinds and self._snapshot is not None:
+            self.connector.clear_switch_metadata()
+        return tuple(kind for kind in kinds if kind != SWITCH_METADATA)
+
+    def _merge(self, snapshot: SwitchSnapshot) -> SwitchSnapshot:
+        """Keep snapshot with the values of the kinds of pages it was not polled for."""
+        if self._snapshot is not None:
+            snapshot.merge(self._snapshot)
+        self._snapshot = snapshot
+        return snapshot
+
+
+class PollScheduler(BasePollScheduler):
+    """Poll each kind of page of a switch at its own interval."""
+
+    connector: "NetgearSwitchConnector"
+
+    def poll(self) -> SwitchSnapshot | None:
+        """
+        Poll the kinds of pages due and return the merged snapshot.
+
+        Errors of the connector are raised. The kinds of pages of a failed poll
+        keep their previous values and are polled again when next due.
+        """
+        kinds = self._get_poll_kinds()
+        if kinds is None:
+            return self._snapshot
+        _LOGGER.debug("[PollScheduler.poll] polling %s", kinds)
+        return self._merge(self.connector.get_switch_snapshot(kinds))
+
+    def run(self, stop_event: threading.Event) -> None:
+        """
+        Poll the kinds of pages when they are due until stop_event is set.
+
+        Failed polls, e.g. of an unreachable switch, are logged and their kinds
+        of pages are polled again when next due.
+        """
+        while not stop_event.is_set():
+            try:
+                self.poll()
+            except POLL_ERRORS as error:
+                _LOGGER.warning("[PollScheduler.run] poll failed: %r", error)
+            stop_event.wait(self.get_delay())
+
+
+class AsyncPollScheduler(BasePollScheduler):
+    """Poll each kind of page of a switch at its own interval with asyncio."""
+
+    connector: "AsyncNetgearSwitchConnector"
+
+    async def poll(self) -> SwitchSnapshot | None:
+        """Poll the kinds of pages due and return the merged snapshot."""
+        kinds = self._get_poll_kinds()
+        if kinds is None:
+            return self._snapshot
+        _LOGGER.debug("[AsyncPollScheduler.poll] polling %s", kinds)
+        return self._merge(await self.connector.get_switch_snapshot(kinds))
+
+    async def run(self, stop_event: asyncio.Event) -> None:
+        """Poll the kinds of pages when they are due until stop_event is set."""
+        while not stop_event.is_set():
+            try:
+                await self.poll()
+            except POLL_ERRORS as error:
+                _LOGGER.warning("[AsyncPollScheduler.run] poll failed: %r", error)
+            with suppress(TimeoutError):
+                await asyncio.wait_for(stop_event.wait(), self.get_delay())
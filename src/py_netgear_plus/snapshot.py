@@ -0,0 +1,274 @@
+"""Compact representation of the statistics of a poll."""
+
+from array import array
+from collections.abc import Iterable
+from functools import cache
+from typing import Any, NamedTuple
+
+# kinds of pages fetched on a poll, in the order they are fetched
+PORT_STATUS = "port_status"
+PORT_STATISTICS = "port_statistics"
+POE_PORT_CONFIG = "poe_port_config"
+POE_PORT_STATUS = "poe_port_status"
+POLL_KINDS = (PORT_STATUS, PORT_STATISTICS, POE_PORT_CONFIG, POE_PORT_STATUS)
+POE_KINDS = (POE_PORT_CONFIG, POE_PORT_STATUS)
+
+# kind of the page of the keys of get_switch_infos(), by key suffix
+KEY_SUFFIX_KINDS = (
+    ("_poe_power_active", POE_PORT_CONFIG),
+    ("_poe_output_power", POE_PORT_STATUS),
+    ("_status", PORT_STATUS),
+    ("_modus_speed", PORT_STATUS),
+    ("_connection_speed", PORT_STATUS),
+    ("_mbytes", PORT_STATISTICS),
+    ("_crc_errors", PORT_STATISTICS),
+)
+# columns converted to megabytes in SwitchSnapshot.to_dict()
+MBYTES_COLUMNS = (
+    "traffic_rx",
+    "traffic_tx",
+    "speed_rx",
+    "speed_tx",
+    "speed_io",
+    "sum_rx",
+    "sum_tx",
+)
+SUM_COLUMNS = ("traffic_rx", "traffic_tx", "speed_rx", "speed_tx")
+# attributes of SwitchSnapshot with the values of a kind of page
+KIND_ATTRIBUTES = {
+    PORT_STATUS: ("connected", "modus_speed", "connection_speed"),
+    PORT_STATISTICS: (
+        "crc_errors",
+        *MBYTES_COLUMNS,
+        "response_time_s",
+        *(f"sum_port_{name}" for name in SUM_COLUMNS),
+        "sum_port_crc_errors",
+    ),
+}
+
+
+class UnknownFieldError(ValueError):
+    """Field is neither a key of get_switch_infos() nor a kind of page."""
+
+
+def get_field_kind(field: str) -> str | None:
+    """Return the kind of page of a field, None for the switch metadata."""
+    if field in POLL_KINDS:
+        return field
+    if field.startswith("switch_") or field == "led_status":
+        return None
+    if field.startswith("sum_port_") or field == "response_time_s":
+        return PORT_STATISTICS
+    if field.startswith("port_"):
+        for suffix, kind in KEY_SUFFIX_KINDS:
+            if field.endswith(suffix):
+                return kind
+    message = f"Unknown field {field!r}"
+    raise UnknownFieldError(message)
+
+
+def get_poll_kinds(fields: Iterable[str] | None = None) -> tuple[str, ...]:
+    """Return the kinds of pages to fetch for fields, all if fields is None."""
+    if fields is None:
+        return POLL_KINDS
+    kinds = {get_field_kind(field) for field in fields}
+    return tuple(kind for kind in POLL_KINDS if kind in kinds)
+
+
+def from_bytes_to_megabytes(v: float) -> float:
+    """Convert bytes to megabytes, rounded to 2 decimals."""
+    bytes_to_mbytes = 1e-6
+    return float(f"{round(v * bytes_to_mbytes, 2):.2f}")
+
+
+class PortKeys(NamedTuple):
+    """Keys of the values of every port in the dict of get_switch_infos()."""
+
+    status: tuple[tuple[str, str, str], ...]
+    mbytes: tuple[tuple[str, ...], ...]
+
+
+@cache
+def get_port_keys(ports: int) -> PortKeys:
+    """Return the keys of the ports of a switch, formatted once per port count."""
+    port_numbers = range(1, ports + 1)
+    return PortKeys(
+        status=tuple(
+            (
+                f"port_{port_number}_status",
+                f"port_{port_number}_modus_speed",
+                f"port_{port_number}_connection_speed",
+            )
+            for port_number in port_numbers
+        ),
+        mbytes=tuple(
+            tuple(f"port_{port_number}_{key}_mbytes" for key in MBYTES_COLUMNS)
+            for port_number in port_numbers
+        ),
+    )
+
+
+class PortSnapshot(NamedTuple):
+    """Status and statistics of one port, traffic in bytes and bytes/s."""
+
+    port: int
+    connected: bool
+    modus_speed: bool
+    connection_speed: int
+    traffic_rx: float
+    traffic_tx: float
+    crc_errors: int
+    speed_rx: float
+    speed_tx: float
+    speed_io: float
+    sum_rx: float
+    sum_tx: float
+
+
+class SwitchSnapshot:
+    """
+    Status and statistics of all ports of a switch at one poll.
+
+    Every per-port value is a column, an array with the value of port n at
+    index n - 1. Traffic is in bytes since the previous poll, speeds in
+    bytes/s and sums in bytes since the last reset of the switch counters.
+    """
+
+    __slots__ = (
+        "connected",
+        "connection_speed",
+        "crc_errors",
+        "kinds",
+        "metadata",
+        "modus_speed",
+        "poe",
+        "ports",
+        "response_time_s",
+        "speed_io",
+        "speed_rx",
+        "speed_tx",
+        "sum_port_crc_errors",
+        "sum_port_speed_rx",
+        "sum_port_speed_tx",
+        "sum_port_traffic_rx",
+        "sum_port_traffic_tx",
+        "sum_rx",
+        "sum_tx",
+        "traffic_rx",
+        "traffic_tx",
+    )
+
+    def __init__(
+        self,
+        ports: int,
+        metadata: dict[str, Any],
+        kinds: tuple[str, ...] = POLL_KINDS,
+    ) -> None:
+        """Initialize SwitchSnapshot Object with all values 0."""
+        self.ports = ports
+        # kinds of the pages polled, the values of other pages stay 0
+        self.kinds = kinds
+        # switch_ip, switch_name, switch_firmware, ... as parsed once
+        self.metadata = metadata
+        # values of the PoE pages, keyed like in get_switch_infos()
+        self.poe: dict[str, Any] = {}
+        self.response_time_s = 0.0
+
+        zeros = [0] * ports
+        self.connected = array("b", zeros)
+        self.modus_speed = array("b", zeros)
+        self.connection_speed = array("i", zeros)
+        self.crc_errors = array("q", zeros)
+        for name in MBYTES_COLUMNS:
+            setattr(self, name, array("d", zeros))
+
+        self.sum_port_traffic_rx = 0.0
+        self.sum_port_traffic_tx = 0.0
+        self.sum_port_speed_rx = 0.0
+        self.sum_port_speed_tx = 0.0
+        self.sum_port_crc_errors = 0
+
+    @property
+    def sum_port_speed_io(self) -> float:
+        """Return the speed of all ports, in and out, in bytes/s."""
+        return self.sum_port_speed_rx + self.sum_port_speed_tx
+
+    def port(self, port_number: int) -> PortSnapshot:
+        """Return the values of a port, numbered from 1."""
+        if not 1 <= port_number <= self.ports:
+            message = f"Port {port_number} not in 1..{self.ports}"
+            raise IndexError(message)
+        index = port_number - 1
+        return PortSnapshot(
+            port=port_number,
+            connected=bool(self.connected[index]),
+            modus_speed=bool(self.modus_speed[index]),
+            connection_speed=self.connection_speed[index],
+            traffic_rx=self.traffic_rx[index],
+            traffic_tx=self.traffic_tx[index],
+            crc_errors=self.crc_errors[index],
+            speed_rx=self.speed_rx[index],
+            speed_tx=self.speed_tx[index],
+            speed_io=self.speed_io[index],
+            sum_rx=self.sum_rx[index],
+            sum_tx=self.sum_tx[index],
+        )
+
+    def merge(self, previous: "SwitchSnapshot") -> "SwitchSnapshot":
+        """
+        Add the values of the pages polled for previous but not for this snapshot.
+
+        Returns this snapshot, polled for the kinds of pages of both. A previous
+        snapshot of another number of ports is ignored.
+        """
+        if previous.ports != self.ports:
+            return self
+        for kind in previous.kinds:
+            if kind in self.kinds:
+                continue
+            for name in KIND_ATTRIBUTES.get(kind, ()):
+                value = getattr(previous, name)
+                setattr(self, name, value[:] if isinstance(value, array) else value)
+        self.poe = {**previous.poe, **self.poe}
+        self.kinds = tuple(
+            kind for kind in POLL_KINDS if kind in self.kinds or kind in previous.kinds
+        )
+        return self
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the values in the flat dict returned by get_switch_infos()."""
+        switch_data = dict(self.metadata)
+        port_keys = get_port_keys(self.ports)
+
+        if PORT_STATUS in self.kinds:
+            for index, keys in enumerate(port_keys.status):
+                status_key, modus_speed_key, connection_speed_key = keys
+                switch_data[status_key] = "on" if self.connected[index] else "off"
+                switch_data[modus_speed_key] = bool(self.modus_speed[index])
+                switch_data[connection_speed_key] = self.connection_speed[index]
+
+        if PORT_STATISTICS in self.kinds:
+            self._add_statistics(switch_data, port_keys)
+
+        switch_data.update(self.poe)
+        return switch_data
+
+    def _add_statistics(self, switch_data: dict[str, Any], port_keys: PortKeys) -> None:
+        switch_data["response_time_s"] = self.response_time_s
+
+        columns = [getattr(self, name) for name in MBYTES_COLUMNS]
+        for index, mbytes_keys in enumerate(port_keys.mbytes):
+            for key, column in zip(mbytes_keys, columns, strict=True):
+                switch_data[key] = from_bytes_to_megabytes(column[index])
+
+        for name in SUM_COLUMNS:
+            switch_data[f"sum_port_{name}"] = from_bytes_to_megabytes(
+                getattr(self, f"sum_port_{name}")
+            )
+        switch_data["sum_port_speed_io"] = from_bytes_to_megabytes(
+            self.sum_port_speed_io
+        )
+        # get_switch_infos() has always had the crc errors of the last port only
+        if self.ports:
+            switch_data[f"port_{self.ports}_crc_errors"] = self.crc_errors[-1]
+        switch_data["sum_port_crc_errors"] = self.sum_port_crc_errors
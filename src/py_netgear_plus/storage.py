@@ -0,0 +1,214 @@
+"""Persistent storage of switch login sessions and detected models."""
+
+import json
+import logging
+import os
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+DEFAULT_SESSION_FILE = Path.home() / ".netgear_plus_sessions"
+DEFAULT_MODEL_FILE = Path.home() / ".netgear_plus_models"
+# seconds a saved login session is reused before logging in again
+DEFAULT_SESSION_MAX_AGE = 3600
+SESSION_KEYS = ("model", "cookie_name", "cookie_content")
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SessionStore:
+    """Base class for stores of login sessions, keyed by switch host."""
+
+    def load(self, host: str) -> dict[str, Any] | None:
+        """Return the saved session of host or None."""
+        raise NotImplementedError
+
+    def save(self, host: str, session: dict[str, Any]) -> None:
+        """Save the session of host."""
+        raise NotImplementedError
+
+    def delete(self, host: str) -> None:
+        """Delete the session of host."""
+        raise NotImplementedError
+
+
+class ModelCache:
+    """Base class for caches of detected switch models, keyed by switch host."""
+
+    def load(self, host: str) -> str | None:
+        """Return the model name detected for host or None."""
+        raise NotImplementedError
+
+    def save(self, host: str, model_name: str) -> None:
+        """Save the model name detected for host."""
+        raise NotImplementedError
+
+    def delete(self, host: str) -> None:
+        """Delete the model of host."""
+        raise NotImplementedError
+
+
+def is_valid_session(session: Any, now: float) -> bool:
+    """Check that a stored session is complete and not expired."""
+    if not isinstance(session, dict):
+        return False
+    if not all(isinstance(session.get(key), str) for key in SESSION_KEYS):
+        return False
+    expires_at = session.get("expires_at")
+    return isinstance(expires_at, int | float) and expires_at > now
+
+
+class JSONFileStore:
+    """
+    Entries of several switches in one JSON file, keyed by switch host.
+
+    The file is only readable by its owner and replaced atomically. Processes
+    sharing the file serialize their updates with a lock on a sibling file.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        """Initialize JSONFileStore Object."""
+        self.path = Path(path)
+
+    @contextmanager
+    def _lock(self, *, exclusive: bool) -> Iterator[None]:
+        """Hold a lock on the file while reading or updating it."""
+        if fcntl is None:
+            yield
+            return
+        lock_path = self.path.with_name(f"{self.path.name}.lock")
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield
+        finally:
+            os.close(fd)
+
+    def _read(self) -> dict[str, Any]:
+        try:
+            with self.path.open("r") as file:
+                entries = json.load(file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as error:
+            _LOGGER.warning(
+                "[%s._read] ignoring unreadable %s: %s",
+                type(self).__name__,
+                self.path,
+                error,
+            )
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def _write(self, entries: dict[str, Any]) -> None:
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.path.parent, prefix=f".{self.path.name}.", delete=False
+        ) as file:
+            temp_path = Path(file.name)
+            try:
+                temp_path.chmod(0o600)
+                json.dump(entries, file)
+                file.flush()
+                os.fsync(file.fileno())
+            except BaseException:
+                temp_path.unlink()
+                raise
+        temp_path.replace(self.path)
+
+
+class FileSessionStore(JSONFileStore, SessionStore):
+    """Store login sessions of several switches in one JSON file."""
+
+    def __init__(
+        self,
+        path: Path | str = DEFAULT_SESSION_FILE,
+        max_age: float = DEFAULT_SESSION_MAX_AGE,
+    ) -> None:
+        """Initialize FileSessionStore Object."""
+        super().__init__(path)
+        self.max_age = max_age
+
+    def load_all(self) -> dict[str, dict[str, Any]]:
+        """Return the valid sessions of all hosts."""
+        now = time.time()
+        with self._lock(exclusive=False):
+            sessions = self._read()
+        return {
+            host: session
+            for host, session in sessions.items()
+            if is_valid_session(session, now)
+        }
+
+    def load(self, host: str) -> dict[str, Any] | None:
+        """Return the saved session of host if it is complete and not expired."""
+        return self.load_all().get(host)
+
+    def save(self, host: str, session: dict[str, Any]) -> None:
+        """Save the session of host with its expiry time."""
+        now = time.time()
+        with self._lock(exclusive=True):
+            sessions = self._read()
+            # drop expired sessions of other hosts on the way
+            sessions = {
+                other_host: other_session
+                for other_host, other_session in sessions.items()
+                if is_valid_session(other_session, now)
+            }
+            sessions[host] = {
+                **session,
+                "saved_at": now,
+                "expires_at": now + self.max_age,
+            }
+            self._write(sessions)
+
+    def delete(self, host: str) -> None:
+        """Delete the session of host."""
+        with self._lock(exclusive=True):
+            sessions = self._read()
+            if sessions.pop(host, None) is not None:
+                self._write(sessions)
+
+
+class FileModelCache(JSONFileStore, ModelCache):
+    """
+    Cache the detected models of several switches in one JSON file.
+
+    Entries do not expire. The connector checks a cached model against the
+    first login page it fetches and detects the model again if it fails.
+    """
+
+    def __init__(self, path: Path | str = DEFAULT_MODEL_FILE) -> None:
+        """Initialize FileModelCache Object."""
+        super().__init__(path)
+
+    def load(self, host: str) -> str | None:
+        """Return the model name detected for host or None."""
+        with self._lock(exclusive=False):
+            entry = self._read().get(host)
+        if isinstance(entry, dict) and isinstance(entry.get("model"), str):
+            return entry["model"]
+        return None
+
+    def save(self, host: str, model_name: str) -> None:
+        """Save the model name detected for host."""
+        with self._lock(exclusive=True):
+            entries = self._read()
+            if entries.get(host, {}).get("model") == model_name:
+                return
+            entries[host] = {"model": model_name, "saved_at": time.time()}
+            self._write(entries)
+
+    def delete(self, host: str) -> None:
+        """Delete the model of host."""
+        with self._lock(exclusive=True):
+            entries = self._read()
+            if entries.pop(host, None) is not None:
+                self._write(entries)
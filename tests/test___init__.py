@@ -1,18 +1,23 @@
 """Unit tests for the py_netgear_plus __init__ module."""
 
 import json
+import subprocess
+import sys
+import threading
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import py_netgear_plus
 import pytest
 import requests
 import requests.cookies
-from py_netgear_plus import (
-    DEFAULT_PAGE,
-    NetgearSwitchConnector,
-    _from_bytes_to_megabytes,
+from py_netgear_plus import DEFAULT_PAGE, NetgearSwitchConnector
+from py_netgear_plus.fetcher import (
+    URL_REQUEST_TIMEOUT,
+    BaseResponse,
+    PageFetcherConnectionError,
+    PageNotLoadedError,
 )
-from py_netgear_plus.fetcher import URL_REQUEST_TIMEOUT, BaseResponse
 from py_netgear_plus.models import (
     GS105PE,
     GS110EMX,
@@ -22,6 +27,7 @@ from py_netgear_plus.models import (
     GS308EPP,
     GS316EPP,
     JGS516PE,
+    MODELS,
     XS512EM,
     AutodetectedSwitchModel,
     GS105Ev2,
@@ -30,8 +36,11 @@ from py_netgear_plus.models import (
     GS108PEv3,
     GS308Ev4,
     JGS524Ev2,
+    get_autodetect_index,
 )
 from py_netgear_plus.netgear_crypt import hex_hmac_md5, merge_hash
+from py_netgear_plus.parsers import create_page_parser
+from py_netgear_plus.snapshot import UnknownFieldError, from_bytes_to_megabytes
 
 # List of models with saved pages, extracted rand values and crypted passwords
 MODEL_PARAMETERS = [
@@ -152,12 +161,12 @@ class PyTestPageFetcher:
 
 
 def test_0_from_bytes_to_megabytes() -> None:
-    """Test cases for _from_bytes_to_megabytes function."""
-    assert _from_bytes_to_megabytes(1000000) == 1.00
-    assert _from_bytes_to_megabytes(5000000) == 5.00
-    assert _from_bytes_to_megabytes(123456789) == 123.46
-    assert _from_bytes_to_megabytes(0) == 0.00
-    assert _from_bytes_to_megabytes(-1000000) == -1.00
+    """Test cases for from_bytes_to_megabytes function."""
+    assert from_bytes_to_megabytes(1000000) == 1.00
+    assert from_bytes_to_megabytes(5000000) == 5.00
+    assert from_bytes_to_megabytes(123456789) == 123.46
+    assert from_bytes_to_megabytes(0) == 0.00
+    assert from_bytes_to_megabytes(-1000000) == -1.00
 
 
 def test_0_netgear_switch_connector_initialization() -> None:
@@ -185,7 +194,7 @@ def test_autodetect_model(switch_model: type[AutodetectedSwitchModel]) -> None:
     """Test autodetect_model method."""
     page_fetcher = PyTestPageFetcher(switch_model)
     connector = NetgearSwitchConnector(host="192.168.0.1", password="password")
-    with patch("py_netgear_plus.fetcher.requests.request") as mock_request:
+    with patch("py_netgear_plus.fetcher.requests.Session.request") as mock_request:
         mock_response = Mock()
         with page_fetcher.get_path(switch_model.AUTODETECT_TEMPLATES).open() as file:
             mock_response.content = file.read()
@@ -195,6 +204,81 @@ def test_autodetect_model(switch_model: type[AutodetectedSwitchModel]) -> None:
         assert isinstance(connector.switch_model, switch_model)
 
 
+def test_autodetect_model_runs_each_check_once() -> None:
+    """Test that every distinct autodetect check runs once per page."""
+    connector = NetgearSwitchConnector(host="192.168.0.1", password="password")
+    parser = connector._page_parser
+    response = BaseResponse()
+    response.content = Path("pages/GS308EP/0/login.cgi").read_bytes()
+    autodetect_index = get_autodetect_index(tuple(MODELS))
+    mocks = {
+        func_name: Mock(wraps=getattr(parser, func_name))
+        for func_name in autodetect_index
+    }
+    with patch.multiple(parser, **mocks):
+        assert connector._detect_model(response) is connector.switch_model
+    assert connector.switch_model.MODEL_NAME == "GS308EP"
+    for mock in mocks.values():
+        mock.assert_called_once_with(response)
+    check = autodetect_index["parse_login_title_tag"]
+    assert check.models_by_result["GS308EP"] < check.models
+
+
+def test_import_loads_connector_on_first_use() -> None:
+    """Test that importing the package and the CLI does not import requests."""
+    code = (
+        "import sys, py_netgear_plus.ngp_cli; print(' '.join(sys.modules)); "
+        "py_netgear_plus.NetgearSwitchConnector; print(' '.join(sys.modules))"
+    )
+    process = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    )
+    cli_modules, connector_modules = (
+        set(line.split()) for line in process.stdout.splitlines()
+    )
+    assert not {"requests", "lxml", "py_netgear_plus.connector"} & cli_modules
+    assert {"requests", "lxml", "py_netgear_plus.connector"} <= connector_modules
+
+
+def test_package_exports_only_public_names() -> None:
+    """Test that the package lists its public names and nothing else resolves."""
+    assert sorted(py_netgear_plus.__all__) == sorted(
+        ["__version__", *py_netgear_plus._EXPORTS]
+    )
+    assert set(py_netgear_plus.__all__) <= set(dir(py_netgear_plus))
+    assert py_netgear_plus.PageNotLoadedError is PageNotLoadedError
+    for name in ("time", "logging", "requests", "POLL_TEMPLATES"):
+        with pytest.raises(AttributeError):
+            getattr(py_netgear_plus, name)
+    namespace: dict[str, object] = {}
+    exec("from py_netgear_plus import *", namespace)  # noqa: S102
+    assert namespace["NetgearSwitchConnector"] is NetgearSwitchConnector
+
+
+def test_autodetect_model_probes_templates_concurrently() -> None:
+    """Test that concurrent autodetect does not wait for the slower templates."""
+    login_page = BaseResponse()
+    login_page.status_code = requests.codes.ok
+    login_page.content = Path("pages/GS308EP/0/login.cgi").read_bytes()
+    release = threading.Event()
+
+    def request(method: str, url: str) -> BaseResponse:
+        del method
+        if url != "http://192.168.0.1/":
+            release.wait(timeout=5)
+            raise PageFetcherConnectionError
+        return login_page
+
+    connector = NetgearSwitchConnector(host="192.168.0.1", password="password")
+    connector.concurrent_autodetect = True
+    with patch.object(connector._page_fetcher, "request", side_effect=request):
+        try:
+            assert connector.autodetect_model().MODEL_NAME == "GS308EP"
+            assert not release.is_set()
+        finally:
+            release.set()
+
+
 @pytest.mark.parametrize(
     "switch_model",
     TEST_MODELS,
@@ -203,7 +287,7 @@ def test_check_login_url(switch_model: type[AutodetectedSwitchModel]) -> None:
     """Test check_login_url method."""
     page_fetcher = PyTestPageFetcher(switch_model)
     connector = NetgearSwitchConnector(host="192.168.0.1", password="password")
-    with patch("py_netgear_plus.fetcher.requests.request") as mock_request:
+    with patch("py_netgear_plus.fetcher.requests.Session.request") as mock_request:
         mock_response = Mock()
         with page_fetcher.get_path(switch_model.AUTODETECT_TEMPLATES).open() as file:
             mock_response.content = file.read()
@@ -286,7 +370,7 @@ def test_get_login_password(
     """Test get_login_password method."""
     password = "Password1"
     connector = NetgearSwitchConnector(host="192.168.0.1", password=password)
-    with patch("py_netgear_plus.fetcher.requests.request") as mock_request:
+    with patch("py_netgear_plus.fetcher.requests.Session.request") as mock_request:
         mock_response = Mock()
         page_name = switch_model.LOGIN_TEMPLATE["url"].split("/")[-1] or DEFAULT_PAGE
         with Path(f"pages/{switch_model.MODEL_NAME}/0/{page_name}").open() as file:
@@ -344,7 +428,7 @@ def test_get_login_cookie(
         pytest.fail(f"Unknown crypt function {crypt_function}")
 
     with (
-        patch("py_netgear_plus.fetcher.requests.request") as mock_request,
+        patch("py_netgear_plus.fetcher.requests.Session.request") as mock_request,
     ):
         mock_response = Mock()
         mock_response.status_code = requests.codes.ok
@@ -387,14 +471,18 @@ def test_is_authenticated(page: str, expected: bool) -> None:  # noqa: FBT001
     assert connector._page_fetcher._is_authenticated(response) is expected
 
 
+@pytest.mark.parametrize("concurrent_fetching", [False, True])
 @pytest.mark.parametrize(
     "switch_model",
     MODELS_FOR_GET_SWITCH_INFOS,
 )
-def test_get_switch_infos(switch_model: type[AutodetectedSwitchModel]) -> None:
+def test_get_switch_infos(
+    switch_model: type[AutodetectedSwitchModel],
+    concurrent_fetching: bool,  # noqa: FBT001
+) -> None:
     """Test initialization of NetgearSwitchConnector."""
     with (
-        patch("py_netgear_plus.time.perf_counter", return_value=0),
+        patch("py_netgear_plus.connector.time.perf_counter", return_value=0),
         patch(
             "py_netgear_plus.NetgearSwitchConnector.fetch_page_from_templates"
         ) as mock_fetch_page_from_templates,
@@ -402,7 +490,8 @@ def test_get_switch_infos(switch_model: type[AutodetectedSwitchModel]) -> None:
         page_fetcher = PyTestPageFetcher(switch_model)
         mock_fetch_page_from_templates.side_effect = page_fetcher.from_file
         connector = NetgearSwitchConnector(host="192.168.0.1", password="password")
-        with patch("py_netgear_plus.fetcher.requests.request") as mock_request:
+        connector.concurrent_fetching = concurrent_fetching
+        with patch("py_netgear_plus.fetcher.requests.Session.request") as mock_request:
             mock_response = Mock()
             with page_fetcher.get_path(
                 switch_model.AUTODETECT_TEMPLATES
@@ -426,6 +515,176 @@ def test_get_switch_infos(switch_model: type[AutodetectedSwitchModel]) -> None:
             page_fetcher.next_sequence()
 
 
+@pytest.mark.parametrize("switch_model", [GS108Ev4, GS308EP])
+def test_get_switch_infos_fetches_shared_page_once(
+    switch_model: type[AutodetectedSwitchModel],
+) -> None:
+    """Test that a page used by several templates is fetched once per poll."""
+    page_fetcher = PyTestPageFetcher(switch_model)
+    fetched_urls = []
+
+    def from_file(method: str, url: str, data: dict) -> requests.Response:
+        del method, data
+        fetched_urls.append(url)
+        return page_fetcher.from_file([{"url": url}])
+
+    connector = NetgearSwitchConnector(host="192.168.0.1", password="password")
+    connector.sleep_time = 0
+    connector._set_instance_attributes_by_model(switch_model())
+    connector._page_parser = create_page_parser(switch_model.MODEL_NAME)
+    with (
+        patch("py_netgear_plus.connector.time.perf_counter", return_value=0),
+        patch(
+            "py_netgear_plus.NetgearSwitchConnector.fetch_page",
+            side_effect=from_file,
+        ),
+    ):
+        switch_data = connector.get_switch_infos()
+    with Path(f"pages/{switch_model.MODEL_NAME}/0/switch_infos.json").open() as file:
+        validation_data = json.loads(file.read())
+    for port_number in range(1, switch_model.PORTS + 1):
+        key = f"port_{port_number}_status"
+        assert switch_data[key] == validation_data[key]
+    assert switch_data["switch_name"] == validation_data["switch_name"]
+    assert fetched_urls.count("http://192.168.0.1/dashboard.cgi") == 1
+    assert connector._poll_cache is None
+
+
+def test_concurrent_poll_reconnects_after_dropped_connection() -> None:
+    """Test that workers dropped by a stale keep-alive session all reconnect."""
+    pages_path = Path("pages/GS316EPP/0")
+    stale_sessions: list[requests.Session] = []
+    stale_requests = threading.Barrier(GS316EPP.MAX_CONCURRENT_REQUESTS, timeout=5)
+    fresh_sessions = set()
+
+    def request(
+        session: requests.Session, method: str, url: str, **kwargs: object
+    ) -> requests.Response:
+        del method, kwargs
+        if session in stale_sessions:
+            stale_requests.wait()
+            message = "Connection reset by peer"
+            raise requests.exceptions.ConnectionError(message)
+        if stale_sessions:
+            fresh_sessions.add(session)
+        response = requests.Response()
+        response.status_code = requests.codes.ok
+        response._content = (pages_path / url.split("/")[-1]).read_bytes()
+        return response
+
+    connector = NetgearSwitchConnector(host="192.168.0.1", password="password")
+    connector.sleep_time = 0
+    connector.concurrent_fetching = True
+    connector._set_instance_attributes_by_model(GS316EPP())
+    connector._page_parser = create_page_parser("GS316EPP")
+    connector._client_hash = "client_hash"
+    connector._gambit = "gambit"
+    with (
+        patch("py_netgear_plus.connector.time.perf_counter", return_value=0),
+        patch.object(requests.Session, "request", autospec=True, side_effect=request),
+    ):
+        connector.get_switch_infos()
+        stale_sessions.append(connector._page_fetcher._session)
+        switch_data = connector.get_switch_infos()
+    validation_data = json.loads((pages_path / "switch_infos.json").read_text())
+    for port_number in range(1, GS316EPP.PORTS + 1):
+        key = f"port_{port_number}_status"
+        assert switch_data[key] == validation_data[key]
+    for port_number in GS316EPP.POE_PORTS:
+        for key in (
+            f"port_{port_number}_poe_power_active",
+            f"port_{port_number}_poe_output_power",
+        ):
+            assert switch_data[key] == validation_data[key]
+    assert stale_requests.n_waiting == 0
+    assert not stale_requests.broken
+    assert fresh_sessions == {connector._page_fetcher._session}
+    assert connector._page_fetcher.circuit_breaker.state == "closed"
+
+
+def test_get_switch_infos_fetches_pages_of_fields() -> None:
+    """Test that fields limit a poll to the pages with their values."""
+    page_fetcher = PyTestPageFetcher(GS308EP)
+    fetched_urls = []
+
+    def from_file(method: str, url: str, data: dict) -> requests.Response:
+        del method, data
+        fetched_urls.append(url)
+        return page_fetcher.from_file([{"url": url}])
+
+    connector = NetgearSwitchConnector(host="192.168.0.1", password="password")
+    connector._set_instance_attributes_by_model(GS308EP())
+    connector._page_parser = create_page_parser(GS308EP.MODEL_NAME)
+    with (
+        patch("py_netgear_plus.connector.time.perf_counter", return_value=0),
+        patch(
+            "py_netgear_plus.NetgearSwitchConnector.fetch_page",
+            side_effect=from_file,
+        ),
+    ):
+        connector.get_switch_infos()
+        fetched_urls.clear()
+        switch_data = connector.get_switch_infos(fields=["port_statistics"])
+        assert fetched_urls == ["http://192.168.0.1/portStatistics.cgi"]
+        assert "port_8_sum_rx_mbytes" in switch_data
+        assert "port_1_status" not in switch_data
+        assert "port_1_poe_output_power" not in switch_data
+
+        fetched_urls.clear()
+        switch_data = connector.get_switch_infos(
+            fields=["port_1_status", "port_2_poe_output_power", "switch_name"]
+        )
+        assert fetched_urls == [
+            "http://192.168.0.1/dashboard.cgi",
+            "http://192.168.0.1/getPoePortStatus.cgi",
+        ]
+        assert "port_1_poe_output_power" in switch_data
+        assert "port_1_poe_power_active" not in switch_data
+        assert "response_time_s" not in switch_data
+
+        with pytest.raises(UnknownFieldError):
+            connector.get_switch_infos(fields=["port_1_bogus"])
+
+
+def test_fetch_page_from_templates_memoizes_templates() -> None:
+    """Test that steady-state polls skip templates that returned 404."""
+    templates = [
+        {"method": "get", "url": "http://{ip}/portStatistics.cgi"},
+        {"method": "get", "url": "http://{ip}/port_statistics.htm"},
+    ]
+    fetched_urls = []
+
+    def fetch_page(method: str, url: str, data: dict) -> BaseResponse:
+        del method, data
+        fetched_urls.append(url)
+        response = BaseResponse()
+        if url.endswith(".htm"):
+            response.status_code = requests.codes.ok
+        return response
+
+    connector = NetgearSwitchConnector(host="192.168.0.1", password="password")
+    with patch(
+        "py_netgear_plus.NetgearSwitchConnector.fetch_page", side_effect=fetch_page
+    ):
+        for _ in range(3):
+            connector.fetch_page_from_templates(templates)
+        assert fetched_urls == [
+            "http://192.168.0.1/portStatistics.cgi",
+            "http://192.168.0.1/port_statistics.htm",
+            "http://192.168.0.1/port_statistics.htm",
+            "http://192.168.0.1/port_statistics.htm",
+        ]
+
+        # A firmware change can make the first template available
+        connector._reset_template_memo()
+        fetched_urls.clear()
+        connector.fetch_page_from_templates(templates)
+        assert fetched_urls == [
+            "http://192.168.0.1/portStatistics.cgi",
+            "http://192.168.0.1/port_statistics.htm",
+        ]
+
+
 @pytest.mark.parametrize(
     "switch_model",
     TEST_MODELS,
@@ -442,7 +701,7 @@ def test_turn_on_and_off_poe_port(switch_model: type[AutodetectedSwitchModel]) -
 
         connector = NetgearSwitchConnector(host="192.168.0.1", password="password")
 
-        with patch("py_netgear_plus.fetcher.requests.request") as mock_request:
+        with patch("py_netgear_plus.fetcher.requests.Session.request") as mock_request:
             mock_response = Mock()
             with page_fetcher.get_path(
                 switch_model.AUTODETECT_TEMPLATES
@@ -464,7 +723,7 @@ def test_turn_on_and_off_poe_port(switch_model: type[AutodetectedSwitchModel]) -
         response.status_code = requests.codes.ok
         response.content = b"SUCCESS"
         with patch(
-            "py_netgear_plus.fetcher.requests.request",
+            "py_netgear_plus.fetcher.requests.Session.request",
             return_value=response,
         ) as mock_request:
             cookies = requests.cookies.RequestsCookieJar()
@@ -522,7 +781,7 @@ def test_reboot(
 
         connector = NetgearSwitchConnector(host="192.168.0.1", password="password")
 
-        with patch("py_netgear_plus.fetcher.requests.request") as mock_request:
+        with patch("py_netgear_plus.fetcher.requests.Session.request") as mock_request:
             mock_response = Mock()
             with page_fetcher.get_path(
                 switch_model.AUTODETECT_TEMPLATES
@@ -551,7 +810,7 @@ def test_reboot(
             response.content = None
 
         with patch(
-            "py_netgear_plus.fetcher.requests.request",
+            "py_netgear_plus.fetcher.requests.Session.request",
             return_value=response,
         ) as mock_request:
             cookies = requests.cookies.RequestsCookieJar()
@@ -0,0 +1,219 @@
+"""Unit tests for the py_netgear_plus async_connector module."""
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import requests
+from py_netgear_plus import AsyncNetgearSwitchConnector, NetgearSwitchConnector
+from py_netgear_plus.circuit_breaker import STATE_HALF_OPEN, CircuitBreaker
+from py_netgear_plus.fetcher import BaseResponse
+from py_netgear_plus.models import GS308EP, AutodetectedSwitchModel
+from py_netgear_plus.parsers import create_page_parser
+
+from .test___init__ import MODELS_FOR_GET_SWITCH_INFOS, TEST_MODELS, PyTestPageFetcher
+
+
+def file_response(path: Path) -> BaseResponse:
+    """Return a response with the contents of a saved page."""
+    response = BaseResponse()
+    response.status_code = requests.codes.ok
+    response.content = path.read_bytes()
+    return response
+
+
+@pytest.mark.parametrize(
+    "switch_model",
+    TEST_MODELS,
+)
+def test_async_autodetect_model(switch_model: type[AutodetectedSwitchModel]) -> None:
+    """Test autodetect_model method of the asyncio connector."""
+    page_fetcher = PyTestPageFetcher(switch_model)
+    connector = AsyncNetgearSwitchConnector(host="192.168.0.1", password="password")
+    with patch(
+        "py_netgear_plus.async_fetcher.AsyncPageFetcher._send",
+        new_callable=AsyncMock,
+    ) as mock_send:
+        mock_send.return_value = file_response(
+            page_fetcher.get_path(switch_model.AUTODETECT_TEMPLATES)
+        )
+        asyncio.run(connector.autodetect_model())
+    assert isinstance(connector.switch_model, switch_model)
+
+
+def test_async_autodetect_model_probes_templates_concurrently() -> None:
+    """Test that concurrent autodetect cancels the slower templates."""
+    login_page = file_response(Path("pages/GS308EP/0/login.cgi"))
+    cancelled_urls = []
+
+    async def request(method: str, url: str) -> BaseResponse:
+        del method
+        if url != "http://192.168.0.1/":
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled_urls.append(url)
+                raise
+        return login_page
+
+    connector = AsyncNetgearSwitchConnector(host="192.168.0.1", password="password")
+    connector.concurrent_autodetect = True
+    with patch.object(connector._page_fetcher, "request", side_effect=request):
+        switch_model = asyncio.run(connector.autodetect_model())
+    assert switch_model.MODEL_NAME == "GS308EP"
+    assert sorted(cancelled_urls) == [
+        "http://192.168.0.1/login.cgi",
+        "http://192.168.0.1/login.htm",
+    ]
+
+
+@pytest.mark.parametrize("concurrent_fetching", [False, True])
+@pytest.mark.parametrize(
+    "switch_model",
+    MODELS_FOR_GET_SWITCH_INFOS,
+)
+def test_async_get_switch_infos(
+    switch_model: type[AutodetectedSwitchModel],
+    concurrent_fetching: bool,  # noqa: FBT001
+) -> None:
+    """Test that the asyncio connector returns the same data as the saved pages."""
+    page_fetcher = PyTestPageFetcher(switch_model)
+
+    async def from_file(templates: list[dict[str, str]]) -> BaseResponse:
+        return file_response(page_fetcher.get_path(templates))
+
+    async def poll() -> list[dict]:
+        connector = AsyncNetgearSwitchConnector(host="192.168.0.1", password="password")
+        connector.sleep_time = 0
+        connector.concurrent_fetching = concurrent_fetching
+        connector._set_instance_attributes_by_model(switch_model)
+        connector._page_parser = create_page_parser(switch_model.MODEL_NAME)
+        results = []
+        for _ in range(2):
+            results.append(await connector.get_switch_infos())
+            page_fetcher.next_sequence()
+        return results
+
+    with (
+        patch("py_netgear_plus.async_connector.time.perf_counter", return_value=0),
+        patch(
+            "py_netgear_plus.async_connector.AsyncNetgearSwitchConnector"
+            ".fetch_page_from_templates",
+            side_effect=from_file,
+        ),
+    ):
+        results = asyncio.run(poll())
+
+    for sequence, switch_data in enumerate(results):
+        with Path(
+            f"pages/{switch_model.MODEL_NAME}/{sequence}/switch_infos.json"
+        ).open() as file:
+            assert switch_data == json.loads(file.read())
+
+
+def test_async_switch_poe_port() -> None:
+    """Test switching a PoE port with the asyncio connector."""
+    connector = AsyncNetgearSwitchConnector(host="192.168.0.1", password="password")
+    connector._set_instance_attributes_by_model(GS308EP())
+    connector._client_hash = "client_hash"
+    connector.set_cookie("SID", "cookie_value")
+    response = BaseResponse()
+    response.status_code = requests.codes.ok
+    response.content = b"SUCCESS"
+    with patch(
+        "py_netgear_plus.async_fetcher.AsyncPageFetcher._send",
+        new_callable=AsyncMock,
+        return_value=response,
+    ) as mock_send:
+        assert asyncio.run(connector.turn_off_poe_port(1)) is True
+        kwargs = mock_send.call_args.kwargs
+        assert kwargs["cookies"] == {"SID": "cookie_value"}
+        assert kwargs["data"]["ADMIN_MODE"] == 0
+
+
+def test_async_save_pages(tmp_path: Path) -> None:
+    """Test that the asyncio connector saves the pages of the switch."""
+    pages_path = Path("pages/GS308EP/0")
+
+    async def request(method: str, url: str, data: dict | None = None) -> BaseResponse:
+        del method, data
+        path = pages_path / (url.split("/")[-1] or "index.htm")
+        if not path.exists():
+            return BaseResponse()
+        return file_response(path)
+
+    async def save_pages() -> None:
+        connector = AsyncNetgearSwitchConnector(host="192.168.0.1", password="password")
+        assert not isinstance(connector, NetgearSwitchConnector)
+        connector._set_instance_attributes_by_model(GS308EP())
+        connector._page_parser = create_page_parser("GS308EP")
+        with patch.object(connector._page_fetcher, "request", side_effect=request):
+            await connector.save_pages(str(tmp_path / "pages"))
+            await connector.save_autodetect_templates(str(tmp_path / "pages"))
+
+    asyncio.run(save_pages())
+    saved_pages = sorted(path.name for path in (tmp_path / "pages").iterdir())
+    assert saved_pages == [
+        "PoEPortConfig.cgi",
+        "dashboard.cgi",
+        "getPoePortStatus.cgi",
+        "index.htm",
+        "login.cgi",
+        "portStatistics.cgi",
+    ]
+
+
+def test_async_connector_requires_aiohttp() -> None:
+    """Test that the asyncio connector cannot be created without aiohttp."""
+    with (
+        patch("py_netgear_plus.async_fetcher.aiohttp", None),
+        pytest.raises(ImportError, match="aiohttp is required"),
+    ):
+        AsyncNetgearSwitchConnector(host="192.168.0.1", password="password")
+
+
+def test_async_request_timeout_returns_empty_response() -> None:
+    """Test that a timeout returns the same empty response as PageFetcher."""
+    connector = AsyncNetgearSwitchConnector(host="192.168.0.1", password="password")
+    sync_connector = NetgearSwitchConnector(host="192.168.0.1", password="password")
+    with (
+        patch(
+            "py_netgear_plus.async_fetcher.AsyncPageFetcher._send",
+            new_callable=AsyncMock,
+            side_effect=TimeoutError,
+        ),
+        patch(
+            "py_netgear_plus.fetcher.PageFetcher._send",
+            side_effect=requests.exceptions.Timeout,
+        ),
+    ):
+        response = asyncio.run(
+            connector._page_fetcher.request("get", "http://192.168.0.1/")
+        )
+        sync_response = sync_connector._page_fetcher.request(
+            "get", "http://192.168.0.1/"
+        )
+    assert type(response) is type(sync_response)
+    assert response.status_code is sync_response.status_code is None
+    assert not response.content
+
+
+def test_async_cancelled_probe_is_released() -> None:
+    """Test that a cancelled probe of the asyncio fetcher lets the next one probe."""
+    connector = AsyncNetgearSwitchConnector(host="192.168.0.1", password="password")
+    fetcher = connector._page_fetcher
+    fetcher.circuit_breaker = CircuitBreaker(failure_threshold=1, base_backoff=0)
+    fetcher.circuit_breaker.record_failure()
+    with (
+        patch(
+            "py_netgear_plus.async_fetcher.AsyncPageFetcher._send_on_session",
+            new_callable=AsyncMock,
+            side_effect=asyncio.CancelledError,
+        ),
+        pytest.raises(asyncio.CancelledError),
+    ):
+        asyncio.run(fetcher.request("get", "http://192.168.0.1/status.htm"))
+    assert fetcher.circuit_breaker.state == STATE_HALF_OPEN
+    assert fetcher.circuit_breaker.allow_request() is True
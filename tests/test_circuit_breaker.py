@@ -0,0 +1,130 @@
+"""Unit tests for the py_netgear_plus circuit_breaker module."""
+
+from unittest.mock import patch
+
+import pytest
+import requests
+from py_netgear_plus import NetgearSwitchConnector
+from py_netgear_plus.circuit_breaker import (
+    PROBE_TIMEOUT,
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+)
+from py_netgear_plus.fetcher import PageFetcher, PageFetcherCircuitOpenError
+from py_netgear_plus.models import SwitchModelNotDetectedError
+
+
+def test_circuit_opens_after_failure_threshold() -> None:
+    """Test that the circuit opens after consecutive failures only."""
+    breaker = CircuitBreaker(failure_threshold=2, jitter=0)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == STATE_CLOSED
+    assert breaker.allow_request() is True
+    breaker.record_failure()
+    assert breaker.state == STATE_OPEN
+    assert breaker.allow_request() is False
+
+
+def test_half_open_probe_and_backoff() -> None:
+    """Test that one probe is let through and a failed probe doubles the backoff."""
+    breaker = CircuitBreaker(failure_threshold=1, base_backoff=10, jitter=0)
+    with patch("py_netgear_plus.circuit_breaker.time.monotonic") as mock_monotonic:
+        mock_monotonic.return_value = 100.0
+        breaker.record_failure()
+        assert breaker.retry_after == 10
+
+        mock_monotonic.return_value = 110.0
+        assert breaker.state == STATE_HALF_OPEN
+        assert breaker.allow_request() is True
+        assert breaker.allow_request() is False
+        breaker.record_failure()
+        assert breaker.state == STATE_OPEN
+        assert breaker.retry_after == 20
+
+        mock_monotonic.return_value = 130.0
+        assert breaker.allow_request() is True
+        breaker.record_success()
+        assert breaker.state == STATE_CLOSED
+        assert breaker.allow_request() is True
+
+
+def test_backoff_is_capped_and_jittered() -> None:
+    """Test that the backoff stays below max_backoff and is randomized."""
+    breaker = CircuitBreaker(
+        failure_threshold=1, base_backoff=10, max_backoff=15, jitter=0.5
+    )
+    with (
+        patch("py_netgear_plus.circuit_breaker.time.monotonic", return_value=0.0),
+        patch(
+            "py_netgear_plus.circuit_breaker.random.uniform", return_value=1.5
+        ) as mock_uniform,
+    ):
+        breaker._open_count = 5
+        breaker.record_failure()
+        mock_uniform.assert_called_once_with(0.5, 1.5)
+        assert breaker.retry_after == pytest.approx(22.5)
+
+
+def test_fetcher_fails_fast_while_circuit_is_open() -> None:
+    """Test that an open circuit rejects requests without using the network."""
+    fetcher = PageFetcher("192.168.0.1")
+    fetcher.pacer.interval = 0
+    fetcher.circuit_breaker = CircuitBreaker(failure_threshold=1)
+    with patch("py_netgear_plus.fetcher.requests.Session.request") as mock_request:
+        mock_request.side_effect = requests.exceptions.ConnectTimeout
+        fetcher.request("get", "http://192.168.0.1/status.htm")
+        with pytest.raises(PageFetcherCircuitOpenError):
+            fetcher.request("get", "http://192.168.0.1/status.htm")
+        assert mock_request.call_count == 1
+
+
+def test_probe_uses_short_timeout() -> None:
+    """Test that the half-open probe is sent with the probe timeout."""
+    fetcher = PageFetcher("192.168.0.1")
+    fetcher.circuit_breaker = CircuitBreaker(failure_threshold=1, base_backoff=0)
+    fetcher.circuit_breaker.record_failure()
+    with patch("py_netgear_plus.fetcher.requests.Session.request") as mock_request:
+        mock_request.return_value.status_code = requests.codes.ok
+        mock_request.return_value.content = b""
+        fetcher.request("get", "http://192.168.0.1/status.htm")
+        assert mock_request.call_args.kwargs["timeout"] == PROBE_TIMEOUT
+    assert fetcher.circuit_breaker.state == STATE_CLOSED
+
+
+def test_probe_raising_unexpected_error_is_released() -> None:
+    """Test that a probe failing with an unexpected error lets the next one probe."""
+    fetcher = PageFetcher("192.168.0.1")
+    fetcher.circuit_breaker = CircuitBreaker(failure_threshold=1, base_backoff=0)
+    fetcher.circuit_breaker.record_failure()
+    with patch("py_netgear_plus.fetcher.requests.Session.request") as mock_request:
+        mock_request.side_effect = RuntimeError
+        with pytest.raises(RuntimeError):
+            fetcher.request("get", "http://192.168.0.1/status.htm")
+        assert fetcher.circuit_breaker.state == STATE_HALF_OPEN
+        assert fetcher.circuit_breaker.allow_request() is True
+        fetcher.circuit_breaker.release_probe()
+
+        mock_request.side_effect = None
+        mock_request.return_value.status_code = requests.codes.ok
+        mock_request.return_value.content = b""
+        fetcher.request("get", "http://192.168.0.1/status.htm")
+        assert mock_request.call_count == 2
+    assert fetcher.circuit_breaker.state == STATE_CLOSED
+
+
+def test_autodetect_fails_fast_for_unreachable_switch() -> None:
+    """Test that autodetect stops sending requests to an unreachable switch."""
+    connector = NetgearSwitchConnector(host="192.168.0.1", password="password")
+    connector.sleep_time = 0
+    with patch("py_netgear_plus.fetcher.requests.Session.request") as mock_request:
+        mock_request.side_effect = requests.exceptions.ConnectionError
+        with pytest.raises(SwitchModelNotDetectedError):
+            connector.autodetect_model()
+        call_count = mock_request.call_count
+        with pytest.raises(SwitchModelNotDetectedError):
+            connector.autodetect_model()
+        assert mock_request.call_count == call_count
@@ -0,0 +1,19 @@
+"""Unit tests for the py_netgear_plus counters module."""
+
+import pytest
+from py_netgear_plus.counters import combine_counters, decode_counters
+
+
+def test_decode_counters_defaults_invalid_values() -> None:
+    """Test that missing or invalid counters are decoded to the default."""
+    assert decode_counters(["1", " 22 ", "333"]) == [1, 22, 333]
+    assert decode_counters(["1", None, "x", ""]) == [1, 0, 0, 0]
+    assert decode_counters(["1", None], default=-1) == [1, -1]
+    assert decode_counters(["ff", "0x10", "zz"], base=16) == [255, 16, 0]
+
+
+def test_combine_counters() -> None:
+    """Test that turnovers are combined with the int32 counters."""
+    assert combine_counters([0, 1, 2], [5, 0, 7]) == [5, 2**32, 2 * 2**32 + 7]
+    with pytest.raises(ValueError, match="zip"):
+        combine_counters([0, 1], [5])
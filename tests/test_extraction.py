@@ -0,0 +1,146 @@
+"""Unit tests for the py_netgear_plus extraction module."""
+
+import pytest
+from py_netgear_plus.extraction import (
+    CELLS_FOLLOWING,
+    ColumnSpec,
+    Field,
+    MissingFieldError,
+    PatternSpec,
+    TableSpec,
+    compile_spec,
+)
+from py_netgear_plus.fetcher import BaseResponse
+from py_netgear_plus.parsers import PageParser
+
+TABLE_PAGE = b"""<html><body><table>
+<tr class="portID"><td>1</td><td>Up</td><input value="ff"><td> 100 </td></tr>
+<tr class="portID"><td>2</td><!-- down --><td></td><input value="zz"></tr>
+</table></body></html>"""
+
+LIST_PAGE = b"""<html><body><ul>
+<li><span>Port</span></li>
+<li><span>1</span></li><input value="10"><input value="11">
+<li><span>2</span></li><input value="20">
+</ul></body></html>"""
+
+STATISTICS_V2_PAGE = b"""<html><body><table>
+<tr class="portID"><input name="hash" value="1"><input name="rxPkt" value="a">
+<input name="txpkt" value="b"><input name="crcPkt" value="0"></tr>
+<tr class="portID"><input name="rxPkt" value="ff"><input name="txpkt" value="1">
+<input name="crcPkt" value="2"></tr>
+<tr class="portID"><input name="rxPkt" value="1"><input name="txpkt" value="1">
+<input name="crcPkt" value="1"></tr>
+</table></body></html>"""
+
+PATTERN_PAGE = b"""<script>
+Entry[0] = '1?Up?1000M';
+Entry[1] = '2?Down';
+</script>"""
+
+
+def get_response(content: bytes) -> BaseResponse:
+    """Return a response with content."""
+    response = BaseResponse()
+    response.content = content
+    return response
+
+
+def test_table_spec_reads_cells_by_tag_and_index() -> None:
+    """Test that fields read the text or attribute of the n-th cell with tag."""
+    spec = TableSpec(
+        rows='//tr[@class="portID"]',
+        fields=(
+            Field("port", 0, "td", convert=int),
+            Field("status", 1, "td", default="unknown"),
+            Field("speed", 2, "td", convert=int, default=0),
+            Field("counter", 0, "input", "value", lambda v: int(v, 16), default=-1),
+        ),
+    )
+    values = compile_spec(spec).extract(get_response(TABLE_PAGE), ports=3)
+    assert values == {
+        "port": [1, 2],
+        "status": ["Up", "unknown", "unknown"],
+        "speed": [100, 0, 0],
+        "counter": [255, -1, -1],
+    }
+    assert compile_spec(spec) is compile_spec(spec)
+
+
+def test_table_spec_reads_following_cells() -> None:
+    """Test that rows of a flat list take the siblings up to the next row."""
+    spec = TableSpec(
+        rows="//li",
+        fields=(
+            Field("port", 0, "span", convert=int, default=None),
+            Field("rx", 0, "input", "value", int, default=0),
+            Field("tx", 1, "input", "value", int, default=0),
+        ),
+        cells=CELLS_FOLLOWING,
+    )
+    assert compile_spec(spec).extract(get_response(LIST_PAGE)) == {
+        "port": [None, 1, 2],
+        "rx": [0, 10, 20],
+        "tx": [0, 11, 0],
+    }
+
+
+def test_table_spec_drops_rows_beyond_ports() -> None:
+    """Test that rows beyond the number of ports are dropped."""
+    spec = TableSpec(
+        rows='//tr[@class="portID"]',
+        fields=(
+            Field("port", 0, "td", convert=int),
+            Field("status", 1, "td", default="unknown"),
+        ),
+    )
+    assert compile_spec(spec).extract(get_response(TABLE_PAGE), ports=1) == {
+        "port": [1],
+        "status": ["Up"],
+    }
+
+
+def test_column_spec_selects_cells_by_xpath() -> None:
+    """Test that fields read the elements of their column, fitted to the ports."""
+    spec = ColumnSpec(
+        columns=('//input[@name="rxPkt"]', '//input[@name="crcPkt"]'),
+        fields=(
+            Field("rx", 0, attribute="value", convert=lambda v: int(v, 16)),
+            Field("crc", 1, attribute="value", default=None),
+        ),
+    )
+    assert compile_spec(spec).extract(get_response(STATISTICS_V2_PAGE), ports=2) == {
+        "rx": [10, 255],
+        "crc": ["0", "2"],
+    }
+    assert compile_spec(spec).extract(get_response(STATISTICS_V2_PAGE), ports=4) == {
+        "rx": [10, 255, 1],
+        "crc": ["0", "2", "1", None],
+    }
+
+
+def test_port_statistics_v2_selects_inputs_by_name() -> None:
+    """Test that other inputs of a row do not shift the API v2 counters."""
+    statistics = PageParser().parse_port_statistics_v2(
+        get_response(STATISTICS_V2_PAGE), 2
+    )
+    assert statistics["traffic_rx"] == [10, 255]
+    assert statistics["traffic_tx"] == [11, 1]
+    assert statistics["crc_errors"] == [0, 2]
+
+
+def test_pattern_spec_splits_last_group() -> None:
+    """Test that the parts of a match are its groups and the split last group."""
+    pattern = r"Entry\[([0-9]+)\] = '([^']+)';"
+    spec = PatternSpec(
+        pattern=pattern,
+        fields=(Field("port", 0, convert=int), Field("status", 2)),
+    )
+    assert compile_spec(spec).extract(get_response(PATTERN_PAGE)) == {
+        "port": [0, 1],
+        "status": ["Up", "Down"],
+    }
+
+    spec = PatternSpec(pattern=pattern, fields=(Field("speed", 3),))
+    with pytest.raises(MissingFieldError):
+        compile_spec(spec).extract(get_response(PATTERN_PAGE))
@@ -0,0 +1,153 @@
+"""Unit tests for the py_netgear_plus fetcher module."""
+
+import threading
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+from py_netgear_plus.fetcher import PageFetcher, get_page_tree
+
+
+def ok_response() -> Mock:
+    """Return a mocked response with status code 200 and empty content."""
+    response = Mock()
+    response.status_code = requests.codes.ok
+    response.content = b""
+    return response
+
+
+def test_session_is_reused_between_requests() -> None:
+    """Test that consecutive requests share one keep-alive session."""
+    fetcher = PageFetcher("192.168.0.1")
+    with patch("py_netgear_plus.fetcher.requests.Session.request") as mock_request:
+        mock_request.return_value = ok_response()
+        fetcher.request("get", "http://192.168.0.1/status.htm")
+        session = fetcher._session
+        fetcher.request("get", "http://192.168.0.1/portStatistics.cgi")
+        assert fetcher._session is session
+        assert mock_request.call_count == 2
+    fetcher.close()
+    assert fetcher._session is None
+
+
+def test_idle_session_is_evicted() -> None:
+    """Test that a session idle for longer than pool_idle_timeout is replaced."""
+    fetcher = PageFetcher("192.168.0.1", pool_idle_timeout=10)
+    with (
+        patch("py_netgear_plus.fetcher.requests.Session.request") as mock_request,
+        patch("py_netgear_plus.fetcher.time.monotonic") as mock_monotonic,
+    ):
+        mock_request.return_value = ok_response()
+        mock_monotonic.return_value = 100.0
+        fetcher.request("get", "http://192.168.0.1/status.htm")
+        session = fetcher._session
+        mock_monotonic.return_value = 105.0
+        fetcher.request("get", "http://192.168.0.1/status.htm")
+        assert fetcher._session is session
+        mock_monotonic.return_value = 120.0
+        fetcher.request("get", "http://192.168.0.1/status.htm")
+        assert fetcher._session is not session
+
+
+def test_reconnect_after_dropped_connection() -> None:
+    """Test that a dropped keep-alive connection is retried on a new session."""
+    fetcher = PageFetcher("192.168.0.1")
+    with patch("py_netgear_plus.fetcher.requests.Session.request") as mock_request:
+        response = ok_response()
+        mock_request.side_effect = [
+            response,
+            requests.exceptions.ConnectionError("Connection reset by peer"),
+            response,
+        ]
+        fetcher.request("get", "http://192.168.0.1/status.htm")
+        session = fetcher._session
+        reconnected_response = fetcher.request("get", "http://192.168.0.1/status.htm")
+        assert reconnected_response.status_code == requests.codes.ok
+        assert fetcher._session is not session
+        assert mock_request.call_count == 3
+
+
+def test_concurrent_reconnects_replace_session_once() -> None:
+    """Test that threads dropped by the same session share one new session."""
+    fetcher = PageFetcher("192.168.0.1")
+    with patch("py_netgear_plus.fetcher.requests.Session.request") as mock_request:
+        mock_request.return_value = ok_response()
+        fetcher.request("get", "http://192.168.0.1/status.htm")
+    stale_session = fetcher._session
+    both_sent = threading.Barrier(2, timeout=5)
+    sessions = []
+
+    def request(session: requests.Session, *args: object, **kwargs: object) -> Mock:
+        del args, kwargs
+        if session is stale_session:
+            both_sent.wait()
+            message = "Connection reset by peer"
+            raise requests.exceptions.ConnectionError(message)
+        sessions.append(session)
+        return ok_response()
+
+    with (
+        patch.object(requests.Session, "request", autospec=True, side_effect=request),
+        patch.object(
+            requests.Session, "close", autospec=True, wraps=requests.Session.close
+        ) as mock_close,
+    ):
+        threads = [
+            threading.Thread(
+                target=fetcher.request, args=("get", "http://192.168.0.1/status.htm")
+            )
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    mock_close.assert_called_once_with(stale_session)
+    assert len(sessions) == 2
+    assert sessions[0] is sessions[1] is fetcher._session
+
+
+def test_no_reconnect_on_fresh_connection() -> None:
+    """Test that a failing first connection is not retried."""
+    fetcher = PageFetcher("192.168.0.1")
+    with patch("py_netgear_plus.fetcher.requests.Session.request") as mock_request:
+        mock_request.side_effect = requests.exceptions.ConnectionError("refused")
+        with pytest.raises(requests.exceptions.ConnectionError):
+            fetcher._send("get", "http://192.168.0.1/status.htm")
+        assert mock_request.call_count == 1
+
+
+def test_response_is_parsed_once() -> None:
+    """Test that the login check and the parsers share one parsed html tree."""
+    fetcher = PageFetcher("192.168.0.1")
+    with (
+        patch("py_netgear_plus.fetcher.requests.Session.request") as mock_request,
+        patch("py_netgear_plus.fetcher.html.fromstring") as mock_fromstring,
+    ):
+        response = ok_response()
+        response.content = b"<html><title>Dashboard</title></html>"
+        mock_request.return_value = response
+        mock_fromstring.return_value.xpath.return_value = []
+        page = fetcher.request("get", "http://192.168.0.1/dashboard.cgi")
+        assert get_page_tree(page) is mock_fromstring.return_value
+        mock_fromstring.assert_called_once_with(response.content)
+
+
+@pytest.mark.parametrize(
+    "page",
+    sorted(
+        path
+        for path in Path("pages").rglob("*")
+        if path.is_file() and path.suffix != ".json"
+    ),
+    ids=str,
+)
+def test_login_redirect_precheck_matches_tree_check(page: Path) -> None:
+    """Test that the byte-level pre-check gives the verdict of the tree check."""
+    fetcher = PageFetcher("192.168.0.1")
+    response = ok_response()
+    response.content = page.read_bytes()
+    assert fetcher._is_authenticated(response) is fetcher._is_authenticated_tree(
+        response
+    )
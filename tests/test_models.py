@@ -0,0 +1,89 @@
+"""Unit tests for the py_netgear_plus models module."""
+
+from importlib.metadata import EntryPoint
+from unittest.mock import patch
+
+import pytest
+from py_netgear_plus import models, parsers
+from py_netgear_plus.models import (
+    GS308EP,
+    MODELS,
+    MODELS_BY_NAME,
+    AutodetectedSwitchModel,
+    InvalidModelRegistrationError,
+    get_model,
+    get_models,
+    load_model_plugins,
+    register_model,
+)
+from py_netgear_plus.parsers import PARSERS, PageParser
+from py_netgear_plus.utils import get_all_child_classes_list
+
+
+class PluginModel(AutodetectedSwitchModel):
+    """Model of a plugin package."""
+
+    MODEL_NAME = "GS999PLUGIN"
+    PORTS = 9
+
+
+def test_models_are_registered() -> None:
+    """Test that every named model has been registered with its parser."""
+    named_models = [
+        switch_model
+        for switch_model in get_all_child_classes_list(
+            AutodetectedSwitchModel, "MODEL_NAME"
+        )
+        if switch_model.__module__ == models.__name__
+    ]
+    assert sorted(named_models, key=MODELS.index) == MODELS
+    for switch_model in MODELS:
+        assert get_model(switch_model.MODEL_NAME) is switch_model
+        assert switch_model.MODEL_NAME in PARSERS
+    assert get_models() == tuple(MODELS)
+    assert get_model("GS000") is None
+
+
+def test_parsers_are_registered() -> None:
+    """Test that every parser without subclasses has been registered."""
+    leaf_parsers = [
+        parser
+        for parser in get_all_child_classes_list(PageParser)
+        if parser.__module__ == parsers.__name__ and not parser.__subclasses__()
+    ]
+    assert leaf_parsers
+    for parser in leaf_parsers:
+        assert PARSERS.get(parser.__name__) is parser
+
+
+def test_register_model_rejects_conflicts() -> None:
+    """Test that a model name is registered once and never empty."""
+    assert register_model(GS308EP) is GS308EP
+    assert MODELS.count(GS308EP) == 1
+
+    class OtherGS308EP(GS308EP):
+        """Other model with the name of GS308EP."""
+
+    with pytest.raises(InvalidModelRegistrationError):
+        register_model(OtherGS308EP)
+    with pytest.raises(InvalidModelRegistrationError):
+        register_model(AutodetectedSwitchModel)
+    assert MODELS_BY_NAME["GS308EP"] is GS308EP
+
+
+def test_load_model_plugins() -> None:
+    """Test that models of entry points are registered and broken ones skipped."""
+    plugins = [
+        EntryPoint("broken", "tests.missing_plugin", models.MODEL_PLUGINS_GROUP),
+        EntryPoint("plugin", f"{__name__}:PluginModel", models.MODEL_PLUGINS_GROUP),
+    ]
+    load_model_plugins.cache_clear()
+    try:
+        with patch("py_netgear_plus.models.entry_points", return_value=plugins):
+            assert get_model("GS999PLUGIN") is PluginModel
+            assert get_models()[-1] is PluginModel
+    finally:
+        MODELS.remove(PluginModel)
+        del MODELS_BY_NAME["GS999PLUGIN"]
+        load_model_plugins.cache_clear()
+    assert get_model("GS999PLUGIN") is None
@@ -0,0 +1,110 @@
+"""Unit tests for the py_netgear_plus ngp_cli module."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from py_netgear_plus import NetgearSwitchConnector, ngp_cli
+from py_netgear_plus.models import GS308EP
+from py_netgear_plus.storage import FileSessionStore
+
+SESSION = {"model": "GS308EP", "cookie_name": "SID", "cookie_content": "secret"}
+
+
+def test_migrate_cookie_file(tmp_path: Path) -> None:
+    """Test that the session of the old cookie file is moved to the store."""
+    cookie_file = tmp_path / "cookie"
+    cookie_file.write_text(
+        json.dumps(
+            {"cookie_name": "SID", "cookie_content": "old", "host": "192.168.0.1"}
+        )
+    )
+    with patch.object(
+        ngp_cli, "detect_model_name", return_value="GS308EP"
+    ) as mock_detect:
+        assert ngp_cli.migrate_cookie_file(cookie_file, tmp_path / "sessions")
+        assert ngp_cli.migrate_cookie_file(cookie_file, tmp_path / "sessions") is False
+    mock_detect.assert_called_once_with("192.168.0.1")
+    assert not cookie_file.exists()
+    session = FileSessionStore(tmp_path / "sessions").load("192.168.0.1")
+    assert session is not None
+    assert session["model"] == "GS308EP"
+    assert session["cookie_content"] == "old"
+
+    cookie_file.write_text(json.dumps({"host": "192.168.0.1"}))
+    assert ngp_cli.migrate_cookie_file(cookie_file, tmp_path / "sessions") is False
+    assert cookie_file.exists()
+
+
+def test_migrate_cookie_file_of_undetected_model(tmp_path: Path) -> None:
+    """Test that a session without a detected model is not saved."""
+    cookie_file = tmp_path / "cookie"
+    cookie_file.write_text(
+        json.dumps(
+            {"cookie_name": "SID", "cookie_content": "old", "host": "192.168.0.1"}
+        )
+    )
+    with patch.object(ngp_cli, "detect_model_name", return_value=None):
+        assert ngp_cli.migrate_cookie_file(cookie_file, tmp_path / "sessions") is False
+    assert not cookie_file.exists()
+    assert FileSessionStore(tmp_path / "sessions").load("192.168.0.1") is None
+
+
+def test_migrated_session_is_reused_by_connector(tmp_path: Path) -> None:
+    """Test that the connector accepts a session moved from the old file."""
+    cookie_file = tmp_path / "cookie"
+    cookie_file.write_text(
+        json.dumps(
+            {"cookie_name": "SID", "cookie_content": "old", "host": "192.168.0.1"}
+        )
+    )
+    with patch.object(ngp_cli, "detect_model_name", return_value="GS308EP"):
+        ngp_cli.migrate_cookie_file(cookie_file, tmp_path / "sessions")
+    connector = NetgearSwitchConnector(
+        "192.168.0.1",
+        "password",
+        session_store=FileSessionStore(tmp_path / "sessions"),
+    )
+    connector._set_instance_attributes_by_model(GS308EP())
+    assert connector._load_session() is True
+    assert connector.get_cookie() == ("SID", "old")
+
+
+def test_migrate_cookie_file_without_old_file(tmp_path: Path) -> None:
+    """Test that nothing is detected or saved without the old cookie file."""
+    with patch.object(ngp_cli, "detect_model_name") as mock_detect:
+        assert (
+            ngp_cli.migrate_cookie_file(tmp_path / "cookie", tmp_path / "sessions")
+            is False
+        )
+    mock_detect.assert_not_called()
+    assert not (tmp_path / "sessions").exists()
+
+
+def test_login_command_does_not_reuse_saved_session(tmp_path: Path) -> None:
+    """Test that ngp-cli login logs in and replaces the saved session."""
+    store = FileSessionStore(tmp_path / "sessions")
+    store.save("192.168.0.1", SESSION)
+
+    def get_login_cookie(connector: NetgearSwitchConnector) -> bool:
+        assert connector.session_store is None
+        connector._set_instance_attributes_by_model(GS308EP())
+        connector.set_cookie("SID", "fresh")
+        return True
+
+    with (
+        patch.object(ngp_cli, "migrate_cookie_file"),
+        patch.object(ngp_cli, "get_session_store", return_value=store),
+        patch.object(
+            NetgearSwitchConnector,
+            "get_login_cookie",
+            autospec=True,
+            side_effect=get_login_cookie,
+        ) as mock_login,
+        patch("sys.argv", ["ngp-cli", "-P", "password", "login", "192.168.0.1"]),
+    ):
+        ngp_cli.main()
+    mock_login.assert_called_once()
+    session = store.load("192.168.0.1")
+    assert session is not None
+    assert session["cookie_content"] == "fresh"
@@ -0,0 +1,80 @@
+"""Unit tests for the py_netgear_plus pacer module."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+from py_netgear_plus import NetgearSwitchConnector
+from py_netgear_plus.fetcher import PageFetcher
+from py_netgear_plus.pacer import AdaptivePacer
+
+
+def test_fast_responses_shrink_interval_to_floor() -> None:
+    """Test that fast responses decrease the pause additively down to the floor."""
+    pacer = AdaptivePacer(interval=0.2, min_interval=0.05, decrease_step=0.1)
+    pacer.record_response(0.01)
+    assert pacer.interval == pytest.approx(0.1)
+    pacer.record_response(0.01)
+    assert pacer.interval == pytest.approx(0.05)
+    assert pacer.rate == pytest.approx(20)
+
+
+def test_errors_and_slow_responses_grow_interval_to_ceiling() -> None:
+    """Test that errors and slow responses multiply the pause up to the ceiling."""
+    pacer = AdaptivePacer(interval=1, max_interval=3, slow_response_time=2)
+    pacer.record_error()
+    assert pacer.interval == 2
+    pacer.record_response(5)
+    assert pacer.interval == 3
+
+
+def test_zero_interval_backs_off() -> None:
+    """Test that a pacer running at full speed still backs off after an error."""
+    pacer = AdaptivePacer(interval=0, decrease_step=0.05, backoff_factor=2)
+    assert pacer.rate == float("inf")
+    pacer.record_error()
+    assert pacer.interval == pytest.approx(0.1)
+
+
+def test_get_delay() -> None:
+    """Test that the delay counts from the end of the previous request."""
+    pacer = AdaptivePacer(interval=1, decrease_step=0)
+    assert pacer.get_delay() == 0
+    with patch("py_netgear_plus.pacer.time.monotonic") as mock_monotonic:
+        mock_monotonic.return_value = 100.0
+        pacer.record_response(0.1)
+        mock_monotonic.return_value = 100.4
+        assert pacer.get_delay() == pytest.approx(0.6)
+        mock_monotonic.return_value = 102.0
+        assert pacer.get_delay() == 0
+
+
+def test_fetcher_records_timeouts() -> None:
+    """Test that the page fetcher backs off after a request timed out."""
+    fetcher = PageFetcher("192.168.0.1")
+    fetcher.pacer = Mock(wraps=AdaptivePacer(interval=0))
+    with patch("py_netgear_plus.fetcher.requests.Session.request") as mock_request:
+        mock_request.side_effect = requests.exceptions.Timeout
+        fetcher.request("get", "http://192.168.0.1/status.htm")
+    fetcher.pacer.record_error.assert_called_once()
+    fetcher.pacer.record_response.assert_not_called()
+
+
+def test_connector_sleep_time_sets_pacer_floor() -> None:
+    """Test that sleep_time is the pause the pacer never goes below."""
+    connector = NetgearSwitchConnector(host="192.168.0.1", password="password")
+    connector.sleep_time = 1
+    assert connector.pacer.interval == 1
+    assert connector.pacer.min_interval == 1
+    assert connector.pacer is connector._page_fetcher.pacer
+    for _ in range(5):
+        connector.pacer.record_response(0.01)
+    assert connector.sleep_time == 1
+    connector.pacer.record_error()
+    assert connector.sleep_time == 2
+
+    connector.sleep_time = 10
+    assert connector.pacer.interval == 10
+    connector.sleep_time = 0
+    connector.pacer.record_response(0.01)
+    assert connector.sleep_time == 0
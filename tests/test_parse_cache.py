@@ -0,0 +1,116 @@
+"""Unit tests for the py_netgear_plus parse_cache module."""
+
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from py_netgear_plus import NetgearSwitchConnector
+from py_netgear_plus.fetcher import BaseResponse
+from py_netgear_plus.models import GS308EP
+from py_netgear_plus.parse_cache import ParseCache, ParseCacheInfo
+from py_netgear_plus.parsers import create_page_parser
+
+
+def get_response(content: bytes) -> BaseResponse:
+    """Return an ok response with content."""
+    response = BaseResponse()
+    response.status_code = 200
+    response.content = content
+    return response
+
+
+def test_parse_cache_hits_misses_and_eviction() -> None:
+    """Test that identical content is parsed once and old entries are evicted."""
+    cache = ParseCache(maxsize=2)
+    parser = create_page_parser()
+    parse = Mock(side_effect=lambda page, ports: {"ports": ports, "page": page})
+
+    page = get_response(b"a")
+    result = cache.parse("port_status", parser, parse, page, 8)
+    assert result == {"ports": 8, "page": page}
+    assert cache.parse("port_status", parser, parse, get_response(b"a"), 8) is result
+    assert parse.call_count == 1
+    cache.parse("port_status", parser, parse, get_response(b"a"), 5)
+    cache.parse("poe_port_status", parser, parse, get_response(b"a"), 8)
+    assert parse.call_count == 3
+    assert cache.cache_info() == ParseCacheInfo(hits=1, misses=3, maxsize=2, currsize=2)
+
+    cache.parse("port_status", parser, parse, get_response(b"a"), 8)
+    assert parse.call_count == 4
+    cache.clear()
+    assert cache.cache_info() == ParseCacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
+
+
+def test_parse_cache_restores_parser_state() -> None:
+    """Test that a skipped parse restores the attributes the parse had set."""
+    cache = ParseCache()
+    parser = create_page_parser("GS308EP")
+    page = get_response(Path("pages/GS308EP/0/dashboard.cgi").read_bytes())
+    switch_metadata = cache.parse(
+        "switch_metadata", parser, parser.parse_switch_metadata, page
+    )
+    parser._switch_firmware = None
+    parser.port_status = {1: {"status": "on"}}
+
+    assert (
+        cache.parse("switch_metadata", parser, parser.parse_switch_metadata, page)
+        is switch_metadata
+    )
+    assert parser._switch_firmware == switch_metadata["switch_firmware"]
+    assert parser.port_status == {1: {"status": "on"}}
+
+
+def test_connector_skips_parsing_unchanged_pages() -> None:
+    """Test that polls of unchanged pages only hash them."""
+    pages_path = Path("pages/GS308EP/0")
+
+    def fetch_page(method: str, url: str, data: dict) -> BaseResponse:
+        del method, data
+        return get_response((pages_path / url.split("/")[-1]).read_bytes())
+
+    connector = NetgearSwitchConnector(host="192.168.0.1", password="password")
+    connector._set_instance_attributes_by_model(GS308EP())
+    connector._page_parser = create_page_parser("GS308EP")
+    with (
+        patch("py_netgear_plus.connector.time.perf_counter", return_value=0),
+        patch.object(connector, "fetch_page", side_effect=fetch_page),
+        patch.object(
+            connector._page_parser,
+            "parse_port_status",
+            wraps=connector._page_parser.parse_port_status,
+        ) as mock_parse_port_status,
+    ):
+        first_switch_data = connector.get_switch_infos()
+        second_switch_data = connector.get_switch_infos()
+        third_switch_data = connector.get_switch_infos()
+    for key, value in first_switch_data.items():
+        if key.endswith(("_status", "_poe_power_active", "_poe_output_power")):
+            assert second_switch_data[key] == value
+            assert third_switch_data[key] == value
+    # the port status is parsed again once it has a previous status to fall back to
+    assert mock_parse_port_status.call_count == 2
+    assert connector.parse_cache.cache_info().hits == 5
+
+
+def test_parse_cache_keys_by_parser_state() -> None:
+    """Test that a parse depending on changed parser state is not skipped."""
+    cache = ParseCache()
+    parser = create_page_parser("GS308EP")
+    page = get_response(Path("pages/GS308EP/0/dashboard.cgi").read_bytes())
+    parser.parse_switch_metadata(page)
+    parse = Mock(return_value={})
+
+    cache.parse("port_status", parser, parse, page, 8)
+    cache.parse("port_status", parser, parse, page, 8)
+    assert parse.call_count == 1
+    parser.port_status = {1: {"status": "on"}}
+    cache.parse("port_status", parser, parse, page, 8)
+    assert parse.call_count == 2
+
+    cache.parse("port_statistics", parser, parse, page, 8)
+    parser._switch_firmware = "V2.06.24GR"
+    cache.parse("port_statistics", parser, parse, page, 8)
+    assert parse.call_count == 4
+    cache.parse("poe_port_status", parser, parse, page)
+    parser.port_status = {}
+    cache.parse("poe_port_status", parser, parse, page)
+    assert parse.call_count == 5
@@ -0,0 +1,66 @@
+"""Unit tests for the py_netgear_plus rates module."""
+
+from array import array
+
+from py_netgear_plus.rates import (
+    MAX_PORT_SPEED,
+    get_counter_deltas,
+    update_port_rates,
+)
+from py_netgear_plus.snapshot import SwitchSnapshot
+
+
+def port_statistics(rx: list[int], tx: list[int], crc: list[int]) -> dict:
+    """Return port statistics like parse_port_statistics()."""
+    return {
+        "traffic_rx": rx,
+        "traffic_tx": tx,
+        "sum_rx": rx,
+        "sum_tx": tx,
+        "crc_errors": crc,
+        "speed_io": [0] * len(rx),
+    }
+
+
+def test_get_counter_deltas_wraparound_and_reset() -> None:
+    """Test that wrapped counters are unwrapped and resets stay negative."""
+    previous = [0, 100, 2**32 - 100, 5000]
+    current = [700, 400, 50, 20]
+    assert get_counter_deltas(previous, current, 1000, 32) == [0, 300, 150, -4980]
+    # an increase above max_delta across the wraparound is a reset
+    assert get_counter_deltas(previous, current, 100, 32) == [
+        0,
+        300,
+        150 - 2**32,
+        -4980,
+    ]
+    assert get_counter_deltas(previous, current, 1000) == [0, 300, 150 - 2**32, -4980]
+
+
+def test_update_port_rates() -> None:
+    """Test traffic, speeds and sums of the ports between two polls."""
+    snapshot = SwitchSnapshot(4, {})
+    snapshot.connected[:] = array("b", [1, 1, 1, 0])
+    previous = port_statistics([1000, 5000, 10, 0], [2000, 10, 10, 0], [1, 1, 1, 0])
+    current = port_statistics(
+        [3000, 100, -1, 0], [2500, 4_000_000_000, 10, 0], [3, 0, 1, 0]
+    )
+    update_port_rates(snapshot, previous, current, sample_time=2)
+
+    assert list(snapshot.traffic_rx) == [2000, 0, 0, 0]
+    assert list(snapshot.traffic_tx) == [500, 2e9, 0, 0]
+    assert list(snapshot.speed_rx) == [1000, 0, 0, 0]
+    assert list(snapshot.speed_tx) == [250, MAX_PORT_SPEED, 0, 0]
+    # the reset rx counter of port 2 reduces speed_io
+    assert list(snapshot.speed_io) == [1250, 2e9 - 2455, 0, 0]
+    assert list(snapshot.crc_errors) == [2, 0, 0, 0]
+    # the negative rx counter of port 3 falls back to the previous poll
+    assert current["sum_rx"][2] == 10
+    assert list(snapshot.sum_rx) == [3000, 100, 10, 0]
+    assert snapshot.sum_port_traffic_tx == 500 + 2e9
+    assert snapshot.sum_port_speed_tx == 250 + MAX_PORT_SPEED
+    assert snapshot.sum_port_crc_errors == 2
+
+    snapshot = SwitchSnapshot(4, {})
+    update_port_rates(snapshot, previous, port_statistics([2000], [3000], [1]), 1)
+    assert list(snapshot.traffic_rx) == [1000, 0, 0, 0]
@@ -0,0 +1,162 @@
+"""Unit tests for the py_netgear_plus scheduler module."""
+
+import asyncio
+import threading
+from collections.abc import Callable
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from py_netgear_plus.fetcher import PageFetcherCircuitOpenError, PageNotLoadedError
+from py_netgear_plus.scheduler import (
+    SCHEDULE_KINDS,
+    AsyncPollScheduler,
+    PollScheduler,
+)
+from py_netgear_plus.snapshot import POLL_KINDS, SwitchSnapshot, UnknownFieldError
+
+
+def get_switch_snapshot(kinds: tuple[str, ...]) -> SwitchSnapshot:
+    """Return a snapshot of 2 ports like a connector polled for kinds."""
+    snapshot = SwitchSnapshot(2, {"switch_ip": "192.168.0.1"}, kinds)
+    if "port_statistics" in kinds:
+        snapshot.sum_rx[0] = 1000
+    if "port_status" in kinds:
+        snapshot.connected[0] = 1
+    return snapshot
+
+
+def test_poll_scheduler_polls_kinds_at_their_interval() -> None:
+    """Test that every poll fetches the due kinds of pages and merges them."""
+    connector = Mock(get_switch_snapshot=Mock(side_effect=get_switch_snapshot))
+    scheduler = PollScheduler(connector)
+    with patch("py_netgear_plus.scheduler.time.monotonic") as mock_monotonic:
+        mock_monotonic.return_value = 100.0
+        snapshot = scheduler.poll()
+        connector.get_switch_snapshot.assert_called_once_with(POLL_KINDS)
+        assert scheduler.get_delay() == 2
+
+        mock_monotonic.return_value = 101.0
+        assert scheduler.poll() is snapshot
+        connector.get_switch_snapshot.assert_called_once()
+
+        mock_monotonic.return_value = 102.5
+        assert scheduler.get_due_kinds() == ("port_statistics",)
+        snapshot = scheduler.poll()
+        connector.get_switch_snapshot.assert_called_with(("port_statistics",))
+        assert snapshot is scheduler.snapshot
+        assert snapshot.kinds == POLL_KINDS
+        assert snapshot.port(1).connected is True
+        # the next poll is due one interval after the previous was due
+        assert scheduler.get_delay() == pytest.approx(1.5)
+
+        mock_monotonic.return_value = 110.0
+        scheduler.poll()
+        connector.get_switch_snapshot.assert_called_with(
+            ("port_status", "port_statistics")
+        )
+        connector.clear_switch_metadata.assert_not_called()
+
+        mock_monotonic.return_value = 3700.0
+        scheduler.poll()
+        connector.clear_switch_metadata.assert_called_once()
+        connector.get_switch_snapshot.assert_called_with(POLL_KINDS)
+
+
+def test_poll_scheduler_intervals() -> None:
+    """Test that intervals of other kinds of pages are rejected."""
+    connector = Mock(get_switch_snapshot=Mock(side_effect=get_switch_snapshot))
+    scheduler = PollScheduler(connector, {"switch_metadata": 60})
+    assert scheduler.intervals["switch_metadata"] == 60
+    assert scheduler.intervals["port_statistics"] == 2
+    with pytest.raises(UnknownFieldError):
+        PollScheduler(connector, {"port_1_status": 1})
+
+
+def test_async_poll_scheduler_runs_until_stopped() -> None:
+    """Test that the asyncio scheduler polls until its stop event is set."""
+    connector = Mock(get_switch_snapshot=AsyncMock(side_effect=get_switch_snapshot))
+    scheduler = AsyncPollScheduler(connector, dict.fromkeys(POLL_KINDS, 0.01))
+    assert not isinstance(scheduler, PollScheduler)
+
+    async def run() -> None:
+        stop_event = asyncio.Event()
+        task = asyncio.create_task(scheduler.run(stop_event))
+        await asyncio.sleep(0.1)
+        stop_event.set()
+        await asyncio.wait_for(task, 1)
+
+    asyncio.run(run())
+    assert connector.get_switch_snapshot.await_count > 1
+    assert scheduler.snapshot is not None
+    assert scheduler.snapshot.kinds == POLL_KINDS
+    assert scheduler.snapshot.sum_rx[0] == 1000
+
+
+def get_failing_poll(
+    stop_event: threading.Event | asyncio.Event,
+) -> Callable[[tuple[str, ...]], SwitchSnapshot]:
+    """Return a poll of a connector failing twice, setting stop_event after."""
+    errors = [
+        PageNotLoadedError("no response"),
+        PageFetcherCircuitOpenError("circuit open"),
+    ]
+
+    def poll_switch(kinds: tuple[str, ...]) -> SwitchSnapshot:
+        if errors:
+            raise errors.pop(0)
+        stop_event.set()
+        return get_switch_snapshot(kinds)
+
+    return poll_switch
+
+
+def test_poll_scheduler_keeps_running_after_failed_polls() -> None:
+    """Test that run() logs errors of the connector, where poll() raises them."""
+    stop_event = threading.Event()
+    connector = Mock(get_switch_snapshot=Mock(side_effect=get_failing_poll(stop_event)))
+    scheduler = PollScheduler(connector, dict.fromkeys(SCHEDULE_KINDS, 0.01))
+    with patch("py_netgear_plus.scheduler._LOGGER") as mock_logger:
+        scheduler.run(stop_event)
+    assert mock_logger.warning.call_count == 2
+    assert connector.get_switch_snapshot.call_count == 3
+    assert scheduler.snapshot is not None
+
+    connector.get_switch_snapshot.side_effect = PageNotLoadedError("no response")
+    with (
+        patch("py_netgear_plus.scheduler.time.monotonic", return_value=1e6),
+        pytest.raises(PageNotLoadedError),
+    ):
+        scheduler.poll()
+
+
+def test_poll_scheduler_waits_after_failed_first_poll() -> None:
+    """Test that a failed first poll is retried when due, not at once."""
+    connector = Mock(get_switch_snapshot=Mock(side_effect=TimeoutError))
+    scheduler = PollScheduler(connector)
+    with (
+        patch("py_netgear_plus.scheduler.time.monotonic", return_value=100.0),
+        pytest.raises(TimeoutError),
+    ):
+        scheduler.poll()
+    assert scheduler.snapshot is None
+    with patch("py_netgear_plus.scheduler.time.monotonic", return_value=100.0):
+        assert scheduler.get_due_kinds() == ()
+        assert scheduler.get_delay() == 2
+
+
+def test_async_poll_scheduler_keeps_running_after_failed_polls() -> None:
+    """Test that the asyncio scheduler logs errors of the connector."""
+
+    async def run() -> None:
+        stop_event = asyncio.Event()
+        connector = Mock(
+            get_switch_snapshot=AsyncMock(side_effect=get_failing_poll(stop_event))
+        )
+        scheduler = AsyncPollScheduler(connector, dict.fromkeys(SCHEDULE_KINDS, 0.01))
+        with patch("py_netgear_plus.scheduler._LOGGER") as mock_logger:
+            await asyncio.wait_for(scheduler.run(stop_event), 1)
+        assert mock_logger.warning.call_count == 2
+        assert connector.get_switch_snapshot.await_count == 3
+        assert scheduler.snapshot is not None
+
+    asyncio.run(run())
@@ -0,0 +1,139 @@
+"""Unit tests for the py_netgear_plus snapshot module."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from py_netgear_plus import NetgearSwitchConnector
+from py_netgear_plus.fetcher import BaseResponse
+from py_netgear_plus.models import GS308EP
+from py_netgear_plus.parsers import create_page_parser
+from py_netgear_plus.rates import update_port_rates
+from py_netgear_plus.snapshot import (
+    POLL_KINDS,
+    SwitchSnapshot,
+    UnknownFieldError,
+    get_poll_kinds,
+    get_port_keys,
+)
+
+
+def test_switch_snapshot_columns_and_dict() -> None:
+    """Test that the snapshot has the values of get_switch_infos() as columns."""
+    pages_path = Path("pages/GS308EP/0")
+
+    def fetch_page(method: str, url: str, data: dict) -> BaseResponse:
+        del method, data
+        response = BaseResponse()
+        response.status_code = 200
+        response.content = (pages_path / url.split("/")[-1]).read_bytes()
+        return response
+
+    with patch("py_netgear_plus.connector.time.perf_counter", return_value=0):
+        connector = NetgearSwitchConnector(host="192.168.0.1", password="password")
+        connector._set_instance_attributes_by_model(GS308EP())
+        connector._page_parser = create_page_parser("GS308EP")
+        with patch.object(connector, "fetch_page", side_effect=fetch_page):
+            snapshot = connector.get_switch_snapshot()
+    validation_data = json.loads((pages_path / "switch_infos.json").read_text())
+
+    assert snapshot.to_dict() == validation_data
+    assert not hasattr(snapshot, "__dict__")
+    assert len(snapshot.sum_rx) == GS308EP.PORTS
+    port = snapshot.port(1)
+    assert port.connected is (validation_data["port_1_status"] == "on")
+    assert port.connection_speed == validation_data["port_1_connection_speed"]
+    assert round(port.sum_rx * 1e-6, 2) == validation_data["port_1_sum_rx_mbytes"]
+    with pytest.raises(IndexError):
+        snapshot.port(GS308EP.PORTS + 1)
+
+
+def test_port_statistics_poll_uses_last_port_status() -> None:
+    """Test that a poll without the port status rates the last connected ports."""
+    pages_path = Path("pages/GS308EP/0")
+    validation_data = json.loads((pages_path / "switch_infos.json").read_text())
+    connected = [
+        validation_data[f"port_{port_nr}_status"] == "on"
+        for port_nr in range(1, GS308EP.PORTS + 1)
+    ]
+    assert any(connected)
+
+    def fetch_page(method: str, url: str, data: dict) -> BaseResponse:
+        del method, data
+        response = BaseResponse()
+        response.status_code = 200
+        response.content = (pages_path / url.split("/")[-1]).read_bytes()
+        return response
+
+    rated_connected = []
+
+    def get_rates(snapshot: SwitchSnapshot, *args: object) -> None:
+        rated_connected.append([bool(value) for value in snapshot.connected])
+        update_port_rates(snapshot, *args)  # type: ignore[arg-type]
+
+    connector = NetgearSwitchConnector(host="192.168.0.1", password="password")
+    connector._set_instance_attributes_by_model(GS308EP())
+    connector._page_parser = create_page_parser("GS308EP")
+    with (
+        patch("py_netgear_plus.connector.time.perf_counter", return_value=0),
+        patch("py_netgear_plus.connector.update_port_rates", side_effect=get_rates),
+        patch.object(connector, "fetch_page", side_effect=fetch_page),
+    ):
+        connector.get_switch_snapshot(["port_status"])
+        connector.get_switch_snapshot(["port_statistics"])
+    assert rated_connected == [connected]
+
+
+def test_switch_snapshot_defaults() -> None:
+    """Test that a new snapshot has all ports off and keys formatted once."""
+    snapshot = SwitchSnapshot(2, {"switch_ip": "192.168.0.1"})
+    switch_data = snapshot.to_dict()
+    assert switch_data["switch_ip"] == "192.168.0.1"
+    assert switch_data["port_2_status"] == "off"
+    assert switch_data["port_2_sum_tx_mbytes"] == 0.0
+    assert switch_data["port_2_crc_errors"] == 0
+    assert "port_1_crc_errors" not in switch_data
+    assert get_port_keys(2) is get_port_keys(2)
+
+
+def test_get_poll_kinds() -> None:
+    """Test that fields are mapped to the kinds of pages with their values."""
+    assert get_poll_kinds() == POLL_KINDS
+    assert get_poll_kinds([]) == ()
+    assert get_poll_kinds(["switch_name", "led_status"]) == ()
+    assert get_poll_kinds(["sum_port_speed_io", "port_3_crc_errors"]) == (
+        "port_statistics",
+    )
+    assert get_poll_kinds(
+        ["port_1_poe_power_active", "port_2_connection_speed", "response_time_s"]
+    ) == ("port_status", "port_statistics", "poe_port_config")
+    assert get_poll_kinds(["poe_port_status", "port_1_status"]) == (
+        "port_status",
+        "poe_port_status",
+    )
+    with pytest.raises(UnknownFieldError):
+        get_poll_kinds(["traffic"])
+
+
+def test_switch_snapshot_merge() -> None:
+    """Test that a snapshot keeps the values of the pages it was not polled for."""
+    previous = SwitchSnapshot(2, {}, ("port_status", "port_statistics"))
+    previous.connected[0] = 1
+    previous.sum_rx[0] = 1000
+    previous.sum_port_crc_errors = 3
+    previous.poe = {"port_1_poe_power_active": "on"}
+    snapshot = SwitchSnapshot(2, {}, ("port_statistics", "poe_port_status"))
+    snapshot.poe = {"port_1_poe_output_power": 1.5}
+
+    assert snapshot.merge(previous) is snapshot
+    assert snapshot.kinds == ("port_status", "port_statistics", "poe_port_status")
+    assert snapshot.port(1).connected is True
+    assert snapshot.connected is not previous.connected
+    assert snapshot.sum_rx[0] == 0
+    assert snapshot.sum_port_crc_errors == 0
+    assert snapshot.poe == {
+        "port_1_poe_power_active": "on",
+        "port_1_poe_output_power": 1.5,
+    }
+    assert SwitchSnapshot(3, {}, ()).merge(previous).kinds == ()
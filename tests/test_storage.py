@@ -0,0 +1,301 @@
+"""Unit tests for the py_netgear_plus storage module."""
+
+import asyncio
+import json
+import stat
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from py_netgear_plus import AsyncNetgearSwitchConnector, NetgearSwitchConnector
+from py_netgear_plus.async_fetcher import AsyncPageFetcher
+from py_netgear_plus.fetcher import BaseResponse, NotLoggedInError, PageFetcher
+from py_netgear_plus.models import GS308EP
+from py_netgear_plus.storage import FileModelCache, FileSessionStore
+
+SESSION = {"model": "GS308EP", "cookie_name": "SID", "cookie_content": "secret"}
+
+
+def get_response(content: bytes, cookies: dict[str, str] | None = None) -> BaseResponse:
+    """Return a response of the switch with content and cookies."""
+    response = BaseResponse()
+    response.status_code = 200
+    response.content = content
+    for name, value in (cookies or {}).items():
+        response.cookies.set(name, value)
+    return response
+
+
+def check_login_url(fetcher: PageFetcher, switch_model: GS308EP) -> bool:
+    """Load the saved login page of a GS308EP instead of requesting it."""
+    del switch_model
+    fetcher._login_page_response = get_response(
+        Path("pages/GS308EP/0/login.cgi").read_bytes()
+    )
+    return True
+
+
+def get_connector_with_stale_session(
+    connector_class: type[NetgearSwitchConnector | AsyncNetgearSwitchConnector],
+    tmp_path: Path,
+) -> tuple[NetgearSwitchConnector | AsyncNetgearSwitchConnector, FileSessionStore]:
+    """Return a connector using a saved session the switch does not accept."""
+    store = FileSessionStore(tmp_path / "sessions")
+    store.save("192.168.0.1", SESSION)
+    connector = connector_class(
+        host="192.168.0.1", password="password", session_store=store
+    )
+    connector._set_instance_attributes_by_model(GS308EP())
+    connector._client_hash = "client_hash"
+    connector.set_cookie("SID", "secret")
+    return connector, store
+
+
+def test_file_session_store_round_trip(tmp_path: Path) -> None:
+    """Test saving, loading and deleting sessions of several hosts."""
+    path = tmp_path / "sessions"
+    store = FileSessionStore(path)
+    store.save("192.168.0.1", SESSION)
+    store.save("192.168.0.2", SESSION | {"cookie_content": "other"})
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+    loaded_session = FileSessionStore(path).load("192.168.0.1")
+    assert loaded_session is not None
+    assert loaded_session["cookie_content"] == "secret"
+    assert loaded_session["expires_at"] > loaded_session["saved_at"]
+    assert set(store.load_all()) == {"192.168.0.1", "192.168.0.2"}
+
+    store.delete("192.168.0.1")
+    assert store.load("192.168.0.1") is None
+    assert store.load("192.168.0.2") is not None
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["sessions", "sessions.lock"]
+
+
+def test_file_session_store_validates_sessions(tmp_path: Path) -> None:
+    """Test that expired, incomplete and unreadable sessions are ignored."""
+    path = tmp_path / "sessions"
+    store = FileSessionStore(path, max_age=10)
+    with patch("py_netgear_plus.storage.time.time", return_value=1000.0):
+        store.save("192.168.0.1", SESSION)
+    with patch("py_netgear_plus.storage.time.time", return_value=1011.0):
+        assert store.load("192.168.0.1") is None
+
+    path.write_text(json.dumps({"192.168.0.1": {"model": "GS308EP"}}))
+    assert store.load("192.168.0.1") is None
+    path.write_text("not json")
+    assert store.load("192.168.0.1") is None
+    store.save("192.168.0.1", SESSION)
+    assert store.load("192.168.0.1") is not None
+
+
+def test_connector_reuses_saved_session(tmp_path: Path) -> None:
+    """Test that a saved session skips the login and is dropped when expired."""
+    store = FileSessionStore(tmp_path / "sessions")
+    store.save("192.168.0.1", SESSION)
+    connector = NetgearSwitchConnector(
+        host="192.168.0.1", password="password", session_store=store
+    )
+    connector._set_instance_attributes_by_model(GS308EP())
+    dashboard = get_response(Path("pages/GS308EP/0/dashboard.cgi").read_bytes())
+    with (
+        patch.object(PageFetcher, "get_login_response") as mock_login,
+        patch.object(PageFetcher, "request", return_value=dashboard) as mock_request,
+    ):
+        assert connector.get_login_cookie() is True
+        mock_login.assert_not_called()
+        # the saved cookie is checked with a request of the switch info page
+        mock_request.assert_called_once_with(
+            "get", "http://192.168.0.1/dashboard.cgi", {}
+        )
+    assert connector.get_cookie() == ("SID", "secret")
+
+    with patch.object(connector, "get_login_cookie", return_value=True):
+        assert connector._login_again(("SID", "secret")) is True
+    assert store.load("192.168.0.1") is None
+
+
+def test_connector_logs_in_if_saved_session_is_rejected(tmp_path: Path) -> None:
+    """Test that a saved session the switch does not accept is replaced."""
+    store = FileSessionStore(tmp_path / "sessions")
+    store.save("192.168.0.1", SESSION)
+    connector = NetgearSwitchConnector(
+        host="192.168.0.1", password="password", session_store=store
+    )
+    connector._set_instance_attributes_by_model(GS308EP())
+    with (
+        patch.object(PageFetcher, "check_login_url", check_login_url),
+        patch.object(
+            PageFetcher,
+            "get_login_response",
+            return_value=get_response(b"<html></html>", {"SID": "fresh"}),
+        ) as mock_login,
+        patch.object(PageFetcher, "request", side_effect=NotLoggedInError),
+    ):
+        assert connector.get_login_cookie() is True
+    mock_login.assert_called_once()
+    assert connector.get_cookie() == ("SID", "fresh")
+    session = store.load("192.168.0.1")
+    assert session is not None
+    assert session["cookie_content"] == "fresh"
+
+
+def test_async_connector_checks_saved_session(tmp_path: Path) -> None:
+    """Test that the asyncio connector reuses a saved session the switch accepts."""
+    store = FileSessionStore(tmp_path / "sessions")
+    store.save("192.168.0.1", SESSION)
+    connector = AsyncNetgearSwitchConnector(
+        host="192.168.0.1", password="password", session_store=store
+    )
+    connector._set_instance_attributes_by_model(GS308EP())
+    dashboard = get_response(Path("pages/GS308EP/0/dashboard.cgi").read_bytes())
+    with (
+        patch.object(AsyncPageFetcher, "get_login_response") as mock_login,
+        patch.object(
+            AsyncPageFetcher, "request", new_callable=AsyncMock, return_value=dashboard
+        ) as mock_request,
+    ):
+        assert asyncio.run(connector.get_login_cookie()) is True
+    mock_login.assert_not_called()
+    mock_request.assert_awaited_once()
+    assert connector.get_cookie() == ("SID", "secret")
+
+
+def test_connector_ignores_session_of_other_model(tmp_path: Path) -> None:
+    """Test that a session saved for another model is not reused."""
+    store = FileSessionStore(tmp_path / "sessions")
+    store.save("192.168.0.1", SESSION | {"model": "GS105E"})
+    connector = NetgearSwitchConnector(
+        host="192.168.0.1", password="password", session_store=store
+    )
+    connector._set_instance_attributes_by_model(GS308EP())
+    with patch.object(PageFetcher, "request") as mock_request:
+        assert connector._restore_session() is False
+    mock_request.assert_not_called()
+
+
+def test_file_model_cache_round_trip(tmp_path: Path) -> None:
+    """Test saving, loading and deleting the models of several hosts."""
+    path = tmp_path / "models"
+    cache = FileModelCache(path)
+    cache.save("192.168.0.1", "GS308EP")
+    cache.save("192.168.0.2", "GS105E")
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert FileModelCache(path).load("192.168.0.1") == "GS308EP"
+
+    cache.delete("192.168.0.1")
+    assert cache.load("192.168.0.1") is None
+    assert cache.load("192.168.0.2") == "GS105E"
+    path.write_text(json.dumps({"192.168.0.2": {"saved_at": 0}}))
+    assert cache.load("192.168.0.2") is None
+
+
+def test_connector_uses_cached_model(tmp_path: Path) -> None:
+    """Test that a cached model skips the autodetect requests."""
+    cache = FileModelCache(tmp_path / "models")
+    cache.save("192.168.0.1", "GS308EP")
+    connector = NetgearSwitchConnector(host="192.168.0.1", password="password")
+    connector.model_cache = cache
+    with patch.object(PageFetcher, "request") as mock_request:
+        assert connector.autodetect_model().MODEL_NAME == "GS308EP"
+        mock_request.assert_not_called()
+    assert connector.ports == GS308EP.PORTS
+
+
+def test_connector_detects_model_if_login_page_differs(tmp_path: Path) -> None:
+    """Test that a cached model not matching the login page is detected again."""
+    login_page = BaseResponse()
+    login_page.status_code = 200
+    login_page.content = Path("pages/GS308EP/0/login.cgi").read_bytes()
+
+    def check_login_url(fetcher: PageFetcher, switch_model: GS308EP) -> bool:
+        del switch_model
+        fetcher._login_page_response = login_page
+        return True
+
+    cache = FileModelCache(tmp_path / "models")
+    cache.save("192.168.0.1", "GS105E")
+    connector = NetgearSwitchConnector(host="192.168.0.1", password="password")
+    connector.model_cache = cache
+    with (
+        patch.object(PageFetcher, "check_login_url", check_login_url),
+        patch.object(PageFetcher, "request", return_value=login_page) as mock_request,
+        patch.object(PageFetcher, "get_login_response"),
+        patch.object(connector, "_process_login_response", return_value=True),
+    ):
+        assert connector.get_login_cookie() is True
+        mock_request.assert_called_once()
+    assert connector.switch_model.MODEL_NAME == "GS308EP"
+    assert cache.load("192.168.0.1") == "GS308EP"
+
+
+@pytest.mark.parametrize(
+    "configure",
+    [
+        lambda connector: connector.switch_leds("off"),
+        lambda connector: connector.switch_poe_port(1, "off"),
+        lambda connector: connector.power_cycle_poe_port(1),
+    ],
+    ids=["switch_leds", "switch_poe_port", "power_cycle_poe_port"],
+)
+def test_configuration_logs_in_after_stale_session(
+    tmp_path: Path, configure: Callable[[NetgearSwitchConnector], bool]
+) -> None:
+    """Test that a configuration request rejected with a saved cookie logs in."""
+    connector, store = get_connector_with_stale_session(
+        NetgearSwitchConnector, tmp_path
+    )
+    with (
+        patch.object(PageFetcher, "check_login_url", check_login_url),
+        patch.object(
+            PageFetcher,
+            "get_login_response",
+            return_value=get_response(b"<html></html>", {"SID": "fresh"}),
+        ) as mock_login,
+        patch.object(
+            PageFetcher,
+            "request",
+            side_effect=[NotLoggedInError, get_response(b"SUCCESS")],
+        ) as mock_request,
+    ):
+        assert configure(connector) is True
+    mock_login.assert_called_once()
+    assert mock_request.call_count == 2
+    assert connector.get_cookie() == ("SID", "fresh")
+    session = store.load("192.168.0.1")
+    assert session is not None
+    assert session["cookie_content"] == "fresh"
+
+
+def test_async_configuration_logs_in_after_stale_session(tmp_path: Path) -> None:
+    """Test that the asyncio connector logs in when its saved cookie is rejected."""
+    connector, store = get_connector_with_stale_session(
+        AsyncNetgearSwitchConnector, tmp_path
+    )
+
+    async def async_check_login_url(
+        fetcher: AsyncPageFetcher, switch_model: GS308EP
+    ) -> bool:
+        return check_login_url(fetcher, switch_model)
+
+    with (
+        patch.object(AsyncPageFetcher, "check_login_url", async_check_login_url),
+        patch.object(
+            AsyncPageFetcher,
+            "get_login_response",
+            new_callable=AsyncMock,
+            return_value=get_response(b"<html></html>", {"SID": "fresh"}),
+        ) as mock_login,
+        patch.object(
+            AsyncPageFetcher,
+            "request",
+            new_callable=AsyncMock,
+            side_effect=[NotLoggedInError, get_response(b"SUCCESS")],
+        ) as mock_request,
+    ):
+        assert asyncio.run(connector.turn_off_poe_port(1)) is True
+    mock_login.assert_awaited_once()
+    assert mock_request.await_count == 2
+    session = store.load("192.168.0.1")
+    assert session is not None
+    assert session["cookie_content"] == "fresh"